@@ -0,0 +1,39 @@
+import argparse
+import sys
+
+from benchmarks.run import SIZES, SUITE, compareToBaseline, runBenchmarks, saveBaseline
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the sequencing solvers.")
+    parser.add_argument("--solvers", nargs="+", choices=list(SUITE), help="solvers to run (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES, help="numbers of jobs")
+    parser.add_argument("--max-size", type=int, help="skip sizes above this")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size, the fastest is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory measurement")
+    parser.add_argument("--save", metavar="PATH", help="store the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a stored baseline")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio that counts as a regression")
+    options = parser.parse_args(argv)
+
+    records = runBenchmarks(options.solvers, options.sizes, options.repeat, options.seed, not options.no_memory,
+                            options.max_size)
+    for record in records:
+        memory = "" if record["peakBytes"] is None else f"  {record['peakBytes'] / 2 ** 20:10.1f} MiB"
+        print(f"{record['solver']:<24} n={record['n']:<10} {record['seconds'] * 1000:12.3f} ms{memory}")
+    if options.save:
+        saveBaseline(records, options.save)
+    if options.compare:
+        regressions = 0
+        for entry in compareToBaseline(records, options.compare, options.threshold):
+            memory = "" if entry["memoryRatio"] is None else f"  memory x{entry['memoryRatio']:.2f}"
+            flag = "  REGRESSION" if entry["regression"] else ""
+            print(f"{entry['solver']:<24} n={entry['n']:<10} time x{entry['timeRatio']:.2f}{memory}{flag}")
+            regressions += entry["regression"]
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
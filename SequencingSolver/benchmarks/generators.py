@@ -0,0 +1,81 @@
+import numpy as np
+
+from SequencingSolver.jobset import JobSet
+
+
+def eddInstance(n, seed=0):
+    """
+    Random jobs with processing times in [1, 100] and due dates spread over the total processing time.
+
+    Args:
+        n (int): Number of jobs.
+        seed (int): Seed of the random generator; the same seed always gives the same instance.
+
+    Returns:
+        JobSet: The jobs, with processing times and due dates.
+    """
+    rng = np.random.default_rng(seed)
+    processingTime = rng.integers(1, 101, n)
+    dueDate = rng.integers(1, max(2, int(processingTime.sum())), n)
+    return JobSet(processingTime, dueDate=dueDate)
+
+
+def wsptInstance(n, seed=0):
+    """
+    Random jobs with processing times in [1, 100] and weights in [1, 10].
+    """
+    rng = np.random.default_rng(seed)
+    return JobSet(rng.integers(1, 101, n), weight=rng.integers(1, 11, n))
+
+
+def wdsptInstance(n, seed=0):
+    """
+    The same jobs as `wsptInstance`; the discount factor is a solver parameter.
+    """
+    return wsptInstance(n, seed)
+
+
+def hodgsonInstance(n, seed=0):
+    """
+    Random jobs whose due dates are tight enough that roughly a third of them end up late.
+    """
+    rng = np.random.default_rng(seed)
+    processingTime = rng.integers(1, 101, n)
+    dueDate = rng.integers(1, max(2, int(processingTime.sum() * 0.8)), n)
+    return JobSet(processingTime, dueDate=dueDate)
+
+
+def lclInstance(n, seed=0, edgesPerJob=2):
+    """
+    Random jobs with weights and due dates, plus a random precedence DAG.
+
+    Args:
+        n (int): Number of jobs.
+        seed (int): Seed of the random generator.
+        edgesPerJob (float): Average number of precedence constraints per job.
+
+    Returns:
+        tuple: (jobs, edges), a JobSet and an (E, 2) array of (predecessor, successor) index pairs. Edges always go
+               from a lower to a higher position of a hidden random order, so the graph has no cycles.
+    """
+    rng = np.random.default_rng(seed)
+    jobs = JobSet(rng.integers(1, 101, n), dueDate=rng.integers(1, max(2, 50 * n), n), weight=rng.integers(1, 11, n))
+    if n < 2:
+        return jobs, np.empty((0, 2), dtype=np.intp)
+    ends = np.sort(rng.integers(0, n, (int(n * edgesPerJob), 2)), axis=1)
+    ends = np.unique(ends[ends[:, 0] != ends[:, 1]], axis=0)
+    hiddenOrder = rng.permutation(n)
+    return jobs, hiddenOrder[ends]
+
+
+def deadlineInstance(n, seed=0):
+    """
+    Random jobs with deadlines that are feasible by construction: every job meets its deadline in a hidden order.
+    """
+    rng = np.random.default_rng(seed)
+    processingTime = rng.integers(1, 101, n)
+    hiddenOrder = rng.permutation(n)
+    deadline = np.empty(n, dtype=np.int64)
+    deadline[hiddenOrder] = np.cumsum(processingTime[hiddenOrder])
+    deadline += rng.integers(0, 1000, n)
+    return JobSet(processingTime, deadline=deadline)
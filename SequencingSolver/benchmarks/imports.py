@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+
+# The working tree, which the probes import instead of whatever version is installed; computed here rather than
+# taken from the package so that `python benchmarks/imports.py` works too
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+MODULES = [
+    "SequencingSolver.EDD",
+    "SequencingSolver.WSPT",
+    "SequencingSolver.WDSPT",
+    "SequencingSolver.LCL",
+    "SequencingSolver.hodgson",
+    "SequencingSolver.minimizeSumCjWithDeadline",
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import numpy
+numpyTime = time.perf_counter() - start
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in ("matplotlib", "matplotlib.pyplot") if m in sys.modules)
+print(numpyTime, elapsed, ",".join(heavy))
+"""
+
+
+def measureImportTime(modules=MODULES, repeat=5):
+    """
+    Measure the cold import time of the solver modules, each run in a fresh interpreter.
+
+    NumPy is a hard dependency of every solver, so it is imported first and timed separately; the
+    reported package time is what the solver modules add on top of it.
+
+    Args:
+        modules (list): Dotted module names to import together in every run.
+        repeat (int): Number of fresh interpreters to start.
+
+    Returns:
+        tuple: (best NumPy import time, best package import time, heavy modules pulled in by the import),
+               times in seconds.
+
+    Example usage:
+    numpyTime, packageTime, heavy = measureImportTime()
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    numpyTimings = []
+    timings = []
+    heavy = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE] + list(modules), env=env,
+                                check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+        numpyTimings.append(float(output[0]))
+        timings.append(float(output[1]))
+        if len(output) > 2:
+            heavy = output[2].split(",")
+    return min(numpyTimings), min(timings), heavy
+
+
+if __name__ == "__main__":
+    numpyTime, packageTime, heavy = measureImportTime()
+    print(f"numpy: {numpyTime * 1000:.1f} ms, {len(MODULES)} solver modules: {packageTime * 1000:.1f} ms (best of 5)")
+    if heavy:
+        print("Imported at module level:", ", ".join(heavy))
+        sys.exit(1)
@@ -0,0 +1,110 @@
+import json
+import time
+import tracemalloc
+
+from SequencingSolver.EDD import EDDsolver
+from SequencingSolver.LCL import lclSolver
+from SequencingSolver.WDSPT import wdsptSolver
+from SequencingSolver.WSPT import wsptSolver
+from SequencingSolver.costs import Lateness, WeightedTardiness
+from SequencingSolver.hodgson import hodgsonSolver
+from SequencingSolver.minimizeSumCjWithDeadline import minimizeSumCjstDeadline
+
+from benchmarks import generators
+
+SIZES = [10, 100, 1000, 10000, 100000, 1000000, 10000000]
+
+# name: (build the solver arguments from (n, seed), solver, largest size worth running)
+SUITE = {
+    "EDD": (lambda n, seed: ((generators.eddInstance(n, seed),), {}), EDDsolver, 10 ** 7),
+    "WSPT": (lambda n, seed: ((generators.wsptInstance(n, seed),), {}), wsptSolver, 10 ** 7),
+    "WDSPT": (lambda n, seed: ((generators.wdsptInstance(n, seed),), {"r": 0.01}), wdsptSolver, 10 ** 7),
+    "Hodgson": (lambda n, seed: ((generators.hodgsonInstance(n, seed),), {}), hodgsonSolver, 10 ** 7),
+    "minimizeSumCjstDeadline": (lambda n, seed: ((generators.deadlineInstance(n, seed),), {}),
+                                minimizeSumCjstDeadline, 10 ** 7),
+    # Unweighted lateness takes the heap path; weighted tardiness evaluates every candidate on every step
+    "LCL-Lmax": (lambda n, seed: _lclArguments(n, seed, Lateness(weighted=False)), lclSolver, 10 ** 6),
+    "LCL-wTmax": (lambda n, seed: _lclArguments(n, seed, WeightedTardiness()), lclSolver, 10 ** 4),
+}
+
+
+def _lclArguments(n, seed, cost):
+    jobs, edges = generators.lclInstance(n, seed)
+    return (jobs,), {"successors": edges, "cost": cost}
+
+
+def runBenchmarks(solvers=None, sizes=SIZES, repeat=3, seed=0, memory=True, maxSize=None):
+    """
+    Time every solver of the suite on generated instances of every size.
+
+    Args:
+        solvers (list, optional): Names from SUITE to run. All of them when omitted.
+        sizes (list): Numbers of jobs. Sizes above a solver's own limit (or above maxSize) are skipped.
+        repeat (int): Number of timed runs per size; the fastest one is reported.
+        seed (int): Seed of the instance generators.
+        memory (bool): Also measure the peak memory of one extra run with tracemalloc.
+        maxSize (int, optional): Skip all sizes above this.
+
+    Returns:
+        list: One record per solver and size: {"solver", "n", "seconds", "peakBytes"} (peakBytes is None when memory
+              is False). Instance generation is not timed.
+    """
+    records = []
+    for name in solvers or SUITE:
+        makeArguments, solver, limit = SUITE[name]
+        for n in sizes:
+            if n > limit or (maxSize is not None and n > maxSize):
+                continue
+            args, kwargs = makeArguments(n, seed)
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                solver(*args, **kwargs)
+                best = min(best, time.perf_counter() - start)
+            peakBytes = None
+            if memory:
+                tracemalloc.start()
+                solver(*args, **kwargs)
+                peakBytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            records.append({"solver": name, "n": n, "seconds": best, "peakBytes": peakBytes})
+    return records
+
+
+def saveBaseline(records, path):
+    """
+    Write benchmark records to a JSON file, to compare later runs against.
+    """
+    with open(path, "w") as file:
+        json.dump(records, file, indent=1)
+
+
+def compareToBaseline(records, path, threshold=1.25):
+    """
+    Compare benchmark records with a stored baseline.
+
+    Args:
+        records (list): The records of the current run.
+        path (str): A JSON file written by `saveBaseline`.
+        threshold (float): A run is a regression when it takes more than threshold times the baseline time, or uses
+                           more than threshold times the baseline peak memory.
+
+    Returns:
+        list: One entry per solver and size present in both runs: {"solver", "n", "timeRatio", "memoryRatio",
+              "regression"}. Ratios are current / baseline; memoryRatio is None when either run has no memory data.
+    """
+    with open(path) as file:
+        baseline = {(record["solver"], record["n"]): record for record in json.load(file)}
+    comparison = []
+    for record in records:
+        previous = baseline.get((record["solver"], record["n"]))
+        if previous is None:
+            continue
+        timeRatio = record["seconds"] / max(previous["seconds"], 1e-9)
+        memoryRatio = None
+        if record["peakBytes"] is not None and previous.get("peakBytes"):
+            memoryRatio = record["peakBytes"] / previous["peakBytes"]
+        comparison.append({"solver": record["solver"], "n": record["n"], "timeRatio": timeRatio,
+                           "memoryRatio": memoryRatio,
+                           "regression": timeRatio > threshold or (memoryRatio or 0) > threshold})
+    return comparison
@@ -1,10 +1,16 @@
+from heapq import heapify, heappop, heappush
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .costs import CostFunction
+from .instrumentation import count, phase
+from .jobset import asJobSet
+from .schedule import Schedule
 
 
-def lclSolver(jobsData):
+def lclSolver(jobsData, successors=None, cost=None):
     """
-    Solve a scheduling problem using the Lowest Cost Last (LCL) algorithm and create a Gantt chart for the optimal sequence.
+    Solve a scheduling problem using the Lowest Cost Last (LCL) algorithm, which minimizes the maximum cost hmax.
 
     Args:
         jobsData (dict): A dictionary containing job data, where keys are job identifiers, and values are dictionaries
@@ -14,12 +20,25 @@ def lclSolver(jobsData):
                             "successors": set,      # A set of job identifiers that depend on this job.
                             "hFunction": function  # A function for computing the h value.
                         }
+                        A JobSet can be passed instead, together with `successors` and `cost`.
+        successors (dict or np.ndarray, optional): The precedence constraints, either as a dictionary mapping a job
+                        identifier to the set of identifiers that depend on it, or as an integer array of shape (E, 2)
+                        whose rows (i, j) say that the job at index j must follow the job at index i. Read from the
+                        "successors" entries of jobsData when omitted.
+        cost (CostFunction or callable, optional): One of the cost specs in `SequencingSolver.costs` (weighted
+                        tardiness, lateness, piecewise-linear or exponential penalties), or a vectorized cost
+                        function called as `cost(completionTime, jobIndices)`, returning
+                        the h value of every job in the jobIndices array if it completes at completionTime (a
+                        scalar, or an array aligned with jobIndices). When it
+                        has a `priority` array such that the job with the lowest priority always has the lowest h,
+                        whatever the completion time, the jobs are picked from a heap instead. The per-job
+                        "hFunction" entries of jobsData are used when omitted.
 
     Returns:
-        None
+        Schedule: The optimal sequence with start and completion times, and hmax as objective.
 
     This function applies the Lowest Cost Last (LCL) algorithm to schedule jobs based on their dependencies and
-    h-values. It generates an optimal job sequence and creates a Gantt chart to visualize the schedule.
+    h-values. It generates an optimal job sequence.
 
     The `jobsData` dictionary should be structured as follows:
     {
@@ -28,9 +47,12 @@ def lclSolver(jobsData):
         "Job3": {"processingtime": 6, "successors": {"Job1", "Job2"}, "hFunction": some_function}
     }
 
-    The `hFunction` for each job computes a value to determine the job's priority.
+    The `hFunction` for each job computes a value to determine the job's priority. It is called once per eligible job
+    on every step, so for large instances pass a vectorized `cost` instead, which evaluates all eligible jobs in one
+    call. The algorithm keeps, for every job, the list of its predecessors and the number of its unscheduled
+    successors, so a step only touches the predecessors of the job it schedules.
 
-    The function will print the optimal job sequence and display a Gantt chart to visualize the schedule.
+    Nothing is printed or drawn; call `summary()` or `plot()` on the returned schedule to see it.
 
     Example usage:
     jobsData = {
@@ -38,81 +60,162 @@ def lclSolver(jobsData):
         "Job2": {"processingtime": 4, "successors": set(), "hFunction": some_function},
         "Job3": {"processingtime": 6, "successors": {"Job1", "Job2"}, "hFunction": some_function}
     }
-    lclSolver(jobsData)
+    schedule = lclSolver(jobsData)
+    schedule.plot()
+
+    jobs = JobSet(processingTime=[5, 4, 6], dueDate=[10, 8, 12])
+    schedule = lclSolver(jobs, successors=np.array([[0, 1], [2, 0], [2, 1]]), cost=WeightedTardiness())
+    """
+    jobs = asJobSet(jobsData)
+    if successors is None:
+        successors = {key: value.get("successors", ()) for key, value in jobsData.items()} \
+            if isinstance(jobsData, dict) else np.empty((0, 2), dtype=np.intp)
+    with phase("parse"):
+        edges = precedenceEdges(jobs, successors)
+
+    if isinstance(cost, CostFunction):
+        cost = cost.bind(jobs)
+    if cost is not None:
+        sequence, hValues = lawler(jobs.processingTime, edges, cost)
+        with phase("objective"):
+            if hValues is None:
+                hValues = cost(np.cumsum(jobs.processingTime[sequence]), sequence)
+            return Schedule.fromSequence(sequence, jobs.processingTime, jobs.ids, np.max(hValues), "hmax")
+
+    if not isinstance(jobsData, dict):
+        raise ValueError("Pass a cost function when jobsData is a JobSet.")
+    missing = [str(key) for key, value in jobsData.items() if "hFunction" not in value]
+    if missing:
+        raise ValueError(f"Missing hFunction for job(s): {', '.join(missing)}")
+
+    # Slow path: every job has its own Python callable, which expects the set of unscheduled jobs
+    hFunctions = [value["hFunction"] for value in jobsData.values()]
+    jobsComplementarySet = set(jobsData.keys())
+
+    def legacyCost(completionTime, jobIndices):
+        return np.array([hFunctions[j](jobsComplementarySet, jobsData, jobs.ids[j]) for j in jobIndices.tolist()])
+
+    def removeJob(j):
+        jobsComplementarySet.discard(jobs.ids[j])
+
+    sequence, hValues = lawler(jobs.processingTime, edges, legacyCost, onSchedule=removeJob)
+    with phase("objective"):
+        return Schedule.fromSequence(sequence, jobs.processingTime, jobs.ids, max(hValues), "hmax")
+
+
+def precedenceEdges(jobs, successors):
+    """
+    Convert precedence constraints to an integer array of shape (E, 2) of (predecessor, successor) job indices.
+
+    Args:
+        jobs (JobSet): The jobs, whose ids the dictionary form refers to.
+        successors (dict or array-like): A dictionary mapping a job identifier to the identifiers that depend on it,
+                                         or an array of index pairs, which is returned as is.
+
+    Returns:
+        np.ndarray: The edges.
+    """
+    if not isinstance(successors, dict):
+        edges = np.asarray(successors, dtype=np.intp).reshape(-1, 2)
+        if len(edges) and (edges.min() < 0 or edges.max() >= len(jobs)):
+            raise ValueError("Precedence edges refer to jobs that do not exist.")
+        return edges
+    jobIndex = {key: index for index, key in enumerate(jobs.ids.tolist())}
+    try:
+        pairs = [(jobIndex[key], jobIndex[successor]) for key, following in successors.items() for successor in following]
+    except KeyError as error:
+        raise ValueError(f"Unknown job in successors: {error.args[0]}") from None
+    return np.array(pairs, dtype=np.intp).reshape(-1, 2)
+
+
+def lawler(processingTimes, edges, cost, onSchedule=None):
+    """
+    Run Lawler's Lowest Cost Last algorithm for 1|prec|hmax.
+
+    Args:
+        processingTimes (np.ndarray): The processing time of each job.
+        edges (np.ndarray): Precedence constraints as (predecessor, successor) index pairs.
+        cost (callable): `cost(completionTime, jobIndices)` returning the h values of those jobs, optionally with a
+                         `priority` array that makes the heap fast path possible.
+        onSchedule (callable, optional): Called with each job index as soon as it is placed.
+
+    Returns:
+        tuple: (sequence, hValues), the job indices in processing order and the h value of each job when it was
+               placed, or None for hValues when the heap fast path was used.
+
+    Jobs are placed from last to first. At every step the candidates are the jobs whose successors are all placed;
+    the one with the lowest h at the current completion time goes last, ties going to the lowest index. Placing a job
+    decrements the counters of its predecessors, and those that reach zero become candidates. With a plain cost
+    function every step evaluates all candidates in one vectorized call, which is O(n^2) in the worst case; with a
+    `priority` array the candidates sit in a heap and the whole run is O(n log n + E).
     """
-    def createInitialSets(jobsData):
-        jobsUniversalSet = set(jobsData.keys())
-        jobsComplementarySet = jobsUniversalSet.copy()
-        jobsSet = jobsUniversalSet - jobsComplementarySet
-        jobsWithNoSuccessors = [
-            key for key, value in jobsData.items() if not value["successors"]]
-        return [jobsUniversalSet, jobsComplementarySet, jobsSet, jobsWithNoSuccessors]
-
-    def findMinimumH(jobsData, jobsWithNoSuccessors):
-        minimumHList = []
-        for j in jobsWithNoSuccessors:
-            h_value = jobsData[j]["hFunction"](
-                jobsComplementarySet, jobsData, j)
-            # Store both j and the corresponding h value
-            minimumHList.append((j, h_value))
-        if not minimumHList:
-            return None  # Handle the case where minimumHList is empty
-        min_index, min_value = min(
-            enumerate(minimumHList), key=lambda x: x[1][1])
-        # min_index contains the index of the minimum value, min_value contains the (j, h) pair
-        return jobsWithNoSuccessors[min_index]
-
-    def updateJobsList(jobsUniversalSet, jobsComplementarySet, jobsSet, jobsWithNoSuccessors, reversedOptimalList, jobsData, removedJob):
-        jobsComplementarySet = jobsComplementarySet-set(reversedOptimalList)
-        jobsSet = jobsUniversalSet-jobsComplementarySet
-        for key in jobsData.keys():
-            if removedJob in jobsData[key]["successors"]:
-                jobsData[key]["successors"] = jobsData[key]["successors"] - \
-                    {removedJob}
-        jobsWithNoSuccessors = [
-            key for key, value in jobsData.items() if not value["successors"]]
-        for job in reversedOptimalList:
-            if job in jobsWithNoSuccessors:
-                jobsWithNoSuccessors.remove(job)
-        return [jobsComplementarySet, jobsSet, jobsWithNoSuccessors]
-
-    def plotSequence(jobsData):
-        # Calculate start and end times for each job in the optimal sequence
-        start_times = []
-        end_times = []
-        current_time = 0
-        colors = []  # List to store unique colors
-        for job in OptimalList:
-            processing_time = jobsData[job]["processingtime"]
-            start_times.append(current_time)
-            end_times.append(current_time + processing_time)
-            current_time += processing_time
-
-            # Assign a unique color to each job
-            colors.append(plt.cm.viridis(len(start_times) / len(OptimalList)))
-
-        # Plot the Gantt chart with different colors for each bar
-        plt.figure(figsize=(10, 4))
-        for i in range(len(OptimalList)):
-            plt.barh(i, end_times[i] - start_times[i],
-                     left=start_times[i], height=0.6, color=colors[i])
-        plt.yticks(range(len(OptimalList)), [
-                   f"Job {job}" for job in OptimalList])
-        plt.xlabel("Time")
-        plt.title("Gantt Chart")
-        plt.grid(axis="x")
-        plt.show()
-
-    reversedOptimalList = []
-    jobsUniversalSet, jobsComplementarySet, jobsSet, jobsWithNoSuccessors = createInitialSets(
-        jobsData=jobsData)
-    for itr in jobsData.keys():
-        removedJob = findMinimumH(
-            jobsData, jobsWithNoSuccessors=jobsWithNoSuccessors)
-        reversedOptimalList.append(removedJob)
-        print(f"Iteration {itr}:", reversedOptimalList)
-        jobsComplementarySet, jobsSet, jobsWithNoSuccessors = updateJobsList(
-            jobsUniversalSet, jobsComplementarySet, jobsSet, jobsWithNoSuccessors, reversedOptimalList, jobsData, removedJob)
-    OptimalList = reversedOptimalList[::-1]
-    print("The Optimal Sequence is:", OptimalList)
-    plotSequence(jobsData)
+    n = len(processingTimes)
+    outDegree = np.bincount(edges[:, 0], minlength=n)
+    order = np.argsort(edges[:, 1], kind="stable")
+    predecessors = edges[order, 0].tolist()
+    boundaries = np.searchsorted(edges[order, 1], np.arange(n + 1)).tolist()
+
+    with phase("search"):
+        priority = getattr(cost, "priority", None)
+        if priority is not None:
+            reversedSequence = _heapOrder(np.asarray(priority).tolist(), outDegree.tolist(), predecessors, boundaries,
+                                          onSchedule)
+            hValues = None
+        else:
+            reversedSequence, hValues = _scanOrder(processingTimes.tolist(), cost, outDegree.tolist(), predecessors,
+                                                   boundaries, onSchedule)
+
+    if len(reversedSequence) < n:
+        raise ValueError("The precedence constraints contain a cycle.")
+    return np.array(reversedSequence[::-1], dtype=np.intp), hValues
+
+
+def _heapOrder(priority, outDegree, predecessors, boundaries, onSchedule):
+    # The job with the lowest priority among the candidates goes last
+    reversedSequence = []
+    heap = [(priority[j], j) for j in range(len(outDegree)) if outDegree[j] == 0]
+    heapify(heap)
+    while heap:
+        job = heappop(heap)[1]
+        reversedSequence.append(job)
+        if onSchedule is not None:
+            onSchedule(job)
+        for predecessor in predecessors[boundaries[job]:boundaries[job + 1]]:
+            outDegree[predecessor] -= 1
+            if outDegree[predecessor] == 0:
+                heappush(heap, (priority[predecessor], predecessor))
+    return reversedSequence
+
+
+def _scanOrder(durations, cost, outDegree, predecessors, boundaries, onSchedule):
+    # Candidates live in eligible[:size]; removal swaps the last candidate into the freed slot
+    reversedSequence = []
+    completionTime = sum(durations)
+    eligible = np.zeros(len(durations), dtype=np.intp)
+    initial = np.flatnonzero(np.asarray(outDegree) == 0)
+    size = len(initial)
+    eligible[:size] = initial
+    hValues = []
+    evaluations = 0
+    while size:
+        candidates = eligible[:size]
+        evaluations += size
+        values = np.asarray(cost(completionTime, candidates))
+        lowest = values.min()
+        position = np.flatnonzero(values == lowest)
+        position = position[np.argmin(candidates[position])]
+        job = int(candidates[position])
+        hValues.append(lowest)
+        size -= 1
+        eligible[position] = eligible[size]
+        reversedSequence.append(job)
+        completionTime -= durations[job]
+        if onSchedule is not None:
+            onSchedule(job)
+        for predecessor in predecessors[boundaries[job]:boundaries[job + 1]]:
+            outDegree[predecessor] -= 1
+            if outDegree[predecessor] == 0:
+                eligible[size] = predecessor
+                size += 1
+    count("lcl.evaluations", evaluations)
+    return reversedSequence, hValues[::-1]
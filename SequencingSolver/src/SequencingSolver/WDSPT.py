@@ -1,26 +1,60 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
+from .instrumentation import phase
+from .jobset import asJobSet
+from .schedule import Schedule
 
-def wdsptSolver(jobsData, r):
+
+def wdsptPriority(processingTimes, weights, r, dtype=np.float64):
     """
-    Solve a scheduling problem using the Weighted Discounted Shortest Processing Time (WDSPT) algorithm and create a Gantt chart.
+    Compute the WDSPT sort key of every job: jobs with a smaller key go first.
 
     Args:
-        jobsData (dict): A dictionary containing job data, where keys are job identifiers, and values are dictionaries
-                        with the following format:
+        processingTimes (array-like): Processing times, of any shape.
+        weights (array-like): Non-negative weights, with the same shape.
+        r (float): The non-negative discount factor.
+        dtype (np.dtype): Float type of the computation; float32 halves the memory of large batches.
+
+    Returns:
+        np.ndarray: log(e^(rp) - 1) - log(w), i.e. minus the log of the WDSPT ratio w e^(-rp) / (1 - e^(-rp)).
+
+    The ratio equals w / expm1(rp). Working with its logarithm keeps it finite for large rp, where e^(rp) overflows,
+    and expm1 keeps it exact for small rp, where 1 - e^(-rp) cancels. A job with rp = 0 gets -inf and goes first; with
+    r = 0 every ratio is infinite and the key falls back to the WSPT ratio -w/p, its limit for small r.
+    """
+    processingTimes = np.asarray(processingTimes, dtype=dtype)
+    weights = np.asarray(weights, dtype=dtype)
+    if r < 0:
+        raise ValueError(f"r must be non-negative, got {r}.")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if r == 0:
+            return -np.divide(weights, processingTimes)
+        x = np.multiply(r, processingTimes, dtype=dtype)
+        # log(expm1(x)) for small x, x + log1p(-e^(-x)) where expm1 would overflow
+        logExpm1 = np.where(x <= 1, np.log(np.expm1(np.minimum(x, 1))), x + np.log1p(-np.exp(-np.maximum(x, 1))))
+        return logExpm1 - np.log(weights)
+
+
+def wdsptSolver(jobsData, r, dtype=np.float64):
+    """
+    Solve a scheduling problem using the Weighted Discounted Shortest Processing Time (WDSPT) algorithm.
+
+    Args:
+        jobsData (dict or JobSet): A dictionary containing job data, where keys are job identifiers, and values are
+                        dictionaries with the following format (or a JobSet with processing times and weights):
                         {
                             "processingtime": int,  # The time required to complete the job.
                             "weight": int            # The weight of the job.
                         }
         r (float): A discount factor for adjusting the criteria calculation.
+        dtype (np.dtype): Float type of the criteria and the objective, np.float64 or np.float32.
 
     Returns:
-        None
+        Schedule: The optimal sequence with start and completion times, and the total weighted discounted completion
+                  time as objective.
 
     This function applies the Weighted Discounted Shortest Processing Time (WDSPT) algorithm to schedule jobs based on their
-    processing times and weights, with the consideration of a discount factor 'r'. It calculates the optimal job sequence and
-    generates a Gantt chart to visualize the schedule.
+    processing times and weights, with the consideration of a discount factor 'r'. It calculates the optimal job sequence.
 
     The `jobsData` dictionary should be structured as follows:
     {
@@ -31,7 +65,9 @@ def wdsptSolver(jobsData, r):
 
     The `r` parameter adjusts the importance of the discount factor in the criteria calculation.
 
-    The function computes the WDSPT criteria for each job, sorts them, and creates a Gantt chart to represent the schedule.
+    The function computes the WDSPT criteria for each job with `wdsptPriority` and sorts them with a stable argsort,
+    so jobs with equal criteria keep their input order.
+    Nothing is printed or drawn; call `summary()` or `plot()` on the returned schedule to see it.
 
     Example usage:
     jobsData = {
@@ -39,79 +75,31 @@ def wdsptSolver(jobsData, r):
         "Job2": {"processingtime": 4, "weight": 8},
         "Job3": {"processingtime": 6, "weight": 12}
     }
-    wdsptSolver(jobsData, r=0.1)
+    schedule = wdsptSolver(jobsData, r=0.1)
+    schedule.plot()
     """
-    def createInitialLists(jobsData):
-        processingTimeArray = []
-        weightArray = []
-        for key in jobsData.keys():
-            processingTimeArray.append(jobsData[key]["processingtime"])
-        for key in jobsData.keys():
-            weightArray.append(jobsData[key]["weight"])
-        return [np.array(processingTimeArray), np.array(weightArray)]
-
-    processingTimeArray, weightArray = createInitialLists(jobsData)
+    jobs = asJobSet(jobsData, "weight")
+    processingTimeArray, weightArray = jobs.processingTime, jobs.weight
 
-    def calculateCriteria(processingTimeArray, weightArray):
-        criteria = np.divide(
-            weightArray*(np.e**(-r*processingTimeArray)), 1-(np.e**(-r*processingTimeArray)))
-        print(criteria)
-        return criteria
-
-    criteria = calculateCriteria(processingTimeArray, weightArray)
+    with phase("sort"):
+        criteria = wdsptPriority(processingTimeArray, weightArray, r, dtype)
 
     def calculateSortedIndex(criteria):
-        sortedIndex = []
-        # Connect each index to the related criteria and sort by criteria value
-        # Create a list of tuples (index, criteria)
-        indexedCriteria = list(enumerate(criteria))
-        # Sort by criteria value
-        sortedCriteria = sorted(
-            indexedCriteria, key=lambda x: x[1], reverse=True)
-        for index, divisionResults in sortedCriteria:
-            sortedIndex.append(index)
-        print(sortedIndex)
-        return sortedIndex
-
-    sortedIndex = calculateSortedIndex(criteria)
+        # Smallest key (highest ratio) first; the stable sort keeps the input order among ties
+        return np.argsort(criteria, kind="stable")
+
+    with phase("sort"):
+        sortedIndex = calculateSortedIndex(criteria)
 
     def calculateTotalCompletionTime(processingTimeArray, weightArray, sortedIndex):
-        completionTime = np.cumsum(processingTimeArray[sortedIndex])
+        completionTime = np.cumsum(processingTimeArray[sortedIndex], dtype=dtype)
+        # 1 - e^(-rC) as -expm1(-rC) stays accurate when rC is small
         totalWeightedCompletionTime = np.sum(
-            weightArray*(1-(np.e**(-r*completionTime))))
+            weightArray[sortedIndex].astype(dtype)*-np.expm1(-r*completionTime), dtype=dtype)
         return totalWeightedCompletionTime
 
-    totalWeightedCompletionTime = calculateTotalCompletionTime(
-        processingTimeArray, weightArray, sortedIndex)
-
-    print("Total weighted completion time:", totalWeightedCompletionTime)
-
-    # Define a function to create a Gantt chart
-
-    def createGanttChart(processingTimeArray, sortedIndex):
-        n = len(processingTimeArray)
-        start_times = np.zeros(n)
-        end_times = np.zeros(n)
-
-        for i in range(n):
-            job_index = sortedIndex[i]
-            if i == 0:
-                start_times[i] = 0
-            else:
-                start_times[i] = end_times[i-1]
-            end_times[i] = start_times[i] + processingTimeArray[job_index]
-
-        fig, ax = plt.subplots(figsize=(10, 4))
-        for i in range(n):
-            job_index = sortedIndex[i]
-            ax.barh(f"Job {job_index + 1}",
-                    end_times[i] - start_times[i], left=start_times[i])
-
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Jobs")
-        ax.set_title("Gantt Chart")
-        plt.grid(axis="x")
-        plt.show()
-
-    # Create the Gantt chart based on the sortedIndex
-    createGanttChart(processingTimeArray, sortedIndex)
+    with phase("objective"):
+        totalWeightedCompletionTime = calculateTotalCompletionTime(
+            processingTimeArray, weightArray, sortedIndex)
+        return Schedule.fromSequence(sortedIndex, processingTimeArray, jobs.ids, totalWeightedCompletionTime,
+                                     "sum wj(1 - e^(-rCj))")
@@ -1,24 +1,28 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .instrumentation import phase
+from .jobset import asJobSet
+from .schedule import Schedule
 
 
 def wsptSolver(jobsData):
     """
-    Solve a scheduling problem using the Weighted Shortest Processing Time (WSPT) algorithm and create a Gantt chart.
+    Solve a scheduling problem using the Weighted Shortest Processing Time (WSPT) algorithm.
 
     Args:
-        jobsData (dict): A dictionary containing job data, where keys are job identifiers, and values are dictionaries
-                        with the following format:
+        jobsData (dict or JobSet): A dictionary containing job data, where keys are job identifiers, and values are
+                        dictionaries with the following format (or a JobSet with processing times and weights):
                         {
                             "processingtime": int,  # The time required to complete the job.
                             "weight": int            # The weight of the job.
                         }
 
     Returns:
-        None
+        Schedule: The optimal sequence with start and completion times, and the total weighted completion time as
+                  objective.
 
     This function applies the Weighted Shortest Processing Time (WSPT) algorithm to schedule jobs based on their processing
-    times and weights. It calculates the optimal job sequence and generates a Gantt chart to visualize the schedule.
+    times and weights. It calculates the optimal job sequence.
 
     The `jobsData` dictionary should be structured as follows:
     {
@@ -27,7 +31,8 @@ def wsptSolver(jobsData):
         "Job3": {"processingtime": 6, "weight": 12}
     }
 
-    The function computes the WSPT criteria for each job, sorts them, and creates a Gantt chart to represent the schedule.
+    The function computes the WSPT criteria for each job and sorts them.
+    Nothing is printed or drawn; call `summary()` or `plot()` on the returned schedule to see it.
 
     Example usage:
     jobsData = {
@@ -35,40 +40,14 @@ def wsptSolver(jobsData):
         "Job2": {"processingtime": 4, "weight": 8},
         "Job3": {"processingtime": 6, "weight": 12}
     }
-    wsptSolver(jobsData)
+    schedule = wsptSolver(jobsData)
+    schedule.plot()
     """
-    def createInitialLists(jobsData):
-        processingTimeArray = []
-        weightArray = []
-        for key in jobsData.keys():
-            processingTimeArray.append(jobsData[key]["processingtime"])
-        for key in jobsData.keys():
-            weightArray.append(jobsData[key]["weight"])
-        return [np.array(processingTimeArray), np.array(weightArray)]
-
-    processingTimeArray, weightArray = createInitialLists(jobsData)
-
-    def calculateCriteria(processingTimeArray, weightArray):
-        criteria = np.divide(weightArray, processingTimeArray)
-        print(criteria)
-        return criteria
-
-    criteria = calculateCriteria(processingTimeArray, weightArray)
-
-    def calculateSortedIndex(criteria):
-        sortedIndex = []
-        # Connect each index to the related criteria and sort by criteria value
-        # Create a list of tuples (index, criteria)
-        indexedCriteria = list(enumerate(criteria))
-        # Sort by criteria value
-        sortedCriteria = sorted(
-            indexedCriteria, key=lambda x: x[1], reverse=True)
-        for index, divisionResults in sortedCriteria:
-            sortedIndex.append(index)
-        print(sortedIndex)
-        return sortedIndex
-
-    sortedIndex = calculateSortedIndex(criteria)
+    jobs = asJobSet(jobsData, "weight")
+    processingTimeArray, weightArray = jobs.processingTime, jobs.weight
+
+    with phase("sort"):
+        sortedIndex = wsptSequence(processingTimeArray, weightArray)
 
     def calculateTotalCompletionTime(processingTimeArray, weightArray, sortedIndex):
         completionTime = np.cumsum(processingTimeArray[sortedIndex])
@@ -76,37 +55,23 @@ def wsptSolver(jobsData):
             completionTime*weightArray[sortedIndex])
         return totalWeightedCompletionTime
 
-    totalWeightedCompletionTime = calculateTotalCompletionTime(
-        processingTimeArray, weightArray, sortedIndex)
-
-    print("Total weighted completion time:", totalWeightedCompletionTime)
-
-    # Define a function to create a Gantt chart
-
-    def createGanttChart(processingTimeArray, sortedIndex):
-        n = len(processingTimeArray)
-        start_times = np.zeros(n)
-        end_times = np.zeros(n)
+    with phase("objective"):
+        totalWeightedCompletionTime = calculateTotalCompletionTime(
+            processingTimeArray, weightArray, sortedIndex)
+        return Schedule.fromSequence(sortedIndex, processingTimeArray, jobs.ids, totalWeightedCompletionTime,
+                                     "sum wjCj")
 
-        for i in range(n):
-            job_index = sortedIndex[i]
-            if i == 0:
-                start_times[i] = 0
-            else:
-                start_times[i] = end_times[i-1]
-            end_times[i] = start_times[i] + processingTimeArray[job_index]
 
-        fig, ax = plt.subplots(figsize=(10, 4))
-        for i in range(n):
-            job_index = sortedIndex[i]
-            ax.barh(f"Job {job_index + 1}",
-                    end_times[i] - start_times[i], left=start_times[i])
+def wsptSequence(processingTimes, weights):
+    """
+    Return the job indices in WSPT order: highest weight per unit of processing time first, ties in input order.
 
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Jobs")
-        ax.set_title("Gantt Chart")
-        plt.grid(axis="x")
-        plt.show()
+    Args:
+        processingTimes (np.ndarray): The processing time of each job.
+        weights (np.ndarray): The weight of each job.
 
-    # Create the Gantt chart based on the sortedIndex
-    createGanttChart(processingTimeArray, sortedIndex)
+    Returns:
+        np.ndarray: Zero-based job indices.
+    """
+    criteria = np.divide(weights, processingTimes)
+    return np.argsort(-criteria, kind="stable")
@@ -0,0 +1,135 @@
+import numpy as np
+
+from .instrumentation import count, phase
+from .WDSPT import wdsptPriority
+from .schedule import Schedule
+
+RULES = ("edd", "wspt", "wdspt")
+
+
+class BatchSchedule:
+    """
+    The results of `batchSolve` for many independent instances, stored as padded 2-D arrays.
+
+    Attributes:
+        sequences (np.ndarray): Shape (instances, jobs). Row i holds the job indices of instance i in processing order;
+                                positions past `lengths[i]` hold -1.
+        completionTimes (np.ndarray): Completion times aligned with `sequences`; 0 in padded positions.
+        objective (np.ndarray): The objective value of every instance.
+        objectiveName (str): Short name of the objective.
+        lengths (np.ndarray): The number of jobs in every instance.
+        lateness (np.ndarray or None): Cj - dj aligned with `sequences` when due dates were given; 0 in padded
+                                       positions.
+    """
+    __slots__ = ("sequences", "completionTimes", "objective", "objectiveName", "lengths", "lateness")
+
+    def __init__(self, sequences, completionTimes, objective, objectiveName, lengths, lateness=None):
+        self.sequences = sequences
+        self.completionTimes = completionTimes
+        self.objective = objective
+        self.objectiveName = objectiveName
+        self.lengths = lengths
+        self.lateness = lateness
+
+    def __len__(self):
+        return len(self.sequences)
+
+    def __repr__(self):
+        return f"BatchSchedule(instances={len(self)}, jobs<={self.sequences.shape[1]}, objective={self.objectiveName})"
+
+    def schedule(self, i):
+        """
+        Return instance i as a regular Schedule, with job ids 1..n.
+        """
+        n = self.lengths[i]
+        completionTimes = self.completionTimes[i, :n]
+        startTimes = np.concatenate([[0], completionTimes[:-1]]).astype(completionTimes.dtype)
+        lateness = tardiness = None
+        if self.lateness is not None:
+            lateness = self.lateness[i, :n]
+            tardiness = np.maximum(lateness, 0)
+        return Schedule(self.sequences[i, :n], np.arange(1, n + 1), startTimes, completionTimes, self.objective[i],
+                        self.objectiveName, lateness, tardiness)
+
+
+def batchSolve(processingTimes, rule, lengths=None, dueDates=None, weights=None, r=None, dtype=np.float64):
+    """
+    Solve many independent single-machine instances with the EDD, WSPT or WDSPT rule in one vectorized call.
+
+    Args:
+        processingTimes (array-like): Shape (instances, jobs), padded on the right for instances with fewer jobs.
+        rule (str): "edd" (minimizes Lmax, needs dueDates), "wspt" (minimizes sum wjCj, needs weights) or "wdspt"
+                    (minimizes sum wj(1 - e^(-rCj)), needs weights and r).
+        lengths (array-like, optional): The number of real jobs in every instance. All columns are used when omitted.
+        dueDates (array-like, optional): Shape (instances, jobs), padded like processingTimes.
+        weights (array-like, optional): Shape (instances, jobs), padded like processingTimes.
+        r (float, optional): The discount factor of the WDSPT rule.
+        dtype (np.dtype): Float type of the WDSPT keys and objective; np.float32 halves their memory.
+
+    Returns:
+        BatchSchedule: The sequences, completion times and objective of every instance.
+
+    All instances are ordered by a single `argsort(axis=1)` and timed by a single `cumsum(axis=1)`; padded positions
+    get an infinite sort key so they end up after the real jobs and contribute nothing to the objective.
+
+    Example usage:
+    result = batchSolve([[5, 4, 6], [3, 2, 0]], "edd", lengths=[3, 2], dueDates=[[10, 8, 12], [4, 3, 0]])
+    result.objective  # Lmax of every instance
+    result.schedule(1)  # the second instance as a Schedule
+    """
+    if rule not in RULES:
+        raise ValueError(f"rule must be one of {', '.join(RULES)}, got {rule!r}.")
+    processingTimes = np.asarray(processingTimes)
+    if processingTimes.ndim != 2:
+        raise ValueError("processingTimes must have shape (instances, jobs).")
+    instances, width = processingTimes.shape
+    lengths = np.full(instances, width) if lengths is None else np.asarray(lengths)
+    if lengths.shape != (instances,) or np.any(lengths < 0) or np.any(lengths > width):
+        raise ValueError(f"lengths must hold {instances} job counts between 0 and {width}.")
+    mask = np.arange(width) < lengths[:, None]
+
+    if rule == "edd":
+        if dueDates is None:
+            raise ValueError("The EDD rule needs dueDates.")
+        dueDates = np.asarray(dueDates)
+        keys = dueDates.astype(float)
+    else:
+        if weights is None:
+            raise ValueError(f"The {rule.upper()} rule needs weights.")
+        weights = np.asarray(weights)
+        if rule == "wspt":
+            keys = -np.divide(weights, processingTimes, where=mask, out=np.zeros(processingTimes.shape))
+        else:
+            if r is None:
+                raise ValueError("The WDSPT rule needs r.")
+            keys = wdsptPriority(processingTimes, weights, r, dtype)
+    keys[~mask] = np.inf
+    count("jobs", int(lengths.sum()))
+
+    with phase("sort"):
+        sequences = np.argsort(keys, axis=1, kind="stable")
+    with phase("objective"):
+        return _batchObjective(rule, sequences, mask, lengths, processingTimes, dueDates, weights, r, dtype)
+
+
+def _batchObjective(rule, sequences, mask, lengths, processingTimes, dueDates, weights, r, dtype):
+    completionTimes = np.cumsum(np.take_along_axis(np.where(mask, processingTimes, 0), sequences, axis=1), axis=1)
+    completionTimes[~mask] = 0
+
+    lateness = None
+    if rule == "edd":
+        lateness = np.where(mask, completionTimes - np.take_along_axis(dueDates, sequences, axis=1), 0)
+        # Empty instances get -inf
+        objective = np.where(mask, lateness, -np.inf).max(axis=1, initial=-np.inf)
+        objectiveName = "Lmax"
+    else:
+        sortedWeights = np.where(mask, np.take_along_axis(weights, sequences, axis=1), 0)
+        if rule == "wspt":
+            objective = np.sum(sortedWeights * completionTimes, axis=1)
+            objectiveName = "sum wjCj"
+        else:
+            objective = np.sum(sortedWeights.astype(dtype) * -np.expm1(-r * completionTimes.astype(dtype)), axis=1,
+                               dtype=dtype)
+            objectiveName = "sum wj(1 - e^(-rCj))"
+    sequences[~mask] = -1
+    return BatchSchedule(sequences, completionTimes, objective, objectiveName, lengths, lateness)
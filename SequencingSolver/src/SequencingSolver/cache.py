@@ -0,0 +1,303 @@
+import functools
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .costs import CostFunction
+from .instrumentation import count, phase
+from .jobset import FIELDS, JobSet, asJobSet
+from .schedule import Schedule
+
+# Schedule attributes stored in the on-disk tier; jobIds are not stored, they come from the jobs of every call
+_ARRAYS = ("sequence", "startTimes", "completionTimes", "lateness", "tardiness")
+
+
+class ResultCache:
+    """
+    An opt-in cache of solver results, keyed by the content of the jobs, the solver and its parameters.
+
+    Attributes:
+        maxEntries (int): The most schedules kept in memory; the least recently used one is dropped beyond that.
+        directory (str or None): Directory of the on-disk tier, one .npz file per result. Results evicted from memory
+                                 or computed by another process are found there.
+        hits (int): Calls answered from memory.
+        diskHits (int): Calls answered from the directory.
+        misses (int): Calls that ran the solver.
+        evictions (int): Results dropped from memory.
+
+    The key is a 128-bit BLAKE2b digest of the dtype, shape and bytes of every JobSet column, the module and name of
+    the solver and its keyword arguments, so hashing a million jobs takes a few milliseconds. Job ids are not part of
+    the key: results only refer to jobs by index, and a cached schedule is returned with the ids of the jobs passed
+    in. Keys of jobsData dictionaries also cover the entries the JobSet does not hold, such as "successors".
+
+    Functions, as the solver, a parameter or a jobsData entry, are keyed by their module and qualified name, so only
+    module-level functions (and `functools.partial` objects of them, keyed with their arguments) can be cached;
+    lambdas and closures raise a ValueError instead of sharing a key. Cost specs from `SequencingSolver.costs` are
+    keyed by their class and attributes.
+
+    The arrays of cached schedules are read-only, since every hit shares them. One cache can be used from several
+    threads; two threads that miss on the same key at the same time both run the solver.
+
+    Example usage:
+    cache = ResultCache(maxEntries=256, directory="solver-cache")
+    schedule = cache.solve(wdsptSolver, jobs, r=0.01)
+    schedule = cache.solve(wdsptSolver, jobs, r=0.01)  # from memory
+    cache.stats
+    """
+    __slots__ = ("maxEntries", "directory", "hits", "diskHits", "misses", "evictions", "_entries", "_lock")
+
+    def __init__(self, maxEntries=128, directory=None):
+        if maxEntries < 0:
+            raise ValueError("maxEntries cannot be negative.")
+        self.maxEntries = maxEntries
+        self.directory = None if directory is None else os.fspath(directory)
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+        self.hits = self.diskHits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"ResultCache(entries={len(self)}, hits={self.hits}, diskHits={self.diskHits}, misses={self.misses})"
+
+    @property
+    def stats(self):
+        """
+        The counters as a dictionary, with the share of calls answered from either tier as "hitRate".
+        """
+        calls = self.hits + self.diskHits + self.misses
+        return {"hits": self.hits, "diskHits": self.diskHits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self), "hitRate": (self.hits + self.diskHits) / calls if calls else 0.0}
+
+    def solve(self, solver, jobsData, **parameters):
+        """
+        Return `solver(jobsData, **parameters)`, from the cache when the same jobs were solved the same way before.
+
+        Args:
+            solver (callable): A solver such as `EDDsolver`, `wsptSolver` or `hodgsonSolver`.
+            jobsData (dict or JobSet): The jobs.
+            **parameters: Keyword arguments of the solver, e.g. `r` for `wdsptSolver`. Numbers, strings, arrays,
+                          cost specs, module-level functions and lists, tuples, sets or dicts of those are supported.
+
+        Returns:
+            Schedule: The result, with read-only arrays.
+        """
+        jobs = asJobSet(jobsData)
+        with phase("hash"):
+            key = _key(solver, jobs, jobsData, parameters)
+        with self._lock:
+            schedule = self._entries.get(key)
+            if schedule is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        source = "memory"
+        if schedule is None and self.directory is not None:
+            source = "disk"
+            schedule = self._load(key)
+        if schedule is None:
+            source = "solver"
+            # The solver gets the jobs as they were passed, with any entries the JobSet does not hold
+            schedule = _frozen(solver(jobsData, **parameters))
+            if self.directory is not None:
+                self._save(key, schedule)
+        if source != "memory":
+            with self._lock:
+                if source == "disk":
+                    self.diskHits += 1
+                else:
+                    self.misses += 1
+            self._remember(key, schedule)
+        count("cache." + source)
+        return Schedule(schedule.sequence, jobs.ids, schedule.startTimes, schedule.completionTimes, schedule.objective,
+                        schedule.objectiveName, schedule.lateness, schedule.tardiness, dict(schedule.details))
+
+    def wrap(self, solver):
+        """
+        Return a function that solves like `solver` through this cache.
+
+        Example usage:
+        cachedEDD = cache.wrap(EDDsolver)
+        schedule = cachedEDD(jobs)
+        """
+        def cachedSolver(jobsData, **parameters):
+            return self.solve(solver, jobsData, **parameters)
+
+        cachedSolver.__name__ = getattr(solver, "__name__", "cachedSolver")
+        cachedSolver.__doc__ = solver.__doc__
+        return cachedSolver
+
+    def clear(self, disk=False):
+        """
+        Drop every result kept in memory, and the files of the on-disk tier when disk is True. Counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".npz"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _remember(self, key, schedule):
+        with self._lock:
+            self._entries[key] = schedule
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxEntries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _save(self, key, schedule):
+        arrays = {name: getattr(schedule, name) for name in _ARRAYS if getattr(schedule, name) is not None}
+        arrays["objective"] = np.asarray(schedule.objective)
+        arrays["objectiveName"] = np.asarray(schedule.objectiveName)
+        for name, value in schedule.details.items():
+            if isinstance(value, list) and all(isinstance(part, np.ndarray) and part.ndim == 1 for part in value):
+                # A list of arrays of any lengths, e.g. the sequence of every machine, is stored flat with offsets
+                arrays["parts." + name] = np.concatenate(value) if value else np.empty(0)
+                arrays["offsets." + name] = np.cumsum([0] + [len(part) for part in value])
+                continue
+            try:
+                value = np.asarray(value)
+            except ValueError:
+                value = None
+            if value is None or value.dtype == object:
+                # Arbitrary objects would need pickling, which is not safe to load back; the result stays in memory
+                return
+            arrays["details." + name] = value
+        # Written under a temporary name and renamed, so readers never see a partial file
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(temporary, os.path.join(self.directory, key + ".npz"))
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    def _load(self, key):
+        try:
+            archive = np.load(os.path.join(self.directory, key + ".npz"))
+        except FileNotFoundError:
+            return None
+        with archive:
+            arrays = {name: archive[name] for name in archive.files}
+        details = {}
+        for name, value in arrays.items():
+            if name.startswith("details."):
+                details[name[8:]] = value.item() if value.ndim == 0 else value
+            elif name.startswith("offsets."):
+                parts = arrays["parts." + name[8:]]
+                details[name[8:]] = [parts[start:end] for start, end in zip(value[:-1].tolist(), value[1:].tolist())]
+        return _frozen(Schedule(arrays["sequence"], None, arrays["startTimes"], arrays["completionTimes"],
+                                arrays["objective"][()], str(arrays["objectiveName"]), arrays.get("lateness"),
+                                arrays.get("tardiness"), details))
+
+
+def resultKey(solver, jobsData, parameters=None):
+    """
+    Return the hexadecimal cache key of a solver call.
+
+    Args:
+        solver (callable): The solver.
+        jobsData (dict or JobSet): The jobs.
+        parameters (dict, optional): Keyword arguments of the solver.
+
+    Returns:
+        str: 32 hexadecimal digits; equal for calls on jobs with the same values (regardless of ids) and parameters.
+    """
+    return _key(solver, asJobSet(jobsData), jobsData, parameters)
+
+
+def _key(solver, jobs, jobsData, parameters):
+    digest = hashlib.blake2b(digest_size=16)
+    _hashFunction(digest, solver)
+    for field in FIELDS:
+        values = getattr(jobs, field)
+        digest.update(field.encode())
+        if values is not None:
+            _hashValue(digest, values)
+    if not isinstance(jobsData, JobSet):
+        keys = set(FIELDS.values())
+        extra = [(position, key, value) for position, data in enumerate(jobsData.values())
+                 for key, value in data.items() if key not in keys]
+        if extra:
+            digest.update(b"extra")
+            _hashValue(digest, extra)
+    digest.update(b"parameters")
+    _hashValue(digest, parameters or {})
+    return digest.hexdigest()
+
+
+def _hashValue(digest, value):
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(f"array{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (dict, list, tuple, np.ndarray, set, frozenset)):
+        _hashContainer(digest, value)
+    elif isinstance(value, np.generic):
+        _hashValue(digest, value.item())
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, CostFunction):
+        digest.update(b"cost")
+        _hashFunction(digest, type(value))
+        _hashValue(digest, vars(value))
+    elif callable(value):
+        _hashFunction(digest, value)
+    else:
+        raise ValueError(f"Cannot build a cache key from values of type {type(value).__name__}; "
+                         "pass numbers, strings, arrays or module-level functions.")
+
+
+def _hashContainer(digest, value):
+    # Dictionaries and sets are hashed in a fixed order, so equal contents give equal keys
+    if isinstance(value, dict):
+        digest.update(f"dict{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            _hashValue(digest, key)
+            _hashValue(digest, value[key])
+        return
+    if isinstance(value, (set, frozenset)):
+        digest.update(f"set{len(value)}".encode())
+        value = sorted(value, key=repr)
+    else:
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+    for item in value:
+        _hashValue(digest, item)
+
+
+def _hashFunction(digest, function):
+    # A function is keyed by where it is defined, which only identifies it when it can be looked up there
+    if isinstance(function, functools.partial):
+        digest.update(b"partial")
+        _hashFunction(digest, function.func)
+        _hashValue(digest, function.args)
+        _hashValue(digest, function.keywords)
+        return
+    module, name = getattr(function, "__module__", None), getattr(function, "__qualname__", None)
+    target = sys.modules.get(module)
+    for part in (name or "").split("."):
+        target = getattr(target, part, None)
+    if target is not function:
+        raise ValueError(f"Cannot build a cache key from {function!r}; only module-level functions and classes, and "
+                         "functools.partial objects of them, can be cached.")
+    digest.update(f"function:{module}.{name};".encode())
+
+
+def _frozen(schedule):
+    for name in _ARRAYS:
+        values = getattr(schedule, name)
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+    for values in schedule.details.values():
+        for part in values if isinstance(values, list) else [values]:
+            if isinstance(part, np.ndarray):
+                part.flags.writeable = False
+    return schedule
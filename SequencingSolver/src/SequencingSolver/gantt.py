@@ -0,0 +1,172 @@
+import numpy as np
+
+from .instrumentation import phase
+
+# Above this many rows the job labels would overlap, so the y axis shows sequence positions instead
+MAX_LABELS = 60
+
+
+def plotSchedule(schedule, title="Gantt Chart", ax=None, show=True, maxBars=None, cmap="viridis"):
+    """
+    Draw a Gantt chart of a schedule with one horizontal bar per job, or per piece of a preempted job.
+
+    Args:
+        schedule (Schedule): The schedule returned by one of the solvers.
+        title (str): Title of the chart.
+        ax (matplotlib.axes.Axes, optional): Axes to draw on. A new figure is created when omitted, through pyplot only
+                                             when it is shown.
+        show (bool): Whether to call `plt.show()` once the chart is drawn. pyplot is not imported otherwise.
+        maxBars (int, optional): The most rows to draw. Defaults to the height of the axes in pixels; with more jobs
+                                 than that, consecutive jobs are merged into one bar per group.
+        cmap (str or matplotlib.colors.Colormap): Colormap the bars are colored with, by sequence position.
+
+    Returns:
+        The Matplotlib axes the chart was drawn on.
+
+    All bars are drawn as a single PolyCollection and colored with one colormap call, so the cost grows with the
+    number of bars drawn rather than with one Matplotlib artist per job. When the jobs outnumber the rows the axes can
+    show, each group of consecutive jobs is drawn as one bar from the first start to the last completion in it.
+
+    Example usage:
+    schedule = wsptSolver(jobsData)
+    plotSchedule(schedule)
+    """
+    with phase("render"):
+        import matplotlib
+        from matplotlib.collections import PolyCollection
+
+        if ax is None and show:
+            import matplotlib.pyplot as plt
+
+            fig, ax = plt.subplots(figsize=(10, 4))
+        elif ax is None:
+            # A figure that is not shown does not need pyplot or an interactive backend
+            from matplotlib.figure import Figure
+
+            ax = Figure(figsize=(10, 4)).subplots()
+        count = len(schedule)
+        budget = maxBars or max(1, int(ax.get_window_extent().height))
+        bars = ganttIntervals(schedule, budget)
+        rows, starts, ends = bars["row"], bars["start"], bars["end"]
+        size = _binSize(count, budget)
+
+        # Bars cover their rows with a gap of 0.4 between neighbouring bars
+        bottoms = rows * size - 0.3
+        tops = (rows + 1) * size - 0.7
+        vertices = np.stack([np.column_stack([starts, bottoms]), np.column_stack([starts, tops]),
+                             np.column_stack([ends, tops]), np.column_stack([ends, bottoms])], axis=1)
+        colors = matplotlib.colormaps.get_cmap(cmap)((rows * size + (size + 1) / 2) / max(count, 1))
+        ax.add_collection(PolyCollection(vertices, facecolors=colors, edgecolors="none"))
+        ax.autoscale_view()
+
+        if count <= MAX_LABELS and size == 1:
+            ax.set_yticks(range(count))
+            ax.set_yticklabels([f"Job {job}" for job in schedule.orderedIds()])
+            ax.set_ylabel("Jobs")
+        else:
+            ax.set_ylabel("Sequence position")
+        ax.set_xlabel("Time")
+        ax.set_title(title)
+        ax.grid(axis="x")
+    if show:
+        import matplotlib.pyplot as plt
+
+        plt.show()
+    return ax
+
+
+def saveSchedule(schedule, target=None, format=None, title="Gantt Chart", figsize=(10, 4), dpi=100, **kwargs):
+    """
+    Render a Gantt chart of a schedule to a file or an in-memory buffer, without a display or `plt.show()`.
+
+    Args:
+        schedule (Schedule): The schedule returned by one of the solvers.
+        target (str, os.PathLike or file-like, optional): Where to write the chart. The bytes are returned when
+                                                          omitted.
+        format (str, optional): "png", "svg" or "pdf". Taken from the file extension of a path, "png" otherwise.
+        title (str): Title of the chart.
+        figsize (tuple): Size of the figure in inches.
+        dpi (int): Resolution of PNG output.
+        **kwargs: Passed on to `plotSchedule`, e.g. maxBars or cmap.
+
+    Returns:
+        bytes or None: The rendered chart when target is omitted.
+
+    The figure is built directly on `matplotlib.figure.Figure`, so it is never registered with pyplot, works with
+    any backend (including Agg on servers) and is released as soon as this returns, even when rendering fails.
+
+    Example usage:
+    saveSchedule(schedule, "schedule.svg")
+    png = saveSchedule(schedule)
+    """
+    import io
+    import os
+
+    from matplotlib.figure import Figure
+
+    if format is None:
+        extension = os.path.splitext(os.fspath(target))[1] if isinstance(target, (str, os.PathLike)) else ""
+        format = extension[1:].lower() or "png"
+    if format not in ("png", "svg", "pdf"):
+        raise ValueError(f"format must be png, svg or pdf, got {format!r}.")
+    figure = Figure(figsize=figsize, dpi=dpi)
+    try:
+        plotSchedule(schedule, title=title, ax=figure.subplots(), show=False, **kwargs)
+        buffer = io.BytesIO() if target is None else target
+        with phase("render"):
+            figure.savefig(buffer, format=format)
+        return buffer.getvalue() if target is None else None
+    finally:
+        figure.clear()
+
+
+def ganttIntervals(schedule, maxBars=None):
+    """
+    Return the bars of a Gantt chart of a schedule as plain data, for clients that draw charts themselves.
+
+    Args:
+        schedule (Schedule): The schedule returned by one of the solvers.
+        maxBars (int, optional): The most rows to return; with more jobs, consecutive jobs are merged into one bar
+                                 per group as in `plotSchedule`.
+
+    Returns:
+        np.ndarray: A structured array with one record per bar and the fields "row" (position in the sequence, or
+                    group number when merged), "job" (zero-based job index, -1 for merged bars), "start" and "end".
+                    Preempted jobs have one bar per piece, taken from `details["segments"]`.
+
+    Matplotlib is not imported.
+
+    Example usage:
+    bars = ganttIntervals(schedule)
+    bars["end"] - bars["start"]
+    """
+    segments = schedule.details.get("segments")
+    if segments is None:
+        jobs, starts, ends = schedule.sequence, schedule.startTimes, schedule.completionTimes
+        rows = np.arange(len(schedule))
+    else:
+        jobs, starts, ends = segments[:, 0].astype(np.intp), segments[:, 1], segments[:, 2]
+        position = np.empty(len(schedule.jobIds), dtype=np.intp)
+        position[schedule.sequence] = np.arange(len(schedule))
+        rows = position[jobs]
+    size = _binSize(len(schedule), maxBars)
+    if size > 1:
+        rows, starts, ends = _binRows(rows, starts, ends, size)
+        jobs = np.full(len(rows), -1)
+    bars = np.empty(len(rows), dtype=[("row", np.intp), ("job", np.intp), ("start", np.float64), ("end", np.float64)])
+    bars["row"], bars["job"], bars["start"], bars["end"] = rows, jobs, starts, ends
+    return bars
+
+
+def _binSize(count, maxBars):
+    # Number of consecutive rows merged into one bar
+    return 1 if not maxBars else max(1, -(-count // maxBars))
+
+
+def _binRows(rows, starts, ends, size):
+    # Merge the bars of every `size` consecutive rows into one bar per group, from the first start to the last end
+    groups = rows // size
+    order = np.argsort(groups, kind="stable")
+    groups, starts, ends = groups[order], starts[order], ends[order]
+    first = np.flatnonzero(np.concatenate([[True], groups[1:] != groups[:-1]]))
+    return groups[first], np.minimum.reduceat(starts, first), np.maximum.reduceat(ends, first)
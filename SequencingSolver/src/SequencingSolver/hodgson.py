@@ -1,25 +1,32 @@
+from heapq import heappop, heappush, nsmallest
+from itertools import islice, permutations
+
 import numpy as np
-from itertools import permutations
+
+from .instrumentation import phase
+from .jobset import asJobSet
+from .schedule import Schedule
 
 
 def hodgsonSolver(jobsData):
     """
-    Solve a scheduling problem using the Hodgson algorithm and generate alternative job sequences.
+    Solve a scheduling problem using the Hodgson algorithm, which minimizes the number of late jobs.
 
     Args:
-        jobsData (dict): A dictionary containing job data, where keys are job identifiers, and values are dictionaries
-                        with the following format:
+        jobsData (dict or JobSet): A dictionary containing job data, where keys are job identifiers, and values are
+                        dictionaries with the following format (or a JobSet with processing times and due dates):
                         {
                             "processingtime": int,  # The time required to complete the job.
                             "duedate": int           # The due date for the job.
                         }
 
     Returns:
-        None
+        Schedule: The on-time jobs in EDD order followed by the late jobs, with the number of late jobs as objective.
+                  `details["onTime"]` and `details["late"]` hold the indices of both sets.
 
     This function applies the Hodgson algorithm to schedule jobs based on their processing times and due dates. It
-    attempts to minimize the number of overdue jobs. The algorithm generates and displays alternative job sequences
-    that may lead to better scheduling results by permuting overdue jobs.
+    attempts to minimize the number of overdue jobs. The late jobs can be processed in any order after the on-time
+    jobs without changing the objective.
 
     The `jobsData` dictionary should be structured as follows:
     {
@@ -28,8 +35,8 @@ def hodgsonSolver(jobsData):
         "Job3": {"processingtime": 6, "duedate": 12}
     }
 
-    The function will print and display various job sequences, both with and without permutations of overdue jobs,
-    to provide insights into scheduling alternatives.
+    Nothing is printed; call `summary()` on the returned schedule to see it. Use `hodgsonAlternatives` to walk through
+    the other orders of the late jobs.
 
     Example usage:
     jobsData = {
@@ -37,45 +44,124 @@ def hodgsonSolver(jobsData):
         "Job2": {"processingtime": 4, "duedate": 8},
         "Job3": {"processingtime": 6, "duedate": 12}
     }
-    hodgsonSolver(jobsData)
+    schedule = hodgsonSolver(jobsData)
+    """
+    jobs = asJobSet(jobsData, "dueDate")
+    onTimeJobs, lateJobs = mooreHodgson(jobs.processingTime, jobs.dueDate)
+    with phase("objective"):
+        return Schedule.fromSequence(np.concatenate([onTimeJobs, lateJobs]), jobs.processingTime, jobs.ids,
+                                     len(lateJobs), "sum Uj", dueDates=jobs.dueDate,
+                                     details={"onTime": onTimeJobs, "late": lateJobs})
+
+
+def mooreHodgson(processingTimes, dueDates):
+    """
+    Split the jobs into a largest on-time set and a late set with the Moore-Hodgson algorithm in O(n log n).
+
+    Args:
+        processingTimes (np.ndarray): The processing time of each job.
+        dueDates (np.ndarray): The due date of each job.
+
+    Returns:
+        tuple: (onTimeJobs, lateJobs), two arrays of job indices. The on-time jobs are in EDD order, so processing them
+               in that order finishes all of them by their due dates; the late jobs are in EDD order as well.
+
+    The jobs are added in EDD order while a running total of their processing times is kept. Whenever the total
+    passes the due date of the job just added, the longest job added so far is taken out of a max-heap and marked
+    late.
+
+    Example usage:
+    onTimeJobs, lateJobs = mooreHodgson(np.array([5, 4, 6]), np.array([10, 8, 12]))
     """
-    def createInitialLists(jobsData):
-        overdueJobs = []
-        processingTimeArray = []
-        duedateArray = []
-        jobsSequence = []
-        for key in jobsData.keys():
-            processingTimeArray.append(jobsData[key]["processingtime"])
-        for key in jobsData.keys():
-            duedateArray.append(jobsData[key]["duedate"])
-        return [np.array(processingTimeArray), np.array(duedateArray), overdueJobs, jobsSequence]
-
-    processingTimeArray, duedateArray, overdueJobs, jobsSequence = createInitialLists(
-        jobsData)
-    k = 1
-
-    def sortDuedates(duedateArray):
-        sortedIndex = np.argsort(duedateArray)
-        return list(sortedIndex)
-    print("k =", k)
-    sortedIndex = sortDuedates(duedateArray)
-    print("sortedIndex", sortedIndex)
-    processingTimeArray = processingTimeArray[sortedIndex]
-    print("processingTimeArray:", processingTimeArray)
-    duedateArray = duedateArray[sortedIndex]
-    print("duedateArray:", duedateArray)
-
-    while k <= len(jobsData):
-        if sum(processingTimeArray[:k]) <= duedateArray[k-1]:
-            jobsSequence.append(sortedIndex[k-1])
-        else:
-            processingTimeArray = processingTimeArray[processingTimeArray != (
-                max(processingTimeArray[:k]))]
-            overdueJobs.append(sortedIndex[k-1])
-        print("finalJobsSequence", jobsSequence)
-        print("overdueJobs", overdueJobs)
-        k = k+1
-    for perm in permutations(overdueJobs):
-        finalJobsSequnece = jobsSequence.copy()
-        finalJobsSequnece.extend(list(perm))
-        print("Final Jobs Sequnece(s)", np.array(finalJobsSequnece)+1)
+    with phase("sort"):
+        sortedIndex = np.argsort(dueDates, kind="stable")
+    sortedProcessingTimes = processingTimes[sortedIndex].tolist()
+    sortedDuedates = dueDates[sortedIndex].tolist()
+    isLate = np.zeros(len(sortedIndex), dtype=bool)
+    # Max-heap on processing time; among equally long jobs the one added last is removed first
+    heap = []
+    total = 0
+    with phase("search"):
+        for position, (processingTime, duedate) in enumerate(zip(sortedProcessingTimes, sortedDuedates)):
+            heappush(heap, (-processingTime, -position))
+            total += processingTime
+            if total > duedate:
+                negativeProcessingTime, negativePosition = heappop(heap)
+                total += negativeProcessingTime
+                isLate[-negativePosition] = True
+    return sortedIndex[~isLate], sortedIndex[isLate]
+
+
+def hodgsonAlternatives(jobsData, limit=None, unique=True, rankBy=None, candidates=1000):
+    """
+    Lazily yield alternative optimal sequences of the Hodgson algorithm.
+
+    Every alternative processes the on-time jobs in EDD order and then the late jobs in some order, so all of them
+    have the same number of late jobs. The alternatives are produced one at a time, so taking the first few costs
+    O(n) per sequence instead of generating all m! orders of the m late jobs.
+
+    Args:
+        jobsData (dict or JobSet): The jobs, in the same format as for `hodgsonSolver`.
+        limit (int, optional): Stop after this many alternatives. All of them are generated when omitted.
+        unique (bool): Skip orders that only swap equivalent late jobs, i.e. jobs with the same processing time, due
+                       date and (if given) weight.
+        rankBy (callable, optional): A secondary objective. It is called with a sequence (an array of job indices)
+                                     and returns a number; alternatives are then yielded from lowest to highest.
+        candidates (int): How many alternatives are scored when `rankBy` is given. Ranking looks at this many
+                          alternatives only, so the work stays bounded however many late jobs there are.
+
+    Yields:
+        np.ndarray: A sequence of job indices, on-time jobs first.
+
+    Example usage:
+    for sequence in hodgsonAlternatives(jobsData, limit=5):
+        print(sequence)
+    """
+    jobs = asJobSet(jobsData, "dueDate")
+    onTimeJobs, lateJobs = mooreHodgson(jobs.processingTime, jobs.dueDate)
+    if unique:
+        latePermutations = _uniquePermutations(jobs, lateJobs)
+    else:
+        latePermutations = permutations(lateJobs.tolist())
+    sequences = (np.concatenate([onTimeJobs, np.array(late, dtype=np.intp)]) for late in latePermutations)
+    if rankBy is not None:
+        pool = islice(sequences, candidates)
+        sequences = iter(nsmallest(candidates if limit is None else limit, pool, key=rankBy))
+    return islice(sequences, limit)
+
+
+def _uniquePermutations(jobs, lateJobs):
+    # Label the late jobs by equivalence class, ordered so that the first permutation is the EDD order
+    columns = [jobs.dueDate[lateJobs], jobs.processingTime[lateJobs]]
+    if jobs.weight is not None:
+        columns.append(jobs.weight[lateJobs])
+    keys, labels = np.unique(np.column_stack(columns), axis=0, return_inverse=True)
+    labels = labels.ravel()
+    grouped = np.argsort(labels, kind="stable")
+    counts = np.bincount(labels, minlength=len(keys))
+    members = [group.tolist() for group in np.split(lateJobs[grouped], np.cumsum(counts)[:-1])]
+    labels = labels[grouped].tolist()
+    while True:
+        taken = [0] * len(members)
+        permutation = []
+        for label in labels:
+            permutation.append(members[label][taken[label]])
+            taken[label] += 1
+        yield permutation
+        if not _nextPermutation(labels):
+            return
+
+
+def _nextPermutation(labels):
+    # Advance labels in place to the next lexicographic permutation; repeated labels yield every distinct order once
+    i = len(labels) - 2
+    while i >= 0 and labels[i] >= labels[i + 1]:
+        i -= 1
+    if i < 0:
+        return False
+    j = len(labels) - 1
+    while labels[j] <= labels[i]:
+        j -= 1
+    labels[i], labels[j] = labels[j], labels[i]
+    labels[i + 1:] = reversed(labels[i + 1:])
+    return True
@@ -0,0 +1,148 @@
+import math
+import time
+
+# The active sink, or None while instrumentation is disabled
+_sink = None
+
+# Every phase the package reports: what it times
+PHASES = {
+    "parse": "building a JobSet from jobsData, a file or precedence constraints",
+    "hash": "computing the key of a cached call",
+    "sort": "ordering the jobs by a dispatching rule",
+    "search": "heap passes, LCL steps, branch and bound and dynamic programming",
+    "objective": "completion times and objective values",
+    "render": "drawing or exporting a chart",
+}
+
+# Every counter the package reports: what it adds up
+COUNTERS = {
+    "jobs": "jobs passed to a solver",
+    "lcl.evaluations": "cost evaluations of the LCL engine",
+    "wt.nodes": "nodes of the weighted tardiness branch and bound",
+    "carlier.nodes": "nodes of Carlier's branch and bound",
+    "loader.rows": "rows read by the loaders",
+    "cache.memory": "ResultCache calls answered from memory",
+    "cache.disk": "ResultCache calls answered from the directory",
+    "cache.solver": "ResultCache calls that ran the solver",
+}
+
+
+class Histogram:
+    """
+    An in-memory sink that aggregates phase timings and counters.
+
+    Phase durations (in seconds) are kept as count, total, minimum, maximum and a histogram with power-of-two
+    buckets; counters as a running total. Call `snapshot()` to read them.
+
+    Example usage:
+    histogram = enable()
+    EDDsolver(jobs)
+    histogram.snapshot()["phases"]["sort"]["total"]
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+
+    def __call__(self, kind, name, value):
+        if kind == "count":
+            self.counters[name] = self.counters.get(name, 0) + value
+            return
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = {"count": 0, "total": 0.0, "min": math.inf, "max": 0.0, "buckets": {}}
+        stats["count"] += 1
+        stats["total"] += value
+        stats["min"] = min(stats["min"], value)
+        stats["max"] = max(stats["max"], value)
+        # Bucket b holds durations in [2**(b - 1), 2**b) microseconds
+        bucket = math.frexp(value * 1e6)[1] if value > 0 else 0
+        stats["buckets"][bucket] = stats["buckets"].get(bucket, 0) + 1
+
+    def snapshot(self):
+        """
+        Return a copy of the collected data as {"phases": {name: stats}, "counters": {name: total}}.
+        """
+        return {"phases": {name: dict(stats, buckets=dict(stats["buckets"])) for name, stats in self.phases.items()},
+                "counters": dict(self.counters)}
+
+    def reset(self):
+        self.phases.clear()
+        self.counters.clear()
+
+
+class _Phase:
+    __slots__ = ("sink", "name", "start")
+
+    def __init__(self, sink, name):
+        self.sink = sink
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.sink("phase", self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def enable(callback=None):
+    """
+    Start reporting phase timings and counters.
+
+    Args:
+        callback (callable, optional): Called as `callback(kind, name, value)`, with kind "phase" and the duration in
+                                       seconds, or kind "count" and the increment. A new Histogram is used when
+                                       omitted.
+
+    Returns:
+        callable: The active sink, i.e. the callback or the new Histogram.
+
+    The names reported are the keys of PHASES and COUNTERS, which describe each of them.
+    """
+    global _sink
+    _sink = Histogram() if callback is None else callback
+    return _sink
+
+
+def disable():
+    """
+    Stop reporting. Instrumented code then only pays for a global lookup per phase.
+    """
+    global _sink
+    _sink = None
+
+
+def phase(name):
+    """
+    Return a context manager that reports the time spent in its block as the given phase.
+
+    Example usage:
+    with phase("sort"):
+        sortedIndex = np.argsort(dueDates)
+    """
+    if _sink is None:
+        return _NULL_PHASE
+    return _Phase(_sink, name)
+
+
+def count(name, value=1):
+    """
+    Add value to the named counter.
+    """
+    if _sink is not None:
+        _sink("count", name, value)
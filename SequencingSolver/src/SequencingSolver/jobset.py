@@ -0,0 +1,164 @@
+from operator import itemgetter
+
+import numpy as np
+
+from .instrumentation import count, phase
+
+# Attribute name of every column and the key it has in the classic jobsData dictionaries
+FIELDS = {
+    "processingTime": "processingtime",
+    "dueDate": "duedate",
+    "deadline": "deadline",
+    "weight": "weight",
+    "releaseDate": "releasedate",
+}
+
+
+class JobSet:
+    """
+    A set of jobs stored column-wise in contiguous NumPy arrays.
+
+    Attributes:
+        ids (np.ndarray): Job identifiers, used to label results.
+        processingTime (np.ndarray): The time required to complete each job.
+        dueDate (np.ndarray or None): The due date of each job.
+        deadline (np.ndarray or None): The deadline of each job.
+        weight (np.ndarray or None): The weight of each job.
+        releaseDate (np.ndarray or None): The time each job becomes available.
+
+    Every solver accepts a JobSet wherever it accepts a jobsData dictionary. Building the JobSet once and reusing it
+    skips the dictionary parsing on every call, which dominates the runtime for large instances.
+
+    The columns are read-only views of the arrays they were built from, so contiguous NumPy input is not copied, and
+    no solver can modify a JobSet. One instance can be shared by several threads and reused for any number of solves.
+
+    Example usage:
+    jobs = JobSet(processingTime=[5, 4, 6], dueDate=[10, 8, 12])
+    jobs = JobSet.fromDict({"Job1": {"processingtime": 5, "duedate": 10}})
+    jobs = JobSet.fromDataFrame(frame)  # columns named like the jobsData keys
+    """
+    __slots__ = ("ids",) + tuple(FIELDS)
+
+    def __init__(self, processingTime, dueDate=None, deadline=None, weight=None, releaseDate=None, ids=None):
+        columns = {"processingTime": processingTime, "dueDate": dueDate, "deadline": deadline, "weight": weight,
+                   "releaseDate": releaseDate}
+        n = None
+        for field, values in columns.items():
+            if values is not None:
+                # A read-only view: no copy for contiguous input, and the caller's own array stays writable
+                values = np.ascontiguousarray(values).view()
+                values.flags.writeable = False
+                if values.ndim != 1:
+                    raise ValueError(f"{field} must be one-dimensional.")
+                if not np.issubdtype(values.dtype, np.number):
+                    raise ValueError(f"Invalid values for {field}: expected numbers, got {values.dtype}.")
+                if n is None:
+                    n = len(values)
+                elif len(values) != n:
+                    raise ValueError(f"{field} has {len(values)} entries, expected {n}.")
+            setattr(self, field, values)
+        if ids is None:
+            ids = np.arange(1, n + 1)
+        ids = np.asarray(ids).view()
+        if ids.shape != (n,):
+            raise ValueError(f"ids has {len(ids)} entries, expected {n}.")
+        ids.flags.writeable = False
+        self.ids = ids
+
+    @classmethod
+    def fromDict(cls, jobsData, required=("processingTime",)):
+        """
+        Build a JobSet from the classic jobsData dictionary.
+
+        Args:
+            jobsData (dict): A dictionary whose keys are job identifiers and whose values are dictionaries with
+                             "processingtime" and any of "duedate", "deadline", "weight" and "releasedate". Other keys
+                             (e.g. "successors") are ignored.
+            required (tuple): Fields every job must have. Other fields are read when every job has them, and left out
+                              otherwise.
+
+        Returns:
+            JobSet: The jobs, with the dictionary keys as ids.
+        """
+        if not isinstance(jobsData, dict):
+            raise ValueError("jobsData must be a dictionary or a JobSet.")
+        if not jobsData:
+            raise ValueError("jobsData cannot be empty.")
+        values = list(jobsData.values())
+        columns = {}
+        for field, key in FIELDS.items():
+            if field not in required and not all(key in data for data in values):
+                continue
+            try:
+                columns[field] = np.array(list(map(itemgetter(key), values)))
+            except KeyError:
+                missing = [str(job) for job, data in jobsData.items() if key not in data]
+                raise ValueError(f"Missing values for job(s): {', '.join(missing)}") from None
+            if not np.issubdtype(columns[field].dtype, np.number):
+                invalid = [str(job) for job, data in jobsData.items()
+                           if isinstance(data[key], bool) or not isinstance(data[key], (int, float, np.number))]
+                raise ValueError(f"Invalid values for job(s): {', '.join(invalid)}")
+        ids = np.fromiter(jobsData.keys(), dtype=object, count=len(jobsData))
+        return cls(ids=ids, **columns)
+
+    @classmethod
+    def fromDataFrame(cls, frame, idColumn=None):
+        """
+        Build a JobSet from a pandas DataFrame without iterating over its rows.
+
+        Args:
+            frame (pandas.DataFrame): One row per job, with columns named like the jobsData keys ("processingtime",
+                                      "duedate", "deadline", "weight", "releasedate"). Missing columns are left empty.
+            idColumn (str, optional): Column holding the job identifiers. The frame's index is used when omitted.
+
+        Returns:
+            JobSet: The jobs.
+        """
+        columns = {field: frame[key].to_numpy() for field, key in FIELDS.items() if key in frame.columns}
+        if "processingTime" not in columns:
+            raise ValueError("The frame needs a 'processingtime' column.")
+        ids = frame.index.to_numpy() if idColumn is None else frame[idColumn].to_numpy()
+        return cls(ids=ids, **columns)
+
+    def __len__(self):
+        return len(self.processingTime)
+
+    def __repr__(self):
+        present = [field for field in FIELDS if getattr(self, field) is not None]
+        return f"JobSet(jobs={len(self)}, fields={present})"
+
+    def require(self, *fields):
+        """
+        Raise a ValueError unless every given field is present.
+        """
+        missing = [FIELDS[field] for field in fields if getattr(self, field) is None]
+        if missing:
+            raise ValueError(f"The jobs need {', '.join(missing)} values for this solver.")
+        return self
+
+    def take(self, index):
+        """
+        Return a new JobSet with the jobs at the given positions, in that order.
+        """
+        columns = {field: None if getattr(self, field) is None else getattr(self, field)[index] for field in FIELDS}
+        return JobSet(ids=self.ids[index], **columns)
+
+
+def asJobSet(jobsData, *fields):
+    """
+    Return jobsData as a JobSet, converting it from a jobsData dictionary when needed.
+
+    Args:
+        jobsData (dict or JobSet): The jobs passed to a solver.
+        *fields (str): JobSet fields the solver needs, e.g. "processingTime" and "dueDate".
+
+    Returns:
+        JobSet: The jobs, with every requested field present.
+    """
+    if not isinstance(jobsData, JobSet):
+        with phase("parse"):
+            jobsData = JobSet.fromDict(jobsData, required=("processingTime",) + fields)
+    elif len(jobsData) == 0:
+        raise ValueError("jobsData cannot be empty.")
+    count("jobs", len(jobsData))
+    return jobsData.require("processingTime", *fields)
@@ -0,0 +1,133 @@
+import numpy as np
+
+from .hodgson import mooreHodgson
+from .instrumentation import phase
+from .jobset import asJobSet
+from .schedule import Schedule
+
+
+def lawlerMooreSolver(jobsData):
+    """
+    Solve 1||sum wjUj, the minimization of the total weight of the late jobs, with the Lawler-Moore dynamic program.
+
+    Args:
+        jobsData (dict or JobSet): A dictionary containing job data, where keys are job identifiers, and values are
+                        dictionaries with the following format (or a JobSet with processing times, due dates and
+                        weights):
+                        {
+                            "processingtime": int,  # The time required to complete the job; must be integral.
+                            "duedate": int,          # The due date for the job.
+                            "weight": int            # The non-negative penalty for finishing the job late.
+                        }
+
+    Returns:
+        Schedule: The on-time jobs in EDD order followed by the late jobs, with the total weight of the late jobs as
+                  objective. `details["onTime"]` and `details["late"]` hold the indices of both sets.
+
+    When every job has the same weight (or no job has one) the problem is the one `hodgsonSolver` solves, and the
+    Moore-Hodgson algorithm is used instead. Otherwise the run time is pseudo-polynomial, O(n log n * sum pj); see
+    `lawlerMoore`.
+
+    The `jobsData` dictionary should be structured as follows:
+    {
+        "Job1": {"processingtime": 5, "duedate": 10, "weight": 3},
+        "Job2": {"processingtime": 4, "duedate": 8, "weight": 1},
+        "Job3": {"processingtime": 6, "duedate": 12, "weight": 2}
+    }
+
+    Example usage:
+    schedule = lawlerMooreSolver(jobsData)
+    schedule.details["late"]
+    """
+    jobs = asJobSet(jobsData, "dueDate")
+    weights = jobs.weight
+    if weights is None or np.all(weights == weights[0]):
+        onTimeJobs, lateJobs = mooreHodgson(jobs.processingTime, jobs.dueDate)
+    else:
+        onTimeJobs, lateJobs = lawlerMoore(jobs.processingTime, jobs.dueDate, weights)
+    with phase("objective"):
+        objective = len(lateJobs) if weights is None else weights[lateJobs].sum()
+        return Schedule.fromSequence(np.concatenate([onTimeJobs, lateJobs]), jobs.processingTime, jobs.ids,
+                                     objective, "sum wjUj", dueDates=jobs.dueDate,
+                                     details={"onTime": onTimeJobs, "late": lateJobs})
+
+
+def lawlerMoore(processingTimes, dueDates, weights):
+    """
+    Split the jobs into an on-time set of largest total weight and a late set.
+
+    Args:
+        processingTimes (np.ndarray): The integral processing time of each job.
+        dueDates (np.ndarray): The due date of each job.
+        weights (np.ndarray): The non-negative weight of each job.
+
+    Returns:
+        tuple: (onTimeJobs, lateJobs), two arrays of job indices in EDD order, like `mooreHodgson`.
+
+    The jobs are visited in EDD order with a single array f over the time axis: f[t] is the largest weight of an
+    on-time set that takes exactly t units of processing. Adding job j updates f[pj:dj + 1] from f[:dj + 1 - pj] in
+    one vectorized step, as in a 0/1 knapsack. Only that array of size sum pj is kept: to find the on-time set,
+    every pass also tracks through which state each path crossed the middle job, and the two halves are solved again
+    between those states (as in Hirschberg's algorithm). This costs a log n factor in time instead of an n by sum pj
+    table.
+
+    Example usage:
+    onTimeJobs, lateJobs = lawlerMoore(np.array([5, 4, 6]), np.array([10, 8, 12]), np.array([3, 1, 2]))
+    """
+    if np.any(processingTimes < 0) or np.any(processingTimes != np.floor(processingTimes)):
+        raise ValueError("The Lawler-Moore algorithm needs non-negative integral processing times.")
+    if np.any(weights < 0):
+        raise ValueError("The Lawler-Moore algorithm needs non-negative weights.")
+    with phase("sort"):
+        sortedIndex = np.argsort(dueDates, kind="stable")
+    n = len(sortedIndex)
+    p = processingTimes[sortedIndex].astype(np.int64)
+    w = weights[sortedIndex].astype(np.float64)
+    horizon = int(min(p.sum(), max(np.floor(dueDates.max()), 0)))
+    # The latest completion time at which each job is still on time, as a state of the time axis
+    capacity = np.clip(np.floor(dueDates[sortedIndex]), -1, horizon).astype(np.int64)
+
+    isOnTime = np.zeros(n, dtype=bool)
+    with phase("search"):
+        best, origin = _sweep(p, capacity, w, 0, n, 0, horizon, n // 2)
+        end = int(np.argmax(best))
+        _reconstruct(p, capacity, w, 0, n, 0, end, int(origin[end]), isOnTime)
+    return sortedIndex[isOnTime], sortedIndex[~isOnTime]
+
+
+def _sweep(p, capacity, w, first, last, start, width, middle):
+    # Run jobs first..last-1 from state `start` over the states start..start+width. Returns the best weight of every
+    # state and, for every state, the state its best path was in before job `middle`.
+    best = np.full(width + 1, -np.inf)
+    best[0] = 0
+    origin = np.zeros(width + 1, dtype=np.int64)
+    for j in range(first, last):
+        if j == middle:
+            origin = np.arange(width + 1)
+        limit = min(capacity[j] - start, width)
+        if limit < p[j]:
+            continue
+        candidate = best[:limit + 1 - p[j]] + w[j]
+        better = candidate > best[p[j]:limit + 1]
+        origin[p[j]:limit + 1] = np.where(better, origin[:limit + 1 - p[j]], origin[p[j]:limit + 1])
+        best[p[j]:limit + 1] = np.where(better, candidate, best[p[j]:limit + 1])
+    return best, origin + start
+
+
+def _reconstruct(p, capacity, w, first, last, start, end, middleState, isOnTime):
+    # Mark the on-time jobs among first..last-1 of a best path from state start to state end, which crosses the
+    # middle job (first + last) // 2 in middleState
+    if last - first == 1:
+        # A path through a single job either adds it or not; a zero-length job is added whenever it fits
+        isOnTime[first] = end > start or (p[first] == 0 and capacity[first] >= start and w[first] > 0)
+        return
+    middle = (first + last) // 2
+    for segmentFirst, segmentLast, segmentStart, segmentEnd in ((first, middle, start, middleState),
+                                                                (middle, last, middleState, end)):
+        if segmentLast - segmentFirst > 1:
+            _, origin = _sweep(p, capacity, w, segmentFirst, segmentLast, segmentStart, segmentEnd - segmentStart,
+                               (segmentFirst + segmentLast) // 2)
+            _reconstruct(p, capacity, w, segmentFirst, segmentLast, segmentStart, segmentEnd,
+                         int(origin[segmentEnd - segmentStart]), isOnTime)
+        else:
+            _reconstruct(p, capacity, w, segmentFirst, segmentLast, segmentStart, segmentEnd, None, isOnTime)
@@ -0,0 +1,373 @@
+import csv
+import io
+import os
+from itertools import islice
+
+import numpy as np
+
+from .batch import BatchSchedule
+from .instrumentation import count, phase
+from .jobset import FIELDS, JobSet
+
+# Fields of the records SequenceWriter stores, one per job of every schedule written; little-endian like the header,
+# so files written on any machine read the same
+SEQUENCE_DTYPE = np.dtype([("instance", "<i8"), ("position", "<i8"), ("job", "<i8"), ("start", "<f8"),
+                           ("completion", "<f8")])
+
+# Bytes reserved for the header of a streamed .npy file, rewritten with the final length on close
+_NPY_HEADER = 256
+
+
+def readCsv(path, idColumn=None, delimiter=",", chunkSize=1000000, dtype=None):
+    """
+    Load jobs from a CSV file into a JobSet, parsing a chunk of rows at a time.
+
+    Args:
+        path (str or os.PathLike): The file. Its first line names the columns like the jobsData keys
+                                   ("processingtime", "duedate", "deadline", "weight", "releasedate", in any case);
+                                   other columns are ignored.
+        idColumn (str, optional): Column holding the job identifiers. The jobs are numbered 1..n when omitted.
+        delimiter (str): The field separator.
+        chunkSize (int): Number of rows parsed at a time, which bounds the memory taken by the text being parsed.
+        dtype (np.dtype, optional): Type of the numeric columns. By default a column is int64 when all its values are
+                                    integral and float64 otherwise.
+
+    Returns:
+        JobSet: The jobs, in file order.
+
+    Every chunk is parsed once by `np.loadtxt` straight into arrays, so no dictionary or Python object is built per
+    job. With an id column the chunk is split into strings, the ids are kept as they are and the numeric columns are
+    converted from them.
+
+    Example usage:
+    jobs = readCsv("jobs.csv", idColumn="job")
+    schedule = EDDsolver(jobs)
+    """
+    with open(path, newline="") as file:
+        names = [name.strip().strip('"') for name in file.readline().rstrip("\r\n").split(delimiter)]
+        fields = _columnFields(names, idColumn)
+        numeric = [names.index(name) for name in fields.values()]
+        idIndex = None if idColumn is None else names.index(idColumn)
+        chunks, idChunks = [], []
+        rows = 0
+        with phase("parse"):
+            while True:
+                lines = list(islice(file, chunkSize))
+                if not lines:
+                    break
+                try:
+                    if idIndex is None:
+                        chunks.append(np.loadtxt(lines, delimiter=delimiter, usecols=numeric, ndmin=2, quotechar='"',
+                                                 dtype=np.float64 if dtype is None else dtype))
+                    else:
+                        # The rows are split once; the numeric columns are then converted from the split text
+                        text = np.loadtxt(lines, delimiter=delimiter, usecols=numeric + [idIndex], ndmin=2,
+                                          quotechar='"', dtype=str)
+                        chunks.append(text[:, :-1].astype(np.float64 if dtype is None else dtype))
+                        idChunks.append(text[:, -1])
+                except ValueError as error:
+                    raise ValueError(f"Invalid data in rows {rows + 1} to {rows + len(lines)} of {path}: {error}") \
+                        from None
+                rows += len(lines)
+    if not rows:
+        raise ValueError(f"{path} has no jobs.")
+    count("loader.rows", rows)
+    data = np.concatenate(chunks)
+    columns = {field: data[:, k] if dtype is not None else _narrow(data[:, k]) for k, field in enumerate(fields)}
+    return JobSet(ids=np.concatenate(idChunks) if idChunks else None, **columns)
+
+
+def readArrow(source, idColumn=None):
+    """
+    Load jobs from an Arrow table, record batch or Arrow IPC (Feather v2) file, without copying the numeric columns.
+
+    Args:
+        source (pyarrow.Table, pyarrow.RecordBatch, str or os.PathLike): The jobs, or the path of a file written by
+                                                                         `pyarrow.ipc` or `pyarrow.feather`.
+        idColumn (str, optional): Column holding the job identifiers. The jobs are numbered 1..n when omitted.
+
+    Returns:
+        JobSet: The jobs. Columns are named like the jobsData keys, in any case; other columns are ignored.
+
+    A file is memory-mapped, and a numeric column without nulls that sits in a single chunk becomes a JobSet column
+    that points into the Arrow buffer, so nothing is read until a solver touches it. Columns split across several
+    chunks are concatenated once. Needs pyarrow.
+
+    Example usage:
+    jobs = readArrow("jobs.arrow", idColumn="job")
+    """
+    pyarrow = _pyarrow("readArrow")
+    if isinstance(source, (str, os.PathLike)):
+        # The mapping stays open as long as the arrays built on it are alive
+        mapped = pyarrow.memory_map(os.fspath(source), "r")
+        try:
+            source = pyarrow.ipc.open_file(mapped).read_all()
+        except pyarrow.ArrowInvalid:
+            mapped.seek(0)
+            source = pyarrow.ipc.open_stream(mapped).read_all()
+    return _fromArrow(source, idColumn)
+
+
+def readParquet(path, idColumn=None):
+    """
+    Load jobs from a Parquet file, reading only the columns the solvers use.
+
+    Args:
+        path (str or os.PathLike): The file. Columns are named like the jobsData keys, in any case.
+        idColumn (str, optional): Column holding the job identifiers. The jobs are numbered 1..n when omitted.
+
+    Returns:
+        JobSet: The jobs.
+
+    Parquet pages are compressed, so they are decoded once into Arrow buffers (from a memory-mapped file); the JobSet
+    columns then point into those buffers as in `readArrow`. Needs pyarrow.
+
+    Example usage:
+    jobs = readParquet("jobs.parquet")
+    """
+    _pyarrow("readParquet")
+    import pyarrow.parquet
+
+    names = pyarrow.parquet.read_schema(path).names
+    fields = _columnFields(names, idColumn)
+    columns = list(fields.values()) + ([] if idColumn is None else [idColumn])
+    with phase("parse"):
+        table = pyarrow.parquet.read_table(path, columns=columns, memory_map=True)
+    return _fromArrow(table, idColumn)
+
+
+def readNpy(path, mmap=True):
+    """
+    Load jobs saved as NumPy arrays, memory-mapping them by default.
+
+    Args:
+        path (str or os.PathLike): A directory written by `writeNpy`, with one 1-D .npy file per column named like
+                                   the jobsData keys ("processingtime.npy", "duedate.npy", ...) and optionally
+                                   "ids.npy"; or a single .npy file holding a structured array with fields named like
+                                   the jobsData keys; or a .npz archive with one array per column.
+        mmap (bool): Open .npy files with `np.load(mmap_mode="r")`, so the jobs are paged in from disk as the solvers
+                     read them instead of being loaded up front.
+
+    Returns:
+        JobSet: The jobs.
+
+    The columns of a directory are contiguous, so the JobSet is built on the memory maps themselves without a copy.
+    The fields of a structured array are interleaved and are copied into contiguous columns; .npz archives are read
+    into memory.
+
+    Example usage:
+    writeNpy(jobs, "jobs")
+    jobs = readNpy("jobs")
+    """
+    mode = "r" if mmap else None
+    path = os.fspath(path)
+    if os.path.isdir(path):
+        arrays = {name[:-4]: np.load(os.path.join(path, name), mmap_mode=mode)
+                  for name in os.listdir(path) if name.endswith(".npy")}
+    elif path.endswith(".npz"):
+        with np.load(path) as archive:
+            arrays = dict(archive)
+    else:
+        data = np.load(path, mmap_mode=mode)
+        if data.dtype.names is None:
+            raise ValueError(f"{path} must hold a structured array with fields named like the jobsData keys.")
+        arrays = {name: data[name] for name in data.dtype.names}
+    fields = _columnFields(list(arrays), "ids" if "ids" in arrays else None)
+    count("loader.rows", len(arrays[fields["processingTime"]]))
+    return JobSet(ids=arrays.get("ids"), **{field: arrays[name] for field, name in fields.items()})
+
+
+def writeNpy(jobs, path):
+    """
+    Save a JobSet as a directory of .npy files, one per column, that `readNpy` memory-maps.
+
+    Args:
+        jobs (JobSet): The jobs.
+        path (str or os.PathLike): The directory, created if needed.
+
+    Ids of dtype object (e.g. the keys of a jobsData dictionary) are stored as strings.
+
+    Example usage:
+    writeNpy(readCsv("jobs.csv"), "jobs")
+    """
+    os.makedirs(path, exist_ok=True)
+    for field, key in FIELDS.items():
+        values = getattr(jobs, field)
+        if values is not None:
+            np.save(os.path.join(path, key + ".npy"), values)
+    ids = jobs.ids.astype(str) if jobs.ids.dtype == object else jobs.ids
+    np.save(os.path.join(path, "ids.npy"), ids)
+
+
+class SequenceWriter:
+    """
+    Stream solver results to a CSV or .npy file, one schedule or batch at a time.
+
+    Every job of every schedule written becomes one record with the fields of SEQUENCE_DTYPE: the number of the
+    schedule in write order, the position of the job in its sequence, the job, and its start and completion times.
+    In a CSV file the job is its id; in a .npy file it is the zero-based job index, since ids need not be numbers.
+
+    Records are written in chunks of at most `chunkSize`, so the memory taken does not depend on the number of
+    schedules. The header of a .npy file is rewritten with the final record count on close, so the target must be
+    seekable; the result opens with `np.load(path, mmap_mode="r")`.
+
+    Attributes:
+        instances (int): Number of schedules written so far.
+        records (int): Number of records written so far.
+
+    Example usage:
+    with SequenceWriter("sequences.npy") as writer:
+        for jobs in instances:
+            writer.write(wsptSolver(jobs))
+        writer.write(batchSolve(processingTimes, "edd", dueDates=dueDates))
+    """
+    __slots__ = ("instances", "records", "_file", "_owned", "_format", "_chunkSize")
+
+    def __init__(self, target, format=None, chunkSize=65536):
+        """
+        Args:
+            target (str, os.PathLike or file object): Where to write. File objects are written as they are: a text or
+                                                      binary file for CSV, a seekable binary file for .npy.
+            format (str, optional): "csv" or "npy". Taken from the file extension of a path, "csv" otherwise.
+            chunkSize (int): The most records formatted at a time.
+        """
+        isPath = isinstance(target, (str, os.PathLike))
+        if format is None:
+            format = os.path.splitext(os.fspath(target))[1][1:].lower() if isPath else "csv"
+        if format not in ("csv", "npy"):
+            raise ValueError(f"format must be csv or npy, got {format!r}.")
+        self.instances = 0
+        self.records = 0
+        self._format = format
+        self._chunkSize = chunkSize
+        self._owned = isPath
+        self._file = open(target, "wb") if isPath else target
+        if format == "csv":
+            self._writeText("instance,position,job,start,completion\n")
+        else:
+            if not self._file.seekable():
+                raise ValueError("A .npy target must be seekable.")
+            self._file.write(b"\0" * _NPY_HEADER)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"SequenceWriter(format={self._format}, instances={self.instances}, records={self.records})"
+
+    def write(self, result):
+        """
+        Append a Schedule, or every instance of a BatchSchedule.
+
+        Args:
+            result (Schedule or BatchSchedule): The result of a solver, `batchSolve` or `parallelSolve`.
+        """
+        if isinstance(result, BatchSchedule):
+            # Instances are flattened a block of rows at a time, keeping only the positions of real jobs
+            step = max(1, self._chunkSize // max(result.sequences.shape[1], 1))
+            for first in range(0, len(result), step):
+                sequences = result.sequences[first:first + step]
+                completionTimes = result.completionTimes[first:first + step]
+                mask = np.arange(sequences.shape[1]) < result.lengths[first:first + step, None]
+                startTimes = np.zeros(completionTimes.shape, dtype=completionTimes.dtype)
+                startTimes[:, 1:] = completionTimes[:, :-1]
+                rows, positions = np.nonzero(mask)
+                jobs = sequences[mask]
+                # Batch instances are numbered 1..n, as in BatchSchedule.schedule
+                ids = jobs + 1 if self._format == "csv" else jobs
+                self._writeRecords(self.instances + rows, positions, jobs, ids, startTimes[mask], completionTimes[mask])
+                self.instances += len(sequences)
+        else:
+            n = len(result)
+            for first in range(0, n, self._chunkSize):
+                part = slice(first, min(first + self._chunkSize, n))
+                jobs = result.sequence[part]
+                self._writeRecords(np.full(len(jobs), self.instances), np.arange(part.start, part.stop), jobs,
+                                   result.jobIds[jobs], result.startTimes[part], result.completionTimes[part])
+            self.instances += 1
+
+    def close(self):
+        """
+        Finish the file. A .npy header gets the final record count; a file opened from a path is closed.
+        """
+        if self._file is None:
+            return
+        if self._format == "npy":
+            header = {"descr": np.lib.format.dtype_to_descr(SEQUENCE_DTYPE), "fortran_order": False,
+                      "shape": (self.records,)}
+            text = repr(header).encode("latin1")
+            # The header length is a little-endian uint16 in the version 1.0 format, whatever the machine
+            preamble = np.lib.format.magic(1, 0) + np.array(_NPY_HEADER - 10, dtype="<u2").tobytes()
+            end = self._file.tell()
+            self._file.seek(0)
+            self._file.write(preamble + text.ljust(_NPY_HEADER - 11) + b"\n")
+            self._file.seek(end)
+        if self._owned:
+            self._file.close()
+        self._file = None
+
+    def _writeRecords(self, instances, positions, jobs, ids, startTimes, completionTimes):
+        if self._file is None:
+            raise ValueError("The writer is closed.")
+        if self._format == "npy":
+            records = np.empty(len(jobs), dtype=SEQUENCE_DTYPE)
+            records["instance"], records["position"], records["job"] = instances, positions, jobs
+            records["start"], records["completion"] = startTimes, completionTimes
+            self._file.write(records.tobytes())
+        else:
+            # csv quotes ids that hold the delimiter, quotes or line breaks
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="\n").writerows(
+                zip(instances.tolist(), positions.tolist(), ids.tolist(), startTimes.tolist(), completionTimes.tolist()))
+            self._writeText(buffer.getvalue())
+        self.records += len(jobs)
+
+    def _writeText(self, text):
+        self._file.write(text if isinstance(self._file, io.TextIOBase) else text.encode())
+
+
+def _columnFields(names, idColumn):
+    # Map every JobSet field to the column that holds it, matching the jobsData keys in any case
+    lowered = {name.lower(): name for name in names}
+    fields = {field: lowered[key] for field, key in FIELDS.items() if key in lowered}
+    if "processingTime" not in fields:
+        raise ValueError("The data needs a 'processingtime' column.")
+    if idColumn is not None and idColumn not in names:
+        raise ValueError(f"There is no id column {idColumn!r}.")
+    return fields
+
+
+def _narrow(values):
+    # Integral columns become int64, like the integers of a jobsData dictionary
+    if np.all(values == np.trunc(values)) and np.all(np.abs(values) <= 2 ** 53):
+        return values.astype(np.int64)
+    return values
+
+
+def _fromArrow(table, idColumn):
+    fields = _columnFields(table.column_names, idColumn)
+    columns = {field: _arrowColumn(table.column(name), name) for field, name in fields.items()}
+    ids = None if idColumn is None else table.column(idColumn).to_numpy()
+    count("loader.rows", table.num_rows)
+    return JobSet(ids=ids, **columns)
+
+
+def _arrowColumn(column, name):
+    if column.null_count:
+        raise ValueError(f"Column {name!r} has {column.null_count} missing values.")
+    if hasattr(column, "num_chunks"):
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _pyarrow(caller):
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        raise ImportError(f"{caller} needs pyarrow, which is not installed; install it with `pip install pyarrow`.") \
+            from None
+    return pyarrow
@@ -1,25 +1,38 @@
+from heapq import heappop, heappush
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .instrumentation import phase
+from .jobset import asJobSet
+from .schedule import Schedule
 
 
-def minimizeSumCjstDeadline(jobsData):
+def minimizeSumCjstDeadline(jobsData, weighted=False):
     """
     Solve a scheduling problem to minimize the sum of completion times (Cj) while meeting job deadlines.
 
     Args:
-        jobsData (dict): A dictionary containing job data, where keys are job identifiers, and values are dictionaries
-                        with the following format:
+        jobsData (dict or JobSet): A dictionary containing job data, where keys are job identifiers, and values are
+                        dictionaries with the following format (or a JobSet with processing times and deadlines):
                         {
                             "processingtime": int,  # The time required to complete the job.
-                            "deadline": int           # The job's deadline.
+                            "deadline": int,          # The job's deadline.
+                            "weight": int             # Only needed when weighted is True.
                         }
+        weighted (bool): Minimize the weighted sum of completion times (wjCj) with Smith's ratio rule instead.
 
     Returns:
-        None
+        Schedule: The optimal sequence with start and completion times, lateness against the deadlines, and the sum of
+                  (weighted) completion times as objective.
 
-    This function applies an algorithm to schedule jobs with the goal of minimizing the sum of completion times (Cj)
-    while ensuring that job deadlines are met. It computes the optimal job sequence and generates a Gantt chart to
-    visualize the schedule.
+    This function applies Smith's backward algorithm to schedule jobs with the goal of minimizing the sum of completion
+    times (Cj) while ensuring that job deadlines are met. Starting from the total processing time, it repeatedly puts
+    last the longest job whose deadline is not before the current completion time. The jobs are visited in deadline
+    order and the candidates kept in a max-heap on processing time, so the whole run is O(n log n). A ValueError is
+    raised when at some point no job can go last, i.e. when no sequence meets all deadlines.
+
+    With `weighted=True` the candidate with the smallest weight-to-processing-time ratio goes last. 1|dj|sum wjCj is
+    NP-hard, so this variant is Smith's heuristic rather than an exact method; with equal weights it is exact.
 
     The `jobsData` dictionary should be structured as follows:
     {
@@ -28,65 +41,52 @@ def minimizeSumCjstDeadline(jobsData):
         "Job3": {"processingtime": 6, "deadline": 12}
     }
 
-    The function will print the optimal job sequence and create a Gantt chart to represent the job schedule.
+    Nothing is printed or drawn; call `summary()` or `plot()` on the returned schedule to see it.
 
     Example usage:
     jobsData = {
-        jobsData = {
         1: {"processingtime": 4, "deadline": 10},
         2: {"processingtime": 6, "deadline": 12},
         3: {"processingtime": 2, "deadline": 14},
         4: {"processingtime": 4, "deadline": 18},
         5: {"processingtime": 2, "deadline": 18},
-}
     }
-    minimizeSumCjstDeadline(jobsData)
+    schedule = minimizeSumCjstDeadline(jobsData)
+    schedule.plot()
     """
-    def createInitialLists(jobsData):
-        processingTimeArray = []
-        deadlineArray = []
-        for key in jobsData.keys():
-            processingTimeArray.append(jobsData[key]["processingtime"])
-        for key in jobsData.keys():
-            deadlineArray.append(jobsData[key]["deadline"])
-        return [np.array(processingTimeArray), np.array(deadlineArray)]
+    jobs = asJobSet(jobsData, "deadline", "weight") if weighted else asJobSet(jobsData, "deadline")
+    processingTimeArray, deadlineArray = jobs.processingTime, jobs.deadline
+    if weighted:
+        # The lowest ratio goes last; ties go to the lowest index, like the longest job in the unweighted case
+        keys = (jobs.weight / processingTimeArray).tolist()
+    else:
+        keys = (-processingTimeArray).tolist()
+    processingTimes = processingTimeArray.tolist()
+    with phase("sort"):
+        byDeadline = np.argsort(-deadlineArray, kind="stable").tolist()
+    deadlines = deadlineArray.tolist()
 
     reverseOptimalSequence = []
-    processingTimeArray, deadlineArray = createInitialLists(jobsData)
-    k = len(jobsData)
-    tau = sum(processingTimeArray[:k + 1])
-    gantt_data = []
-    dataCopy=jobsData.copy()
-    while jobsData!={}:
-        candidateJobs=[]
-        for job in jobsData.keys():
-            if jobsData[job]["deadline"] >=tau:
-                candidateJobs.append((job,jobsData[job]["processingtime"]))
-        print("Candidate jobs",sorted(candidateJobs, key=lambda x: x[1], reverse=True))
-        reverseOptimalSequence.append(sorted(candidateJobs, key=lambda x: x[1], reverse=True)[0][0])
-        tau= tau - sorted(candidateJobs, key=lambda x: x[1], reverse=True)[0][1]
-        jobsData.pop(sorted(candidateJobs, key=lambda x: x[1], reverse=True)[0][0])
-        print("tau",tau)
-        print("reverseOptimalSequence",reverseOptimalSequence)
+    candidateJobs = []
+    tau = sum(processingTimes)
+    nextJob = 0
+    with phase("search"):
+        while len(reverseOptimalSequence) < len(jobs):
+            while nextJob < len(byDeadline) and deadlines[byDeadline[nextJob]] >= tau:
+                job = byDeadline[nextJob]
+                heappush(candidateJobs, (keys[job], job))
+                nextJob += 1
+            if not candidateJobs:
+                raise ValueError(f"The instance is infeasible: no remaining job has a deadline at or after {tau}.")
+            selectedJob = heappop(candidateJobs)[1]
+            reverseOptimalSequence.append(selectedJob)
+            tau -= processingTimes[selectedJob]
     OptimalSequence = reverseOptimalSequence[::-1]
-    print("The optimal sequence is:", OptimalSequence)
-
-    gantt_data = {}
-    current_time = 0
-
-    for job in OptimalSequence:
-        job_processing_time = dataCopy[job]["processingtime"]
-        gantt_data[job] = (current_time, current_time + job_processing_time)
-        current_time += job_processing_time
-
-    # Create a Gantt chart
-    fig, ax = plt.subplots()
-    for job, (start, end) in gantt_data.items():
-        ax.barh(job, end - start, left=start, color='b',
-                edgecolor='k', align='center')
-
-    ax.set_xlabel('Time')
-    ax.set_ylabel('Job')
-    ax.set_yticks(OptimalSequence)
-    ax.set_yticklabels(OptimalSequence)
-    plt.show()
\ No newline at end of file
+    with phase("objective"):
+        schedule = Schedule.fromSequence(OptimalSequence, processingTimeArray, jobs.ids, None,
+                                         "sum wjCj" if weighted else "sum Cj", dueDates=deadlineArray)
+        if weighted:
+            schedule.objective = np.sum(schedule.completionTimes * jobs.weight[schedule.sequence])
+        else:
+            schedule.objective = schedule.completionTimes.sum()
+    return schedule
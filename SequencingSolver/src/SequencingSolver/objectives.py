@@ -0,0 +1,106 @@
+import numpy as np
+
+from .instrumentation import phase
+from .jobset import asJobSet
+
+# Objective name: the JobSet columns (besides processing times) it needs
+OBJECTIVES = {
+    "Cmax": (),
+    "sum Cj": (),
+    "sum wjCj": ("weight",),
+    "Lmax": ("dueDate",),
+    "Tmax": ("dueDate",),
+    "sum Tj": ("dueDate",),
+    "sum wjTj": ("dueDate", "weight"),
+    "sum Uj": ("dueDate",),
+    "sum wj(1 - e^(-rCj))": ("weight",),
+}
+
+
+def evaluate(jobsData, sequences, objectives=None, r=None, chunkSize=65536):
+    """
+    Score one or many sequences of the same jobs on the usual single-machine objectives.
+
+    Args:
+        jobsData (dict or JobSet): The jobs, as accepted by the solvers.
+        sequences (array-like): One sequence of zero-based job indices, or a 2-D array with one sequence per row.
+                                Rows may hold a subset of the jobs (e.g. only the on-time jobs); they are processed
+                                back to back from time 0.
+        objectives (list, optional): Names from OBJECTIVES to compute. By default every objective the jobs have data
+                                     for: weighted objectives need weights, lateness-based ones due dates and the
+                                     discounted one r.
+        r (float, optional): The discount factor of "sum wj(1 - e^(-rCj))".
+        chunkSize (int): Number of rows scored at a time, which bounds the temporary (rows, jobs) arrays.
+
+    Returns:
+        dict: Objective name to value; a scalar per objective for a single sequence, otherwise an array with one value
+              per row. The names match `Schedule.objectiveName`.
+
+    Example usage:
+    scores = evaluate(jobs, np.array([[0, 1, 2], [2, 1, 0]]), objectives=["sum wjCj", "Lmax"])
+    scores["sum wjCj"].argmin()  # the better of the two sequences
+    """
+    jobs = asJobSet(jobsData)
+    sequences = np.asarray(sequences)
+    single = sequences.ndim == 1
+    if single:
+        sequences = sequences[None, :]
+    if sequences.ndim != 2 or (sequences.size and sequences.dtype.kind not in "iu"):
+        raise ValueError("sequences must be a 1-D or 2-D array of job indices.")
+    if sequences.size and (sequences.min() < 0 or sequences.max() >= len(jobs)):
+        raise ValueError(f"Job indices must be between 0 and {len(jobs) - 1}.")
+
+    available = {"weight": jobs.weight is not None, "dueDate": jobs.dueDate is not None}
+    if objectives is None:
+        objectives = [name for name, fields in OBJECTIVES.items()
+                      if all(available[field] for field in fields)
+                      and (r is not None or name != "sum wj(1 - e^(-rCj))")]
+    for name in objectives:
+        if name not in OBJECTIVES:
+            raise ValueError(f"Unknown objective {name!r}; choose from {', '.join(OBJECTIVES)}.")
+        missing = [field for field in OBJECTIVES[name] if not available[field]]
+        if missing:
+            raise ValueError(f"{name} needs {', '.join(missing)} for every job.")
+        if name == "sum wj(1 - e^(-rCj))" and r is None:
+            raise ValueError(f"{name} needs r.")
+
+    with phase("objective"):
+        chunks = [_evaluateChunk(jobs, sequences[start:start + chunkSize], objectives, r)
+                  for start in range(0, len(sequences), chunkSize)] or [_evaluateChunk(jobs, sequences, objectives, r)]
+        scores = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in objectives}
+    if single:
+        return {name: values[0] for name, values in scores.items()}
+    return scores
+
+
+def _evaluateChunk(jobs, sequences, objectives, r):
+    completionTimes = np.cumsum(jobs.processingTime[sequences], axis=1)
+    weights = jobs.weight[sequences] if jobs.weight is not None else None
+    lateness = tardiness = None
+    if any("dueDate" in OBJECTIVES[name] for name in objectives):
+        lateness = completionTimes - jobs.dueDate[sequences]
+        tardiness = np.maximum(lateness, 0)
+
+    return {name: _score(name, completionTimes, weights, lateness, tardiness, r) for name in objectives}
+
+
+def _score(name, completionTimes, weights, lateness, tardiness, r):
+    # Empty rows get 0 for the sums and -inf for Lmax, as in batchSolve
+    empty = completionTimes.shape[1] == 0
+    if name == "Cmax":
+        return np.zeros(len(completionTimes)) if empty else completionTimes[:, -1]
+    if name == "sum Cj":
+        return completionTimes.sum(axis=1)
+    if name == "sum wjCj":
+        return np.sum(weights * completionTimes, axis=1)
+    if name == "Lmax":
+        return np.full(len(completionTimes), -np.inf) if empty else lateness.max(axis=1)
+    if name == "Tmax":
+        return tardiness.max(axis=1, initial=0)
+    if name == "sum Tj":
+        return tardiness.sum(axis=1)
+    if name == "sum wjTj":
+        return np.sum(weights * tardiness, axis=1)
+    if name == "sum Uj":
+        return np.count_nonzero(lateness > 0, axis=1)
+    return np.sum(weights * -np.expm1(-r * completionTimes), axis=1)
@@ -0,0 +1,274 @@
+import math
+import random
+
+import numpy as np
+
+from .schedule import Schedule
+
+RULES = ("wspt", "edd")
+
+
+class _Node:
+    # One job in the treap. Besides its own data every node keeps aggregates of its subtree, as if the subtree were
+    # scheduled on its own from time 0: total processing time, total weight, sum wjCj and max lateness.
+    __slots__ = ("key", "priority", "jobId", "p", "w", "d", "left", "right",
+                 "totalP", "totalW", "sumWC", "maxLateness")
+
+    def __init__(self, key, jobId, p, w, d):
+        self.key = key
+        self.priority = random.random()
+        self.jobId = jobId
+        self.p = p
+        self.w = w
+        self.d = d
+        self.left = None
+        self.right = None
+        self.totalP = p
+        self.totalW = w
+        self.sumWC = w * p
+        self.maxLateness = p - d
+
+
+def _update(node):
+    left, right = node.left, node.right
+    if left is None:
+        end = node.p
+        totalW = node.w
+        sumWC = node.w * end
+        maxLateness = end - node.d
+    else:
+        end = left.totalP + node.p
+        totalW = left.totalW + node.w
+        sumWC = left.sumWC + node.w * end
+        maxLateness = max(left.maxLateness, end - node.d)
+    if right is None:
+        node.totalP = end
+        node.totalW = totalW
+        node.sumWC = sumWC
+        node.maxLateness = maxLateness
+    else:
+        # Every job of the right subtree starts `end` later than in its own subtree
+        node.totalP = end + right.totalP
+        node.totalW = totalW + right.totalW
+        node.sumWC = sumWC + right.sumWC + right.totalW * end
+        node.maxLateness = max(maxLateness, right.maxLateness + end)
+
+
+def _split(node, key):
+    # Split into the nodes with keys below key and the rest
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _insert(node, new):
+    if node is None:
+        return new
+    if new.priority > node.priority:
+        new.left, new.right = _split(node, new.key)
+        _update(new)
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    _update(node)
+    return node
+
+
+def _remove(node, key):
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _remove(node.left, key)
+    else:
+        node.right = _remove(node.right, key)
+    _update(node)
+    return node
+
+
+class OnlineScheduler:
+    """
+    A single-machine WSPT or EDD schedule that is kept up to date while jobs arrive, leave or change weight.
+
+    Jobs are stored in a treap (a randomized balanced search tree) in processing order. Every node also keeps the total
+    processing time, total weight, sum wjCj and max lateness of its subtree, so inserting, removing or reweighting a
+    job updates the objective in O(log n) instead of sorting all jobs again. Ties are broken by arrival order, which
+    gives the same sequence as `wsptSolver` / `EDDsolver` on the jobs in that order.
+
+    Args:
+        rule (str): "wspt" (order by decreasing weight / processing time) or "edd" (order by increasing due date).
+
+    Example usage:
+    scheduler = OnlineScheduler("wspt")
+    scheduler.insert("Job1", 5, weight=10)
+    scheduler.insert("Job2", 4, weight=8)
+    scheduler.updateWeight("Job1", 2)
+    scheduler.remove("Job2")
+    scheduler.totalWeightedCompletionTime
+    scheduler.schedule().plot()
+    """
+
+    def __init__(self, rule="wspt"):
+        if rule not in RULES:
+            raise ValueError(f"rule must be one of {', '.join(RULES)}, got {rule!r}.")
+        self.rule = rule
+        self._root = None
+        self._nodes = {}
+        self._arrivals = 0
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, jobId):
+        return jobId in self._nodes
+
+    def __repr__(self):
+        return f"OnlineScheduler(rule={self.rule!r}, jobs={len(self)})"
+
+    def _key(self, p, w, d, arrival):
+        if self.rule == "edd":
+            return (d, arrival)
+        return (-w / p if p else -math.inf, arrival)
+
+    def insert(self, jobId, processingTime, weight=1, dueDate=None):
+        """
+        Add a job to the schedule.
+
+        Args:
+            jobId: A new, hashable job identifier.
+            processingTime (float): The time required to complete the job.
+            weight (float): The weight of the job.
+            dueDate (float, optional): The due date of the job. Required by the EDD rule; used for the lateness under
+                                       WSPT when given.
+        """
+        if jobId in self._nodes:
+            raise ValueError(f"Job {jobId!r} is already scheduled.")
+        if processingTime < 0:
+            raise ValueError(f"Invalid processing time for job {jobId!r}: {processingTime}")
+        if dueDate is None:
+            if self.rule == "edd":
+                raise ValueError(f"The EDD rule needs a due date for job {jobId!r}.")
+            dueDate = math.inf
+        self._add(jobId, processingTime, weight, dueDate, self._arrivals)
+        self._arrivals += 1
+
+    def _add(self, jobId, p, w, d, arrival):
+        node = _Node(self._key(p, w, d, arrival), jobId, p, w, d)
+        self._nodes[jobId] = node
+        self._root = _insert(self._root, node)
+
+    def remove(self, jobId):
+        """
+        Remove a job from the schedule, e.g. because it was cancelled or started.
+        """
+        node = self._nodes.pop(jobId, None)
+        if node is None:
+            raise ValueError(f"Job {jobId!r} is not scheduled.")
+        self._root = _remove(self._root, node.key)
+
+    def updateWeight(self, jobId, weight):
+        """
+        Change the weight of a scheduled job. Under WSPT the job moves to its new position; it keeps its place among
+        jobs with the same ratio.
+        """
+        node = self._nodes.get(jobId)
+        if node is None:
+            raise ValueError(f"Job {jobId!r} is not scheduled.")
+        if self.rule == "edd":
+            # The order does not depend on weights; only the sums on the path to the root change
+            node.w = weight
+            self._refresh(node)
+            return
+        self.remove(jobId)
+        self._add(jobId, node.p, weight, node.d, node.key[1])
+
+    def _refresh(self, target):
+        path, node = [], self._root
+        while node is not target:
+            path.append(node)
+            node = node.left if target.key < node.key else node.right
+        _update(target)
+        for node in reversed(path):
+            _update(node)
+
+    def completionTime(self, jobId):
+        """
+        Return the completion time of a scheduled job, in O(log n).
+        """
+        target = self._nodes.get(jobId)
+        if target is None:
+            raise ValueError(f"Job {jobId!r} is not scheduled.")
+        node, start = self._root, 0
+        while node is not target:
+            if target.key < node.key:
+                node = node.left
+            else:
+                start += node.p + (node.left.totalP if node.left is not None else 0)
+                node = node.right
+        return start + (node.left.totalP if node.left is not None else 0) + node.p
+
+    @property
+    def makespan(self):
+        return self._root.totalP if self._root is not None else 0
+
+    @property
+    def totalWeightedCompletionTime(self):
+        return self._root.sumWC if self._root is not None else 0
+
+    @property
+    def maxLateness(self):
+        """
+        Lmax of the current order; -inf when no job is scheduled or no job has a due date.
+        """
+        return self._root.maxLateness if self._root is not None else -math.inf
+
+    @property
+    def objective(self):
+        """
+        The objective of the rule: sum wjCj for WSPT, Lmax for EDD.
+        """
+        return self.maxLateness if self.rule == "edd" else self.totalWeightedCompletionTime
+
+    def schedule(self):
+        """
+        Return the current order as a Schedule, in O(n). `jobIds` lists the jobs in processing order, so the sequence
+        is simply 0..n-1.
+        """
+        nodes, stack, node = [], [], self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            nodes.append(node)
+            node = node.right
+        jobIds = np.empty(len(nodes), dtype=object)
+        jobIds[:] = [node.jobId for node in nodes]
+        processingTimes = np.array([node.p for node in nodes])
+        dueDates = np.array([node.d for node in nodes], dtype=float)
+        if not np.isfinite(dueDates).all():
+            dueDates = None
+        objectiveName = "Lmax" if self.rule == "edd" else "sum wjCj"
+        return Schedule.fromSequence(np.arange(len(nodes)), processingTimes, jobIds, self.objective, objectiveName,
+                                     dueDates=dueDates)
@@ -0,0 +1,119 @@
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from .batch import BatchSchedule
+from .jobset import FIELDS, JobSet
+
+# Shared arrays of the current pool, attached once per worker process
+_shared = {}
+
+
+def parallelSolve(solver, jobs, parameters=None, processes=None, chunksize=None):
+    """
+    Run a solver on many instances or parameter settings across a process pool, with the job arrays in shared memory.
+
+    Args:
+        solver (callable): A module-level solver such as `wdsptSolver`, called as `solver(jobSet, **parameters[k])`.
+        jobs (JobSet or list): One JobSet shared by every task, or one JobSet per task.
+        parameters (list, optional): One dictionary of keyword arguments per task, e.g. `[{"r": 0.01}, {"r": 0.02}]`.
+                                     Every task runs without extra arguments when omitted.
+        processes (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        chunksize (int, optional): Number of tasks sent to a worker at a time. By default every worker gets about
+                                   four chunks, which keeps the pool busy without much dispatch overhead.
+
+    Returns:
+        BatchSchedule: Row k holds the sequence, completion times and objective of task k.
+
+    The numeric columns of all instances are copied once into `multiprocessing.shared_memory` blocks. Workers attach
+    to them when they start and build read-only JobSet views, so no job data is pickled per task. Each worker writes
+    its sequences, completion times and objective values straight into shared output arrays and only the objective name
+    goes back through the pool. Job ids are not shared; the JobSets the workers see are numbered 1..n.
+
+    Example usage:
+    result = parallelSolve(wdsptSolver, jobs, [{"r": r} for r in np.linspace(0.01, 0.5, 64)])
+    best = result.objective.argmin()
+    """
+    instances = [jobs] if isinstance(jobs, JobSet) else list(jobs)
+    if parameters is None:
+        parameters = [{}] * len(instances)
+    parameters = list(parameters)
+    tasks = max(len(instances), len(parameters))
+    if len(instances) not in (1, tasks) or len(parameters) not in (1, tasks):
+        raise ValueError("jobs and parameters must have the same length, or one of them a single entry.")
+    if tasks == 0:
+        raise ValueError("There is nothing to solve.")
+    instanceOf = np.zeros(tasks, dtype=np.intp) if len(instances) == 1 else np.arange(tasks)
+    parameters = parameters * tasks if len(parameters) == 1 else parameters
+
+    lengths = np.array([len(instance) for instance in instances])
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    width = int(lengths.max())
+    fields = [field for field in FIELDS if all(getattr(instance, field) is not None for instance in instances)]
+
+    blocks = []
+    try:
+        layout = {}
+        for field in fields:
+            column = np.concatenate([getattr(instance, field) for instance in instances])
+            layout[field] = _share(blocks, column.shape, column.dtype, column)
+        layout["sequences"] = _share(blocks, (tasks, width), np.intp)
+        layout["completionTimes"] = _share(blocks, (tasks, width), np.float64)
+        layout["objective"] = _share(blocks, (tasks,), np.float64)
+
+        processes = processes or os.cpu_count() or 1
+        if chunksize is None:
+            chunksize = max(1, -(-tasks // (processes * 4)))
+        chunks = [(start, min(start + chunksize, tasks)) for start in range(0, tasks, chunksize)]
+        names = []
+        with Pool(processes, initializer=_attach, initargs=(layout, solver, offsets, instanceOf, parameters)) as pool:
+            for objectiveName in pool.imap_unordered(_solveChunk, chunks):
+                names.append(objectiveName)
+        views = {name: _view(block, *layout[name][1:]) for name, block in zip(layout, blocks)}
+        return BatchSchedule(views["sequences"].copy(), views["completionTimes"].copy(), views["objective"].copy(),
+                             names[0], lengths[instanceOf])
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _share(blocks, shape, dtype, values=None):
+    dtype = np.dtype(dtype)
+    block = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    blocks.append(block)
+    view = _view(block, shape, dtype)
+    if values is None:
+        view[...] = -1 if dtype.kind == "i" else 0
+    else:
+        view[...] = values
+    return block.name, shape, dtype
+
+
+def _view(block, shape, dtype):
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _attach(layout, solver, offsets, instanceOf, parameters):
+    _shared.clear()
+    _shared["blocks"] = [shared_memory.SharedMemory(name=name) for name, shape, dtype in layout.values()]
+    _shared["arrays"] = {key: _view(block, shape, dtype)
+                         for (key, (name, shape, dtype)), block in zip(layout.items(), _shared["blocks"])}
+    _shared["task"] = (solver, offsets, instanceOf, parameters)
+
+
+def _solveChunk(chunk):
+    solver, offsets, instanceOf, parameters = _shared["task"]
+    arrays = _shared["arrays"]
+    objectiveName = None
+    for task in range(*chunk):
+        start, end = offsets[instanceOf[task]], offsets[instanceOf[task] + 1]
+        columns = {field: arrays[field][start:end] for field in FIELDS if field in arrays}
+        schedule = solver(JobSet(**columns), **parameters[task])
+        n = len(schedule)
+        arrays["sequences"][task, :n] = schedule.sequence
+        arrays["completionTimes"][task, :n] = schedule.completionTimes
+        arrays["objective"][task] = schedule.objective
+        objectiveName = schedule.objectiveName
+    return objectiveName
@@ -0,0 +1,134 @@
+from heapq import heapreplace
+
+import numpy as np
+
+from .EDD import eddSequence
+from .WSPT import wsptSequence
+from .instrumentation import phase
+from .jobset import asJobSet
+from .schedule import Schedule
+
+
+def lptSolver(jobsData, machines):
+    """
+    Schedule jobs on identical parallel machines with the Longest Processing Time first rule, a heuristic for Pm||Cmax.
+
+    Args:
+        jobsData (dict or JobSet): A dictionary containing job data, where keys are job identifiers, and values are
+                        dictionaries with the following format (or a JobSet with processing times):
+                        {
+                            "processingtime": int   # The time required to complete the job.
+                        }
+        machines (int): The number of identical machines.
+
+    Returns:
+        Schedule: The jobs in the order they are dispatched, which is the order of their start times, with the
+                  makespan as objective. `details["machine"]` gives the machine of every job (aligned with
+                  `sequence`), `details["sequences"]` the job indices of every machine in processing order and
+                  `details["loads"]` the completion time of every machine.
+
+    The jobs are taken longest first and each one starts on the machine that becomes free first, kept in a min-heap of
+    machine loads, so the run time is O(n log n) for the sort and O(n log m) for the assignment. The makespan is at
+    most 4/3 - 1/(3m) times the optimum.
+
+    The `jobsData` dictionary should be structured as follows:
+    {
+        "Job1": {"processingtime": 5},
+        "Job2": {"processingtime": 4},
+        "Job3": {"processingtime": 6}
+    }
+
+    Example usage:
+    schedule = lptSolver(jobsData, machines=2)
+    schedule.details["sequences"]
+    """
+    jobs = asJobSet(jobsData)
+    with phase("sort"):
+        order = np.argsort(-jobs.processingTime, kind="stable")
+    schedule = _listSchedule(jobs, order, machines, "Cmax")
+    schedule.objective = schedule.details["loads"].max()
+    return schedule
+
+
+def parallelWsptSolver(jobsData, machines):
+    """
+    Schedule jobs on identical parallel machines in WSPT order, a heuristic for Pm||sum wjCj.
+
+    Args:
+        jobsData (dict or JobSet): Jobs with processing times and weights, as for `wsptSolver`.
+        machines (int): The number of identical machines.
+
+    Returns:
+        Schedule: The jobs in dispatch order with the total weighted completion time as objective, and the machine
+                  of every job, the sequence of every machine and the machine loads in `details`, as for `lptSolver`.
+
+    The jobs are taken in the order of `wsptSolver` and each one starts on the machine that becomes free first, in
+    O(n log m) after the sort. With equal weights this is the SPT rule, which is optimal for Pm||sum Cj.
+
+    Example usage:
+    schedule = parallelWsptSolver(jobsData, machines=8)
+    """
+    jobs = asJobSet(jobsData, "weight")
+    with phase("sort"):
+        order = wsptSequence(jobs.processingTime, jobs.weight)
+    schedule = _listSchedule(jobs, order, machines, "sum wjCj")
+    schedule.objective = np.sum(schedule.completionTimes * jobs.weight[schedule.sequence])
+    return schedule
+
+
+def parallelEDDsolver(jobsData, machines):
+    """
+    Schedule jobs on identical parallel machines in EDD order, a heuristic for Pm||Lmax.
+
+    Args:
+        jobsData (dict or JobSet): Jobs with processing times and due dates, as for `EDDsolver`.
+        machines (int): The number of identical machines.
+
+    Returns:
+        Schedule: The jobs in dispatch order with lateness and tardiness and Lmax as objective, and the machine of
+                  every job, the sequence of every machine and the machine loads in `details`, as for `lptSolver`.
+
+    The jobs are taken in the order of `EDDsolver` and each one starts on the machine that becomes free first, in
+    O(n log m) after the sort.
+
+    Example usage:
+    schedule = parallelEDDsolver(jobsData, machines=8)
+    """
+    jobs = asJobSet(jobsData, "dueDate")
+    with phase("sort"):
+        order = eddSequence(jobs.dueDate)
+    schedule = _listSchedule(jobs, order, machines, "Lmax")
+    schedule.objective = schedule.lateness.max()
+    return schedule
+
+
+def _listSchedule(jobs, order, machines, objectiveName):
+    # Start every job of `order` in turn on the machine with the smallest load; ties go to the lowest machine
+    if isinstance(machines, bool) or not isinstance(machines, (int, np.integer)) or machines < 1:
+        raise ValueError(f"machines must be a positive integer, got {machines!r}.")
+    processingTimes = jobs.processingTime
+    with phase("search"):
+        loads = [(0, machine) for machine in range(machines)]
+        assigned = []
+        starts = []
+        for processingTime in processingTimes[order].tolist():
+            start, machine = loads[0]
+            assigned.append(machine)
+            starts.append(start)
+            heapreplace(loads, (start + processingTime, machine))
+
+    with phase("objective"):
+        assigned = np.array(assigned, dtype=np.intp)
+        startTimes = np.array(starts, dtype=processingTimes.dtype)
+        completionTimes = startTimes + processingTimes[order]
+        machineLoads = np.zeros(machines, dtype=processingTimes.dtype)
+        for load, machine in loads:
+            machineLoads[machine] = load
+        byMachine = np.argsort(assigned, kind="stable")
+        sequences = np.split(order[byMachine], np.cumsum(np.bincount(assigned, minlength=machines))[:-1])
+        lateness = tardiness = None
+        if jobs.dueDate is not None:
+            lateness = completionTimes - jobs.dueDate[order]
+            tardiness = np.maximum(lateness, 0)
+        return Schedule(order, jobs.ids, startTimes, completionTimes, None, objectiveName, lateness, tardiness,
+                        details={"machine": assigned, "sequences": sequences, "loads": machineLoads})
@@ -0,0 +1,260 @@
+import math
+import time
+from heapq import heappop, heappush
+
+import numpy as np
+
+from .instrumentation import count, phase
+from .jobset import asJobSet
+from .schedule import Schedule
+
+
+def preemptiveEDDsolver(jobsData):
+    """
+    Solve 1|rj,pmtn|Lmax: minimize the maximum lateness when jobs have release dates and may be interrupted.
+
+    Args:
+        jobsData (dict or JobSet): A dictionary containing job data, where keys are job identifiers, and values are
+                        dictionaries with the following format (or a JobSet with processing times, due dates and
+                        release dates):
+                        {
+                            "processingtime": int,  # The time required to complete the job.
+                            "duedate": int,          # The due date for the job.
+                            "releasedate": int       # The time the job becomes available.
+                        }
+
+    Returns:
+        Schedule: The jobs in order of completion, with the time each one first starts and the time it completes,
+                  lateness and tardiness, and Lmax as objective. `details["segments"]` is an (k, 3) array of
+                  (job index, start, end) rows, one per uninterrupted piece of processing, in time order.
+
+    At every release and completion the available job with the earliest due date is processed, interrupting the
+    current one if needed. The events are driven by the jobs sorted on release date and a heap of available jobs, so
+    the run time is O(n log n) and there are at most 2n segments.
+
+    The `jobsData` dictionary should be structured as follows:
+    {
+        "Job1": {"processingtime": 5, "duedate": 10, "releasedate": 0},
+        "Job2": {"processingtime": 4, "duedate": 8, "releasedate": 2},
+        "Job3": {"processingtime": 6, "duedate": 12, "releasedate": 3}
+    }
+
+    Example usage:
+    schedule = preemptiveEDDsolver(jobsData)
+    schedule.details["segments"]
+    """
+    jobs = asJobSet(jobsData, "dueDate", "releaseDate")
+    with phase("search"):
+        segments, completionTimes = _preemptiveEDD(jobs.releaseDate.tolist(), jobs.processingTime.tolist(),
+                                                   jobs.dueDate.tolist())
+    with phase("objective"):
+        sequence = np.argsort(completionTimes, kind="stable")
+        # The start of the first segment of every job; a zero-length job has none and starts when it completes
+        firstStart = {}
+        for job, start, end in segments:
+            firstStart.setdefault(job, start)
+        completionTimes = np.array(completionTimes)[sequence]
+        startTimes = np.array([firstStart.get(job, end) for job, end in zip(sequence.tolist(), completionTimes)])
+        lateness = completionTimes - jobs.dueDate[sequence]
+        return Schedule(sequence, jobs.ids, startTimes, completionTimes, lateness.max(), "Lmax", lateness,
+                        np.maximum(lateness, 0), details={"segments": np.array(segments).reshape(-1, 3)})
+
+
+def schrageSolver(jobsData):
+    """
+    Schedule jobs with release dates without preemption using Schrage's rule, a heuristic for 1|rj|Lmax.
+
+    Args:
+        jobsData (dict or JobSet): Jobs with processing times, due dates and release dates, as for
+                                   `preemptiveEDDsolver`.
+
+    Returns:
+        Schedule: The sequence with start and completion times (including idle time while no job is released),
+                  lateness and tardiness, and Lmax as objective. `details["segments"]` has one (job index, start, end)
+                  row per job.
+
+    Whenever the machine is free, the released job with the earliest due date starts; when no job is released, the
+    machine waits for the next release. This takes O(n log n) and its Lmax is at most max dj - min dj + max pj above
+    the optimum; `carlierSolver` finds the optimum.
+
+    Example usage:
+    schedule = schrageSolver(jobsData)
+    """
+    jobs = asJobSet(jobsData, "dueDate", "releaseDate")
+    with phase("search"):
+        sequence = _schrage(jobs.releaseDate.tolist(), jobs.processingTime.tolist(), jobs.dueDate.tolist())
+    with phase("objective"):
+        return _timedSchedule(jobs, sequence)
+
+
+def carlierSolver(jobsData, timeLimit=None):
+    """
+    Solve 1|rj|Lmax exactly with Carlier's branch-and-bound.
+
+    Args:
+        jobsData (dict or JobSet): Jobs with processing times, due dates and release dates, as for
+                                   `preemptiveEDDsolver`.
+        timeLimit (float, optional): Stop after this many seconds and return the best sequence found so far.
+
+    Returns:
+        Schedule: The sequence with start and completion times, lateness and tardiness, and Lmax as objective.
+                  `details["segments"]` has one (job index, start, end) row per job, `details["optimal"]` tells
+                  whether the search finished and `details["nodes"]` how many nodes it explored.
+
+    Every node runs Schrage's rule and finds its critical block: the jobs up to the one that attains Lmax, back to
+    the last idle time. If a job c in that block is due later than the last job of the block, either c goes before
+    the jobs J after it in the block (its due date drops to max dJ - pJ) or after all of them (its release date rises
+    to min rJ + pJ); otherwise the Schrage sequence is optimal for the node. Nodes are bounded by the preemptive EDD
+    schedule and by min rJ + pJ - max dJ, and explored depth first, the branch with the smaller bound first.
+
+    Example usage:
+    schedule = carlierSolver(jobsData, timeLimit=10)
+    schedule.details["optimal"]
+    """
+    jobs = asJobSet(jobsData, "dueDate", "releaseDate")
+    releaseDates, processingTimes, dueDates = (jobs.releaseDate.tolist(), jobs.processingTime.tolist(),
+                                               jobs.dueDate.tolist())
+    deadline = None if timeLimit is None else time.perf_counter() + timeLimit
+    # Schrage's sequence is the incumbent from the start, so a search cut short still returns a feasible schedule
+    bestSequence = _schrage(releaseDates, processingTimes, dueDates)
+    bestLmax = _lmax(bestSequence, releaseDates, processingTimes, dueDates)
+    nodes = 0
+    optimal = True
+    stack = [(-math.inf, releaseDates, dueDates)]
+    with phase("search"):
+        while stack:
+            if deadline is not None and time.perf_counter() > deadline:
+                optimal = False
+                break
+            bound, r, d = stack.pop()
+            if bound >= bestLmax:
+                continue
+            nodes += 1
+            sequence = _schrage(r, processingTimes, d)
+            # The sequence is feasible for the original jobs; timed with their release dates it can only be better
+            lmax = _lmax(sequence, releaseDates, processingTimes, dueDates)
+            if lmax < bestLmax:
+                bestSequence, bestLmax = sequence, lmax
+            block = _criticalBlock(sequence, r, processingTimes, d)
+            if block is None:
+                continue
+            c, rest = block
+            restRelease = min(r[j] for j in rest)
+            restProcessing = sum(processingTimes[j] for j in rest)
+            restDue = max(d[j] for j in rest)
+            branches = []
+            # c after the rest of the block, or c before it
+            for rc, dc in ((max(r[c], restRelease + restProcessing), d[c]),
+                           (r[c], min(d[c], restDue - restProcessing))):
+                childR, childD = r[:], d[:]
+                childR[c], childD[c] = rc, dc
+                bound = max(min(restRelease, rc) + restProcessing + processingTimes[c] - max(restDue, dc),
+                            _preemptiveBound(childR, processingTimes, childD))
+                if bound < bestLmax:
+                    branches.append((bound, childR, childD))
+            # The branch with the smaller bound is popped first
+            stack.extend(sorted(branches, key=lambda branch: -branch[0]))
+    count("carlier.nodes", nodes)
+    with phase("objective"):
+        return _timedSchedule(jobs, bestSequence, {"optimal": optimal, "nodes": nodes})
+
+
+def _preemptiveEDD(releaseDates, processingTimes, dueDates):
+    # Returns the (job, start, end) segments and the completion time of every job
+    n = len(processingTimes)
+    byRelease = sorted(range(n), key=releaseDates.__getitem__)
+    remaining = list(processingTimes)
+    completionTimes = [0] * n
+    segments = []
+    available = []
+    t = 0
+    nextJob = 0
+    while nextJob < n or available:
+        if not available:
+            t = max(t, releaseDates[byRelease[nextJob]])
+        while nextJob < n and releaseDates[byRelease[nextJob]] <= t:
+            job = byRelease[nextJob]
+            heappush(available, (dueDates[job], job))
+            nextJob += 1
+        job = available[0][1]
+        nextRelease = releaseDates[byRelease[nextJob]] if nextJob < n else math.inf
+        run = min(remaining[job], nextRelease - t)
+        if run > 0:
+            if segments and segments[-1][0] == job and segments[-1][2] == t:
+                segments[-1][2] = t + run
+            else:
+                segments.append([job, t, t + run])
+            t += run
+            remaining[job] -= run
+        if remaining[job] == 0:
+            heappop(available)
+            completionTimes[job] = t
+    return segments, completionTimes
+
+
+def _preemptiveBound(releaseDates, processingTimes, dueDates):
+    # Lmax of the preemptive EDD schedule, a lower bound for the non-preemptive problem
+    segments, completionTimes = _preemptiveEDD(releaseDates, processingTimes, dueDates)
+    return max(c - d for c, d in zip(completionTimes, dueDates))
+
+
+def _schrage(releaseDates, processingTimes, dueDates):
+    n = len(processingTimes)
+    byRelease = sorted(range(n), key=releaseDates.__getitem__)
+    sequence = []
+    available = []
+    t = 0
+    nextJob = 0
+    while len(sequence) < n:
+        if not available:
+            t = max(t, releaseDates[byRelease[nextJob]])
+        while nextJob < n and releaseDates[byRelease[nextJob]] <= t:
+            job = byRelease[nextJob]
+            heappush(available, (dueDates[job], job))
+            nextJob += 1
+        job = heappop(available)[1]
+        sequence.append(job)
+        t += processingTimes[job]
+    return sequence
+
+
+def _startTimes(sequence, releaseDates, processingTimes):
+    starts = []
+    t = 0
+    for job in sequence:
+        t = max(t, releaseDates[job])
+        starts.append(t)
+        t += processingTimes[job]
+    return starts
+
+
+def _lmax(sequence, releaseDates, processingTimes, dueDates):
+    starts = _startTimes(sequence, releaseDates, processingTimes)
+    return max(s + processingTimes[j] - dueDates[j] for s, j in zip(starts, sequence))
+
+
+def _criticalBlock(sequence, releaseDates, processingTimes, dueDates):
+    # Returns (c, jobs after c up to the critical job), or None when the Schrage sequence is optimal for these data
+    starts = _startTimes(sequence, releaseDates, processingTimes)
+    lateness = [s + processingTimes[j] - dueDates[j] for s, j in zip(starts, sequence)]
+    lmax = max(lateness)
+    b = max(position for position, value in enumerate(lateness) if value == lmax)
+    a = b
+    while a > 0 and starts[a - 1] + processingTimes[sequence[a - 1]] == starts[a]:
+        a -= 1
+    critical = dueDates[sequence[b]]
+    for position in range(b - 1, a - 1, -1):
+        if dueDates[sequence[position]] > critical:
+            return sequence[position], sequence[position + 1:b + 1]
+    return None
+
+
+def _timedSchedule(jobs, sequence, details=None):
+    sequence = np.asarray(sequence, dtype=np.intp)
+    startTimes = np.array(_startTimes(sequence.tolist(), jobs.releaseDate.tolist(), jobs.processingTime.tolist()))
+    completionTimes = startTimes + jobs.processingTime[sequence]
+    lateness = completionTimes - jobs.dueDate[sequence]
+    details = dict(details or {})
+    details["segments"] = np.column_stack([sequence, startTimes, completionTimes])
+    return Schedule(sequence, jobs.ids, startTimes, completionTimes, lateness.max(), "Lmax", lateness,
+                    np.maximum(lateness, 0), details)
@@ -0,0 +1,115 @@
+import numpy as np
+
+
+class Schedule:
+    """
+    The result of a sequencing solver.
+
+    Attributes:
+        sequence (np.ndarray): Zero-based job indices in processing order.
+        jobIds (np.ndarray): Job identifiers in input order, so `jobIds[sequence]` lists the jobs in processing order.
+        startTimes (np.ndarray): Start time of every job, aligned with `sequence`.
+        completionTimes (np.ndarray): Completion time of every job, aligned with `sequence`.
+        objective (float): Value of the objective the solver optimizes.
+        objectiveName (str): Short name of that objective, e.g. "Lmax" or "sum wjCj".
+        lateness (np.ndarray or None): Cj - dj for every job, aligned with `sequence`. None when the problem has no
+                                       due dates.
+        tardiness (np.ndarray or None): max(0, Cj - dj) for every job, aligned with `sequence`.
+        details (dict): Solver-specific extras, such as the late jobs found by the Hodgson algorithm.
+
+    Single-machine solvers process the jobs of `sequence` one after the other. The parallel-machine solvers list the
+    jobs in dispatch order instead and give the machine of every job in `details["machine"]`, so consecutive jobs may
+    overlap in time.
+
+    Solvers only build this object; nothing is printed or drawn until `summary()` or `plot()` is called.
+    """
+    __slots__ = ("sequence", "jobIds", "startTimes", "completionTimes", "objective", "objectiveName",
+                 "lateness", "tardiness", "details")
+
+    def __init__(self, sequence, jobIds, startTimes, completionTimes, objective, objectiveName,
+                 lateness=None, tardiness=None, details=None):
+        self.sequence = sequence
+        self.jobIds = jobIds
+        self.startTimes = startTimes
+        self.completionTimes = completionTimes
+        self.objective = objective
+        self.objectiveName = objectiveName
+        self.lateness = lateness
+        self.tardiness = tardiness
+        self.details = {} if details is None else details
+
+    @classmethod
+    def fromSequence(cls, sequence, processingTimes, jobIds, objective, objectiveName, dueDates=None, details=None):
+        """
+        Build a schedule for jobs processed back to back from time 0 in the given order.
+
+        Args:
+            sequence (array-like): Zero-based job indices in processing order.
+            processingTimes (np.ndarray): Processing time of every job, in input order.
+            jobIds (np.ndarray): Job identifiers, in input order.
+            objective (float): Objective value reported by the solver.
+            objectiveName (str): Short name of the objective.
+            dueDates (np.ndarray, optional): Due date of every job, in input order, used for lateness and tardiness.
+            details (dict, optional): Solver-specific extras.
+
+        Returns:
+            Schedule: The schedule with start and completion times filled in.
+        """
+        sequence = np.asarray(sequence, dtype=np.intp)
+        completionTimes = np.cumsum(processingTimes[sequence])
+        startTimes = completionTimes - processingTimes[sequence]
+        lateness = tardiness = None
+        if dueDates is not None:
+            lateness = completionTimes - dueDates[sequence]
+            tardiness = np.maximum(lateness, 0)
+        return cls(sequence, jobIds, startTimes, completionTimes, objective, objectiveName,
+                   lateness, tardiness, details)
+
+    def __len__(self):
+        return len(self.sequence)
+
+    def __repr__(self):
+        return f"Schedule(jobs={len(self)}, {self.objectiveName}={self.objective})"
+
+    def orderedIds(self):
+        """
+        Return the job identifiers in processing order.
+        """
+        return self.jobIds[self.sequence]
+
+    def summary(self):
+        """
+        Return a human-readable description of the schedule, the text the solvers used to print.
+        """
+        lines = [f"The optimal sequence is: {self.orderedIds().tolist()}",
+                 f"{self.objectiveName}: {self.objective}"]
+        for key, value in self.details.items():
+            lines.append(f"{key}: {value}")
+        return "\n".join(lines)
+
+    def plot(self, title="Gantt Chart", **kwargs):
+        """
+        Draw the schedule as a Gantt chart. Matplotlib is only imported when this is called.
+
+        Args:
+            title (str): Title of the chart.
+            **kwargs: Passed on to `SequencingSolver.gantt.plotSchedule`.
+
+        Returns:
+            The Matplotlib axes the chart was drawn on.
+        """
+        from .gantt import plotSchedule
+
+        return plotSchedule(self, title=title, **kwargs)
+
+    def save(self, target=None, format=None, **kwargs):
+        """
+        Render the Gantt chart to a file or buffer (PNG, SVG or PDF) without a display; see
+        `SequencingSolver.gantt.saveSchedule`. The bytes are returned when target is omitted.
+
+        Example usage:
+        schedule.save("schedule.png")
+        """
+        from .gantt import saveSchedule
+
+        return saveSchedule(self, target, format, **kwargs)
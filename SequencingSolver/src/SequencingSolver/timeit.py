@@ -1,13 +1,18 @@
 from functools import wraps
-import time
+
+from .instrumentation import phase
+
 
 def timeit(func):
+    """
+    Report the run time of every call of func as a phase named after it, through `SequencingSolver.instrumentation`.
+
+    Nothing is printed; enable the instrumentation to collect the timings.
+    """
+    name = func.__qualname__
+
     @wraps(func)
     def timeit_wrapper(*args, **kwargs):
-        start_time = time.perf_counter()
-        result = func(*args, **kwargs)
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
-        print(f'Function {func.__name__}{args} {kwargs} Took {total_time:.4f} seconds')
-        return result
-    return timeit_wrapper
\ No newline at end of file
+        with phase(name):
+            return func(*args, **kwargs)
+    return timeit_wrapper
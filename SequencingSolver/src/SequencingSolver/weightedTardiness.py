@@ -0,0 +1,394 @@
+import os
+import time
+from itertools import accumulate
+from multiprocessing import Pool, Value
+
+import numpy as np
+
+from .instrumentation import count, phase
+from .jobset import JobSet, asJobSet
+from .objectives import evaluate
+from .schedule import Schedule
+
+
+def weightedTardinessSolver(jobsData, timeLimit=None, maxNodes=1000000, processes=1, tasks=256, seed=0):
+    """
+    Solve 1||sum wjTj, the minimization of the total weighted tardiness, with a branch-and-bound search.
+
+    Args:
+        jobsData (dict or JobSet): A dictionary containing job data, where keys are job identifiers, and values are
+                        dictionaries with the following format (or a JobSet with processing times, due dates and
+                        optionally weights):
+                        {
+                            "processingtime": int,  # The time required to complete the job.
+                            "duedate": int,          # The due date for the job.
+                            "weight": int            # Optional; every job weighs 1 when no job has a weight.
+                        }
+        timeLimit (float, optional): Stop after this many seconds and return the best sequence found so far.
+        maxNodes (int): Size of the store of visited job sets. It is cleared when full, which only weakens pruning.
+                        With several processes every worker has its own store.
+        processes (int, optional): Number of worker processes; None for one per CPU. With 1 the search runs in this
+                                   process.
+        tasks (int): With several processes, the top of the search tree is expanded until it has about this many
+                     subtrees, which the workers then take one at a time.
+        seed (int): With several processes, breaks ties in the order the subtrees are handed out.
+
+    Returns:
+        Schedule: The best sequence found, with lateness and tardiness, and the total weighted tardiness as objective.
+                  `details["optimal"]` tells whether the search finished, i.e. whether the sequence is proven optimal,
+                  and `details["nodes"]` how many nodes were explored.
+
+    The problem is NP-hard, so the search is exponential in the worst case. It keeps it small with:
+      - an initial upper bound from the better of the EDD and WSPT sequences, improved by moving single jobs to other
+        positions (the moves of one job are scored at once with `objectives.evaluate`) until no move helps or the
+        time limit is reached;
+      - Emmons-type dominance rules (extended to weights), fixed before the search, that force job i before job j
+        when i is not longer, not lighter and due before j can finish, or when j is not late in the last position;
+      - backward scheduling: the last position of the remaining jobs is filled first, a job that is not late there is
+        put there without branching, and a job is not put right before one it should be swapped with;
+      - a lower bound on the remaining jobs: the larger of the smallest weight times the sum of max(0, C_k - d_k),
+        pairing the completion times of the SPT order with the due dates of the EDD order, and sum wj(Cj - dj) in the
+        WSPT order;
+      - a store of visited sets of remaining jobs with the lowest cost of the jobs after them, which cuts every
+        other path that reaches the same set at a higher cost.
+
+    With several processes the subtrees go to a pool through a shared queue, so a worker that finishes early takes the
+    next one; subtrees with the lowest bound go first. The workers share the best cost found in a
+    `multiprocessing.Value` and prune against it. Every subtree returns its own best sequence and the result is the
+    cheapest one, ties going to the subtree that comes first in the expansion. The split does not depend on the number
+    of processes or the seed, so without a time limit the same jobs always give the same sequence.
+
+    The `jobsData` dictionary should be structured as follows:
+    {
+        "Job1": {"processingtime": 5, "duedate": 10, "weight": 2},
+        "Job2": {"processingtime": 4, "duedate": 8, "weight": 1},
+        "Job3": {"processingtime": 6, "duedate": 12, "weight": 3}
+    }
+
+    Example usage:
+    schedule = weightedTardinessSolver(jobsData, timeLimit=10)
+    schedule.details["optimal"]
+    """
+    deadline = None if timeLimit is None else time.perf_counter() + timeLimit
+    jobs = asJobSet(jobsData, "dueDate")
+    weights = jobs.weight if jobs.weight is not None else np.ones(len(jobs))
+    search = _BranchAndBound(jobs.processingTime, jobs.dueDate, weights, maxNodes, deadline)
+    search.seed(*_initialSequence(jobs, weights, deadline))
+    remainingTime = None if deadline is None else deadline - time.perf_counter()
+    with phase("search"):
+        if processes == 1:
+            optimal = search.run(remainingTime)
+        else:
+            optimal = _parallelSearch(search, jobs.processingTime, jobs.dueDate, weights, maxNodes, remainingTime,
+                                      processes or os.cpu_count() or 1, tasks, seed)
+    count("wt.nodes", search.nodes)
+    with phase("objective"):
+        return Schedule.fromSequence(search.incumbent, jobs.processingTime, jobs.ids, search.incumbentCost, "sum wjTj",
+                                     dueDates=jobs.dueDate, details={"optimal": optimal, "nodes": search.nodes})
+
+
+def _initialSequence(jobs, weights, deadline=None):
+    # The better of the EDD and WSPT sequences, improved by moving single jobs while that helps, until the deadline
+    with phase("sort"):
+        sequences = np.array([np.argsort(jobs.dueDate, kind="stable"),
+                              np.argsort(-weights / jobs.processingTime, kind="stable")])
+    jobs = JobSet(jobs.processingTime, dueDate=jobs.dueDate, weight=weights)
+    costs = evaluate(jobs, sequences, objectives=["sum wjTj"])["sum wjTj"]
+    best = int(np.argmin(costs))
+    sequence, cost = sequences[best], costs[best]
+    n = len(jobs)
+    if n < 2:
+        return sequence.tolist(), cost.item()
+    # Every pass scores the n(n - 1) moves a job at a time, so it holds (n, n) arrays and not (n^2, n)
+    for _ in range(n):
+        bestNeighbour, bestCost = None, cost
+        for a in range(n):
+            if deadline is not None and time.perf_counter() > deadline:
+                return sequence.tolist(), cost.item()
+            neighbours = sequence[_insertionMoves(n, a)]
+            costs = evaluate(jobs, neighbours, objectives=["sum wjTj"])["sum wjTj"]
+            k = int(np.argmin(costs))
+            if costs[k] < bestCost:
+                bestNeighbour, bestCost = neighbours[k], costs[k]
+        if bestNeighbour is None:
+            break
+        sequence, cost = bestNeighbour, bestCost
+    return sequence.tolist(), cost.item()
+
+
+def _insertionMoves(n, a):
+    # Row b takes the job at position a out and puts it back at position b, for every b != a
+    b = np.delete(np.arange(n), a)[:, None]
+    k = np.arange(n)
+    moves = k + ((a < b) & (k >= a) & (k < b)) - ((a > b) & (k > b) & (k <= a))
+    moves[np.arange(n - 1), b[:, 0]] = a
+    return moves
+
+
+class _TimeUp(Exception):
+    pass
+
+
+class _BranchAndBound:
+    """
+    Depth-first backward branch-and-bound for 1||sum wjTj on Python ints; a set of jobs is a bitmask.
+    """
+
+    def __init__(self, processingTimes, dueDates, weights, maxNodes, deadline=None):
+        self.p = processingTimes.tolist()
+        self.d = dueDates.tolist()
+        self.w = weights.tolist()
+        self.n = n = len(self.p)
+        self.all = (1 << n) - 1
+        self.total = sum(self.p)
+        # (bit, ...) tuples in SPT, EDD and WSPT order, for the lower bound
+        self.sptItems = [(1 << j, self.p[j]) for j in np.argsort(processingTimes, kind="stable").tolist()]
+        self.eddItems = [(1 << j, self.d[j]) for j in np.argsort(dueDates, kind="stable").tolist()]
+        self.weightItems = [(1 << j, self.w[j]) for j in range(n)]
+        self.wsptItems = [(1 << j, self.p[j], self.w[j], self.d[j])
+                          for j in np.argsort(-weights / processingTimes, kind="stable").tolist()]
+        self.successors = _dominance(self.p, self.d, self.w, deadline)
+        self.maxNodes = maxNodes
+        self.memo = {}
+        self.nodes = 0
+        # Partial schedules that cannot get below upperBound are pruned; it is the incumbent cost here
+        self.upperBound = self.incumbentCost = float("inf")
+        self.incumbent = None
+        self.deadline = None
+
+    def seed(self, sequence, cost):
+        if cost < self.incumbentCost:
+            self.upperBound = self.incumbentCost = cost
+            self.incumbent = list(sequence)
+
+    def run(self, timeLimit=None, remaining=None, cost=0, tail=()):
+        """
+        Search the completions of a partial schedule: the `tail` jobs (in processing order) end the schedule and cost
+        `cost`; the `remaining` jobs come before them. Return True when the search finished within the time limit.
+        """
+        self.deadline = None if timeLimit is None else time.perf_counter() + timeLimit
+        remaining = self.all if remaining is None else remaining
+        total = sum(self.p[j] for j in range(self.n) if remaining >> j & 1)
+        try:
+            self._branch(remaining, total, cost, list(reversed(tail)), tail[0] if tail else -1)
+        except _TimeUp:
+            return False
+        return True
+
+    def lowerBound(self, remaining):
+        # The larger of two bounds on the remaining jobs, processed from time 0:
+        #   - the smallest weight times sum max(0, C_k - d_k), with the SPT completion times and the EDD due dates;
+        #   - sum wj(Cj - dj) in the WSPT order, since Tj >= Cj - dj and WSPT minimizes sum wjCj.
+        completionTimes = accumulate([p for bit, p in self.sptItems if remaining & bit])
+        dueDates = [d for bit, d in self.eddItems if remaining & bit]
+        bound = sum([end - due for end, due in zip(completionTimes, dueDates) if end > due])
+        if bound:
+            bound *= min([w for bit, w in self.weightItems if remaining & bit])
+        wsptJobs = [item for item in self.wsptItems if remaining & item[0]]
+        wsptCompletionTimes = accumulate([item[1] for item in wsptJobs])
+        lateness = sum([w * (end - d) for end, (bit, p, w, d) in zip(wsptCompletionTimes, wsptJobs)])
+        return max(bound, lateness)
+
+    def _improve(self, cost, reversedTail):
+        self.upperBound = self.incumbentCost = cost
+        self.incumbent = reversedTail[::-1]
+
+    def _checkpoint(self):
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise _TimeUp
+
+    def _branch(self, remaining, total, cost, reversedTail, after):
+        # reversedTail lists the scheduled jobs from last to first; `after` is the job right after the remaining ones
+        self.nodes += 1
+        if self.nodes & 63 == 0:
+            self._checkpoint()
+        if not remaining:
+            if cost < self.upperBound:
+                self._improve(cost, reversedTail)
+            return
+        known = self.memo.get(remaining)
+        if known is not None and known <= cost:
+            return
+        if len(self.memo) >= self.maxNodes:
+            self.memo.clear()
+        self.memo[remaining] = cost
+        if cost + self.lowerBound(remaining) >= self.upperBound:
+            return
+
+        for jobCost, j in self.children(remaining, total, after):
+            if cost + jobCost >= self.upperBound:
+                break
+            reversedTail.append(j)
+            self._branch(remaining & ~(1 << j), total - self.p[j], cost + jobCost, reversedTail, j)
+            reversedTail.pop()
+
+    def children(self, remaining, total, after):
+        """
+        Return the (cost, job) pairs of the jobs worth putting last among the remaining ones, cheapest first.
+        """
+        p, d, w, successors = self.p, self.d, self.w, self.successors
+        if after >= 0:
+            pAfter, dAfter, wAfter = p[after], d[after], w[after]
+            afterCost = wAfter * max(0, total + pAfter - dAfter)
+        candidates = []
+        for j in range(self.n):
+            if remaining >> j & 1 and not successors[j] & remaining:
+                if d[j] >= total:
+                    # Not late in the last position: there is an optimal schedule with j there
+                    return [(0, j)]
+                jobCost = w[j] * (total - d[j])
+                # Skip j when putting the next job before it instead would be strictly cheaper
+                if after >= 0 and (wAfter * max(0, total - p[j] + pAfter - dAfter)
+                                   + w[j] * max(0, total + pAfter - d[j]) < jobCost + afterCost):
+                    continue
+                candidates.append((jobCost, j))
+        candidates.sort()
+        return candidates
+
+
+class _SharedBranchAndBound(_BranchAndBound):
+    """
+    The search of one worker process: it prunes against the best cost found by any worker, kept in a shared Value,
+    but only prunes partial schedules that are strictly worse, so each subtree still finds its own best sequence
+    when that ties with another subtree.
+    """
+
+    def __init__(self, processingTimes, dueDates, weights, maxNodes, shared, deadline=None):
+        super().__init__(processingTimes, dueDates, weights, maxNodes, deadline)
+        self.shared = shared
+
+    def startTask(self):
+        # Every subtree starts from scratch, so its result does not depend on which subtrees ran before it
+        self.memo.clear()
+        self.incumbentCost = float("inf")
+        self.incumbent = None
+        self.nodes = 0
+        self._sync()
+
+    def _sync(self):
+        self.upperBound = min(self.incumbentCost, float(np.nextafter(self.shared.value, np.inf)))
+
+    def _checkpoint(self):
+        super()._checkpoint()
+        self._sync()
+
+    def _improve(self, cost, reversedTail):
+        super()._improve(cost, reversedTail)
+        with self.shared.get_lock():
+            if cost < self.shared.value:
+                self.shared.value = cost
+        self._sync()
+
+
+# The search of the current worker process and the deadline of the run
+_worker = {}
+
+
+def _parallelSearch(search, processingTimes, dueDates, weights, maxNodes, timeLimit, processes, tasks, seed):
+    # Returns True when every subtree was searched completely; the best sequence ends up in `search`
+    deadline = None if timeLimit is None else time.monotonic() + timeLimit
+    subtrees = _split(search, tasks)
+    if not subtrees:
+        return True
+    bounds = np.array([cost + search.lowerBound(remaining) for remaining, cost, tail in subtrees], dtype=float)
+    ties = np.random.default_rng(seed).permutation(len(subtrees))
+    order = np.lexsort((ties, bounds)).tolist()
+
+    shared = Value("d", search.incumbentCost)
+    best = (search.incumbentCost, -1, search.incumbent)
+    finished = True
+    with Pool(processes, initializer=_attachSearch,
+              initargs=(processingTimes, dueDates, weights, maxNodes, shared, deadline)) as pool:
+        for index, cost, sequence, done, nodes in pool.imap_unordered(_searchSubtree,
+                                                                      [(k,) + subtrees[k] for k in order]):
+            search.nodes += nodes
+            finished = finished and done
+            if sequence is not None and (cost, index) < best[:2]:
+                best = (cost, index, sequence)
+    search.incumbentCost, search.incumbent = best[0], best[2]
+    return finished
+
+
+def _split(search, tasks):
+    # Expand the top of the tree level by level into about `tasks` (remaining, cost, tail) subtrees, in a fixed order
+    frontier = [(search.all, 0, ())]
+    while len(frontier) < tasks and any(remaining for remaining, cost, tail in frontier):
+        expanded = []
+        seen = {}
+        for remaining, cost, tail in frontier:
+            if not remaining:
+                expanded.append((remaining, cost, tail))
+                continue
+            if cost + search.lowerBound(remaining) > search.upperBound:
+                continue
+            total = sum(search.p[j] for j in range(search.n) if remaining >> j & 1)
+            for jobCost, j in search.children(remaining, total, tail[0] if tail else -1):
+                child = remaining & ~(1 << j)
+                if cost + jobCost > search.upperBound:
+                    break
+                if seen.get(child, float("inf")) <= cost + jobCost:
+                    continue
+                seen[child] = cost + jobCost
+                expanded.append((child, cost + jobCost, (j,) + tail))
+        frontier = expanded
+    return frontier
+
+
+def _attachSearch(processingTimes, dueDates, weights, maxNodes, shared, deadline):
+    # The dominance rules are cut short at the deadline too; what they found is a subset of those of the main process
+    dominanceDeadline = None if deadline is None else time.perf_counter() + deadline - time.monotonic()
+    _worker["search"] = _SharedBranchAndBound(processingTimes, dueDates, weights, maxNodes, shared, dominanceDeadline)
+    _worker["deadline"] = deadline
+
+
+def _searchSubtree(task):
+    index, remaining, cost, tail = task
+    search, deadline = _worker["search"], _worker["deadline"]
+    timeLimit = None if deadline is None else deadline - time.monotonic()
+    if timeLimit is not None and timeLimit <= 0:
+        return index, float("inf"), None, False, 0
+    search.startTask()
+    done = search.run(timeLimit, remaining, cost, tail)
+    return index, search.incumbentCost, search.incumbent, done, search.nodes
+
+
+def _dominance(p, d, w, deadline=None):
+    """
+    Return, for every job, a bitmask of the jobs that can be forced after it without losing optimality.
+
+    Past the deadline the relations found so far are returned; they are valid, only fewer.
+    """
+    n = len(p)
+    total = sum(p)
+    successors = [0] * n
+    predecessors = [0] * n
+
+    changed = True
+    while changed:
+        changed = False
+        for j in range(n):
+            if deadline is not None and time.perf_counter() > deadline:
+                return successors
+            predecessorTime = sum(p[k] for k in range(n) if predecessors[j] >> k & 1)
+            # A job that is not late in the last position can go last
+            last = not successors[j] and d[j] >= total
+            for i in range(n):
+                if i == j or (successors[i] | predecessors[i]) >> j & 1:
+                    continue
+                # i is not longer, not lighter and due before j can finish
+                if last or (p[i] <= p[j] and w[i] >= w[j] and d[i] <= max(d[j], predecessorTime + p[j])):
+                    _precede(i, j, successors, predecessors)
+                    changed = True
+                    predecessorTime = sum(p[k] for k in range(n) if predecessors[j] >> k & 1)
+    return successors
+
+
+def _precede(i, j, successors, predecessors):
+    # Add i -> j to the bitmasks, with everything it implies transitively
+    before = predecessors[i] | (1 << i)
+    afterwards = successors[j] | (1 << j)
+    for k in range(len(successors)):
+        if before >> k & 1:
+            successors[k] |= afterwards
+        if afterwards >> k & 1:
+            predecessors[k] |= before
@@ -0,0 +1,49 @@
+import os
+import sys
+from functools import lru_cache
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+# Test the working tree rather than whatever version is installed
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from SequencingSolver.jobset import JobSet  # noqa: E402
+
+
+@lru_cache(maxsize=None)
+def _permutations(n):
+    sequences = np.array(list(permutations(range(n))), dtype=np.intp).reshape(-1, n)
+    sequences.flags.writeable = False
+    return sequences
+
+
+@pytest.fixture
+def bruteForce():
+    """
+    Return `bruteForce(n, cost)`: the lowest `cost(sequences)` over every permutation of n jobs, where cost maps an
+    array with one sequence per row to one value per row.
+    """
+    def best(n, cost):
+        return cost(_permutations(n)).min()
+
+    return best
+
+
+@pytest.fixture
+def randomJobs():
+    """
+    Return `randomJobs(rng, n, tightness=0.5, weights=True, releaseDates=False)`: a JobSet with processing times in
+    1..9 and due dates up to `tightness` times the total processing time.
+    """
+    def generate(rng, n, tightness=0.5, weights=True, releaseDates=False):
+        p = rng.integers(1, 10, n)
+        total = int(p.sum())
+        return JobSet(p, dueDate=rng.integers(0, max(1, int(total * tightness)) + 1, n),
+                      weight=rng.integers(1, 6, n) if weights else None,
+                      releaseDate=rng.integers(0, total, n) if releaseDates else None)
+
+    return generate
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.LCL import lawler, lclSolver
+from SequencingSolver.costs import WeightedTardiness
+
+
+def randomEdges(rng, n, density=0.3):
+    # Edges only go from a lower to a higher position of a random order, so the graph has no cycle
+    order = rng.permutation(n)
+    pairs = [(order[a], order[b]) for a in range(n) for b in range(a + 1, n) if rng.random() < density]
+    return np.array(pairs, dtype=np.intp).reshape(-1, 2)
+
+
+def hmax(cost, processingTimes, edges):
+    # Sequences that break a precedence constraint cost infinity
+    def evaluate(sequences):
+        positions = np.argsort(sequences, axis=1)
+        feasible = np.all(positions[:, edges[:, 0]] < positions[:, edges[:, 1]], axis=1)
+        values = cost(np.cumsum(processingTimes[sequences], axis=1), sequences).max(axis=1)
+        return np.where(feasible, values, np.inf)
+
+    return evaluate
+
+
+def checkSequence(sequence, n, edges):
+    assert sorted(sequence.tolist()) == list(range(n))
+    positions = np.argsort(sequence)
+    assert np.all(positions[edges[:, 0]] < positions[edges[:, 1]])
+
+
+def tardiness(remainingJobs, jobsData, jobId):
+    # An hFunction of the dictionary interface: the job completes when every unscheduled job is done
+    completionTime = sum(jobsData[key]["processingtime"] for key in remainingJobs)
+    return max(0, completionTime - jobsData[jobId]["duedate"])
+
+
+@pytest.mark.parametrize("seed", range(6))
+def testPlainCostMatchesBruteForce(seed, bruteForce, randomJobs):
+    rng = np.random.default_rng(seed)
+    for n in range(1, 8):
+        jobs = randomJobs(rng, n)
+        edges = randomEdges(rng, n)
+
+        def cost(completionTime, jobIndices):
+            return jobs.weight[jobIndices] * np.maximum(completionTime - jobs.dueDate[jobIndices], 0)
+
+        schedule = lclSolver(jobs, successors=edges, cost=cost)
+        checkSequence(schedule.sequence, n, edges)
+        assert schedule.objective == bruteForce(n, hmax(cost, jobs.processingTime, edges))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def testHeapPathMatchesScanPath(seed, randomJobs):
+    # With a priority array the jobs come from a heap; the result must be as good as scanning every candidate
+    rng = np.random.default_rng(seed)
+    for n in range(1, 30):
+        jobs = randomJobs(rng, n, weights=False)
+        edges = randomEdges(rng, n, density=0.1)
+
+        def cost(completionTime, jobIndices):
+            return completionTime - jobs.dueDate[jobIndices]
+
+        scanSequence, hValues = lawler(jobs.processingTime, edges, cost)
+        cost.priority = -jobs.dueDate
+        heapSequence, noValues = lawler(jobs.processingTime, edges, cost)
+        assert noValues is None
+        checkSequence(heapSequence, n, edges)
+        heapCompletion = np.cumsum(jobs.processingTime[heapSequence])
+        assert (heapCompletion - jobs.dueDate[heapSequence]).max() == max(hValues)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def testLegacyHFunctionMatchesCostSpec(seed, bruteForce, randomJobs):
+    rng = np.random.default_rng(seed)
+    for n in range(1, 7):
+        jobs = randomJobs(rng, n, weights=False)
+        edges = randomEdges(rng, n)
+        ids = [f"J{j}" for j in range(n)]
+        jobsData = {ids[j]: {"processingtime": int(jobs.processingTime[j]), "duedate": int(jobs.dueDate[j]),
+                             "successors": {ids[b] for a, b in edges.tolist() if a == j}, "hFunction": tardiness}
+                    for j in range(n)}
+        schedule = lclSolver(jobsData)
+        checkSequence(schedule.sequence, n, edges)
+        cost = WeightedTardiness().bind(jobs)
+        assert schedule.objective == bruteForce(n, hmax(cost, jobs.processingTime, edges))
+        assert schedule.objective == lclSolver(jobs, successors=edges, cost=WeightedTardiness()).objective
+
+
+def testCycleRaises():
+    with pytest.raises(ValueError, match="cycle"):
+        lawler(np.array([1, 2, 3]), np.array([[0, 1], [1, 2], [2, 0]]), lambda completionTime, jobs: jobs)
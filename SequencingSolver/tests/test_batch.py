@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.EDD import EDDsolver
+from SequencingSolver.WDSPT import wdsptSolver
+from SequencingSolver.WSPT import wsptSolver
+from SequencingSolver.batch import batchSolve
+from SequencingSolver.jobset import JobSet
+
+
+def randomBatch(rng, instances=40, width=12):
+    lengths = rng.integers(0, width + 1, instances)
+    processingTimes = rng.integers(1, 10, (instances, width))
+    dueDates = rng.integers(0, 60, (instances, width))
+    weights = rng.integers(1, 6, (instances, width))
+    return processingTimes, lengths, dueDates, weights
+
+
+@pytest.mark.parametrize("rule", ["edd", "wspt", "wdspt"])
+def testMatchesSingleInstanceSolvers(rule):
+    processingTimes, lengths, dueDates, weights = randomBatch(np.random.default_rng(0))
+    result = batchSolve(processingTimes, rule, lengths=lengths, dueDates=dueDates, weights=weights, r=0.05)
+    for i, n in enumerate(lengths.tolist()):
+        assert np.all(result.sequences[i, n:] == -1)
+        if n == 0:
+            continue
+        jobs = JobSet(processingTimes[i, :n], dueDate=dueDates[i, :n], weight=weights[i, :n])
+        if rule == "edd":
+            expected = EDDsolver(jobs)
+        elif rule == "wspt":
+            expected = wsptSolver(jobs)
+        else:
+            expected = wdsptSolver(jobs, r=0.05)
+        schedule = result.schedule(i)
+        assert np.isclose(schedule.objective, expected.objective)
+        assert np.array_equal(schedule.completionTimes, np.cumsum(processingTimes[i, schedule.sequence]))
+        assert sorted(schedule.sequence.tolist()) == list(range(n))
+
+
+def testMissingInputsRaise():
+    with pytest.raises(ValueError, match="dueDates"):
+        batchSolve([[1, 2]], "edd")
+    with pytest.raises(ValueError, match="lengths"):
+        batchSolve([[1, 2]], "wspt", lengths=[3], weights=[[1, 1]])
+    with pytest.raises(ValueError, match="rule"):
+        batchSolve([[1, 2]], "spt")
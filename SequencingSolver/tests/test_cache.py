@@ -0,0 +1,55 @@
+import functools
+
+import numpy as np
+import pytest
+
+from SequencingSolver.EDD import EDDsolver
+from SequencingSolver.WDSPT import wdsptSolver
+from SequencingSolver.cache import ResultCache, resultKey
+from SequencingSolver.costs import WeightedTardiness
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.parallelMachines import lptSolver
+
+JOBS = JobSet([5, 4, 6], dueDate=[10, 8, 12], weight=[1, 2, 3])
+
+
+def testMemoryHits():
+    cache = ResultCache(maxEntries=1)
+    first = cache.solve(EDDsolver, JOBS)
+    second = cache.solve(EDDsolver, JobSet([5, 4, 6], dueDate=[10, 8, 12], weight=[1, 2, 3], ids=["a", "b", "c"]))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert np.array_equal(first.sequence, second.sequence)
+    assert second.orderedIds().tolist() == ["b", "a", "c"]
+    with pytest.raises(ValueError):
+        second.sequence[0] = 0
+    cache.solve(wdsptSolver, JOBS, r=0.1)
+    cache.solve(wdsptSolver, JOBS, r=0.2)
+    assert (cache.misses, cache.evictions, len(cache)) == (3, 2, 1)
+
+
+def testDiskHits(tmp_path):
+    expected = lptSolver(JOBS, machines=2)
+    ResultCache(directory=tmp_path).solve(lptSolver, JOBS, machines=2)
+    cache = ResultCache(directory=tmp_path)
+    schedule = cache.solve(lptSolver, JOBS, machines=2)
+    assert cache.diskHits == 1 and cache.misses == 0
+    assert schedule.objective == expected.objective
+    assert [part.tolist() for part in schedule.details["sequences"]] == \
+        [part.tolist() for part in expected.details["sequences"]]
+    cache.clear(disk=True)
+    cache.solve(lptSolver, JOBS, machines=2)
+    assert cache.misses == 1
+
+
+def testFunctionKeys():
+    assert resultKey(wdsptSolver, JOBS, {"r": 0.1}) != resultKey(wdsptSolver, JOBS, {"r": 0.2})
+    assert resultKey(EDDsolver, JOBS, {"cost": WeightedTardiness()}) != \
+        resultKey(EDDsolver, JOBS, {"cost": WeightedTardiness(weighted=False)})
+    partial = functools.partial(wdsptSolver, r=0.1)
+    assert resultKey(partial, JOBS) == resultKey(functools.partial(wdsptSolver, r=0.1), JOBS)
+    assert resultKey(partial, JOBS) != resultKey(functools.partial(wdsptSolver, r=0.2), JOBS)
+    # Lambdas and closures have no name to look them up by, so two of them could share a key
+    with pytest.raises(ValueError, match="module-level"):
+        resultKey(lambda jobsData: EDDsolver(jobsData), JOBS)
+    with pytest.raises(ValueError, match="module-level"):
+        ResultCache().solve(EDDsolver, JOBS, hook=lambda: None)
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.LCL import lclSolver
+from SequencingSolver.costs import ExponentialPenalty, Lateness, PiecewiseLinear, WeightedTardiness
+from SequencingSolver.jobset import JobSet
+
+SPECS = [Lateness(), Lateness(weighted=False), WeightedTardiness(), WeightedTardiness(weighted=False),
+         PiecewiseLinear(breakpoints=[0, 5], slopes=[1, 3]), ExponentialPenalty(rate=0.1)]
+
+
+def testPenalties():
+    jobs = JobSet([1, 1], dueDate=[4, 10], weight=[2, 3])
+    completionTimes = np.array([7.0, 7.0])
+    indices = np.array([0, 1])
+    assert np.allclose(Lateness().bind(jobs)(completionTimes, indices), [6, -9])
+    assert np.allclose(WeightedTardiness().bind(jobs)(completionTimes, indices), [6, 0])
+    assert np.allclose(PiecewiseLinear([0, 2], [1, 3]).bind(jobs)(completionTimes, indices), [2 * (3 + 3), 0])
+    assert np.allclose(ExponentialPenalty(0.5).bind(jobs)(completionTimes, indices), [2 * np.expm1(1.5), 0])
+
+
+def testPriorityOnlyWithoutWeights():
+    unweighted = JobSet([1, 2], dueDate=[4, 10])
+    assert np.array_equal(Lateness().bind(unweighted).priority, [-4, -10])
+    # Equal weights scale every cost alike, so the heap still applies
+    assert hasattr(Lateness().bind(JobSet([1, 2], dueDate=[4, 10], weight=[3, 3])), "priority")
+    assert not hasattr(Lateness().bind(JobSet([1, 2], dueDate=[4, 10], weight=[1, 3])), "priority")
+
+
+def testPiecewiseLinearValidatesShapes():
+    with pytest.raises(ValueError):
+        PiecewiseLinear(breakpoints=[0, 1], slopes=[1])
+
+
+@pytest.mark.parametrize("spec", SPECS, ids=repr)
+def testSpecsMatchBruteForce(spec, bruteForce, randomJobs):
+    rng = np.random.default_rng(17)
+    for n in range(1, 8):
+        jobs = randomJobs(rng, n)
+        cost = spec.bind(jobs)
+        schedule = lclSolver(jobs, cost=spec)
+        optimum = bruteForce(n, lambda sequences: cost(np.cumsum(jobs.processingTime[sequences], axis=1),
+                                                       sequences).max(axis=1))
+        assert np.isclose(schedule.objective, optimum)
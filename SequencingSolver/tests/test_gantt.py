@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from SequencingSolver.WSPT import wsptSolver
+from SequencingSolver.gantt import ganttIntervals, saveSchedule
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.releaseDates import preemptiveEDDsolver
+
+JOBS = JobSet([3, 1, 2, 4], dueDate=[9, 2, 4, 6], weight=[1, 3, 2, 2], releaseDate=[0, 2, 2, 0])
+
+
+def testIntervals():
+    schedule = wsptSolver(JOBS)
+    bars = ganttIntervals(schedule)
+    assert bars["job"].tolist() == schedule.sequence.tolist()
+    assert bars["end"].tolist() == schedule.completionTimes.tolist()
+    merged = ganttIntervals(schedule, maxBars=2)
+    assert merged["row"].tolist() == [0, 1] and merged["job"].tolist() == [-1, -1]
+    assert merged["start"].tolist() == [0, schedule.startTimes[2]] and merged["end"][-1] == 10
+
+
+def testPreemptedJobsHaveOneBarPerPiece():
+    schedule = preemptiveEDDsolver(JOBS)
+    bars = ganttIntervals(schedule)
+    assert len(bars) == len(schedule.details["segments"])
+    assert np.array_equal(np.bincount(bars["job"], weights=bars["end"] - bars["start"]), JOBS.processingTime)
+
+
+def testExportDoesNotImportPyplot():
+    code = ("import sys\n"
+            "from SequencingSolver.WSPT import wsptSolver\n"
+            "schedule = wsptSolver({'a': {'processingtime': 2, 'weight': 1}, 'b': {'processingtime': 1, 'weight': 1}})\n"
+            "assert schedule.save()[:4] == b'\\x89PNG'\n"
+            "schedule.plot(show=False)\n"
+            "assert 'matplotlib.pyplot' not in sys.modules\n")
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", code], check=True, env=environment)
+
+
+def testSaveFormats(tmp_path):
+    schedule = wsptSolver(JOBS)
+    assert saveSchedule(schedule, format="svg").lstrip().startswith(b"<?xml")
+    saveSchedule(schedule, tmp_path / "chart.pdf")
+    assert (tmp_path / "chart.pdf").read_bytes()[:4] == b"%PDF"
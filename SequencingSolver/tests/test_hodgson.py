@@ -0,0 +1,37 @@
+from math import factorial
+
+import numpy as np
+import pytest
+
+from SequencingSolver.hodgson import hodgsonAlternatives, hodgsonSolver, mooreHodgson
+
+
+def lateJobs(jobs):
+    def cost(sequences):
+        return (np.cumsum(jobs.processingTime[sequences], axis=1) > jobs.dueDate[sequences]).sum(axis=1)
+
+    return cost
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("tightness", [0.3, 0.7])
+def testMatchesBruteForce(seed, tightness, bruteForce, randomJobs):
+    rng = np.random.default_rng(seed)
+    for n in range(1, 9):
+        jobs = randomJobs(rng, n, tightness, weights=False)
+        onTimeJobs, late = mooreHodgson(jobs.processingTime, jobs.dueDate)
+        assert sorted(onTimeJobs.tolist() + late.tolist()) == list(range(n))
+        assert np.all(np.cumsum(jobs.processingTime[onTimeJobs]) <= jobs.dueDate[onTimeJobs])
+        schedule = hodgsonSolver(jobs)
+        assert schedule.objective == len(late) == bruteForce(n, lateJobs(jobs))
+        assert np.count_nonzero(schedule.tardiness) == schedule.objective
+
+
+def testAlternativesKeepTheObjective(randomJobs):
+    jobs = randomJobs(np.random.default_rng(1), 10, tightness=0.3, weights=False)
+    objective = hodgsonSolver(jobs).objective
+    alternatives = list(hodgsonAlternatives(jobs, unique=False))
+    assert len(alternatives) == factorial(objective)
+    for sequence in alternatives:
+        completionTimes = np.cumsum(jobs.processingTime[sequence])
+        assert np.count_nonzero(completionTimes > jobs.dueDate[sequence]) == objective
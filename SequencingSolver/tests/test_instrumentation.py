@@ -0,0 +1,46 @@
+import io
+
+import numpy as np
+
+from SequencingSolver import instrumentation
+from SequencingSolver.EDD import EDDsolver
+from SequencingSolver.LCL import lclSolver
+from SequencingSolver.cache import ResultCache
+from SequencingSolver.costs import WeightedTardiness
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.loaders import readNpy, writeNpy
+from SequencingSolver.releaseDates import carlierSolver
+from SequencingSolver.weightedTardiness import weightedTardinessSolver
+
+
+def testReportedNamesAreDocumented(tmp_path):
+    rng = np.random.default_rng(0)
+    jobs = JobSet(rng.integers(1, 10, 12), dueDate=rng.integers(0, 60, 12), weight=rng.integers(1, 6, 12),
+                  releaseDate=rng.integers(0, 40, 12))
+    histogram = instrumentation.enable()
+    try:
+        cache = ResultCache(directory=tmp_path / "cache")
+        cache.solve(EDDsolver, jobs)
+        cache.solve(EDDsolver, jobs)
+        ResultCache(directory=tmp_path / "cache").solve(EDDsolver, jobs)
+        lclSolver(jobs, cost=WeightedTardiness())
+        weightedTardinessSolver(jobs)
+        carlierSolver(jobs)
+        writeNpy(jobs, tmp_path / "jobs.npy")
+        readNpy(tmp_path / "jobs.npy")
+        EDDsolver(jobs).save(io.BytesIO(), format="png")
+    finally:
+        instrumentation.disable()
+    snapshot = histogram.snapshot()
+    assert set(snapshot["phases"]) == set(instrumentation.PHASES)
+    assert set(snapshot["counters"]) == set(instrumentation.COUNTERS)
+    assert snapshot["counters"]["jobs"] >= 12
+    assert snapshot["phases"]["sort"]["count"] == sum(snapshot["phases"]["sort"]["buckets"].values())
+
+
+def testDisabledReportsNothing():
+    calls = []
+    instrumentation.enable(lambda *report: calls.append(report))
+    instrumentation.disable()
+    EDDsolver(JobSet([1, 2], dueDate=[2, 1]))
+    assert calls == []
@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.EDD import EDDsolver
+from SequencingSolver.WSPT import wsptSolver
+
+
+def testOptionalFieldOnSomeJobsIsIgnored():
+    jobsData = {"a": {"processingtime": 2, "duedate": 3, "weight": 1}, "b": {"processingtime": 1, "duedate": 1}}
+    schedule = EDDsolver(jobsData)
+    assert schedule.orderedIds().tolist() == ["b", "a"]
+    assert np.array_equal(schedule.completionTimes, [1, 3])
+
+
+def testRequiredFieldOnSomeJobsRaises():
+    jobsData = {"a": {"processingtime": 2, "weight": 1}, "b": {"processingtime": 1}}
+    with pytest.raises(ValueError, match="b"):
+        wsptSolver(jobsData)
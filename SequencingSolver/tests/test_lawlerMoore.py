@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.lawlerMoore import lawlerMoore, lawlerMooreSolver
+
+
+def weightedLateJobs(p, d, w):
+    def cost(sequences):
+        return (w[sequences] * (np.cumsum(p[sequences], axis=1) > d[sequences])).sum(axis=1)
+
+    return cost
+
+
+def checkSplit(p, d, w, onTimeJobs, lateJobs, bruteForce):
+    assert sorted(onTimeJobs.tolist() + lateJobs.tolist()) == list(range(len(p)))
+    assert np.all(np.cumsum(p[onTimeJobs]) <= d[onTimeJobs])
+    assert w[lateJobs].sum() == bruteForce(len(p), weightedLateJobs(p, d, w))
+
+
+@pytest.mark.parametrize("seed", range(6))
+def testMatchesBruteForce(seed, bruteForce):
+    # Zero processing times, zero weights and negative due dates included
+    rng = np.random.default_rng(seed)
+    for n in range(1, 8):
+        for _ in range(5):
+            p = rng.integers(0, 10, n)
+            d = rng.integers(-2, p.sum() + 2, n)
+            w = rng.integers(0, 8, n)
+            onTimeJobs, lateJobs = lawlerMoore(p, d, w)
+            checkSplit(p, d, w, onTimeJobs, lateJobs, bruteForce)
+
+
+def testSolverMatchesBruteForce(bruteForce, randomJobs):
+    rng = np.random.default_rng(42)
+    for n in range(1, 9):
+        jobs = randomJobs(rng, n, tightness=0.7)
+        schedule = lawlerMooreSolver(jobs)
+        p, d, w = jobs.processingTime, jobs.dueDate, jobs.weight
+        assert schedule.objective == bruteForce(n, weightedLateJobs(p, d, w))
+        checkSplit(p, d, w, schedule.details["onTime"], schedule.details["late"], bruteForce)
+
+
+def testRejectsFractionalProcessingTimes():
+    with pytest.raises(ValueError):
+        lawlerMooreSolver(JobSet([1.5, 2.0], dueDate=[3, 4], weight=[1, 2]))
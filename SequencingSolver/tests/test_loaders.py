@@ -0,0 +1,67 @@
+import csv
+
+import numpy as np
+import pytest
+
+from SequencingSolver.EDD import EDDsolver
+from SequencingSolver.batch import batchSolve
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.loaders import SEQUENCE_DTYPE, SequenceWriter, readCsv, readNpy, writeNpy
+
+JOBS = JobSet([5, 4, 6], dueDate=[10, 8, 12], weight=[1.5, 2, 3], ids=["a,1", 'b "2"', "c"])
+
+
+def testCsvRoundTrip(tmp_path):
+    path = tmp_path / "jobs.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Job", "ProcessingTime", "DueDate", "Weight", "Comment"])
+        writer.writerows(zip(JOBS.ids, JOBS.processingTime, JOBS.dueDate, JOBS.weight, ["x", "y", "z"]))
+    for chunkSize in (1, 2, 10):
+        jobs = readCsv(path, idColumn="Job", chunkSize=chunkSize)
+        assert jobs.ids.tolist() == JOBS.ids.tolist()
+        assert jobs.processingTime.dtype == np.int64 and jobs.processingTime.tolist() == [5, 4, 6]
+        assert jobs.weight.tolist() == [1.5, 2, 3]
+    assert readCsv(path).ids.tolist() == [1, 2, 3]
+
+
+def testCsvReportsBadRows(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text("processingtime,duedate\n1,2\nx,3\n")
+    with pytest.raises(ValueError, match="rows 1 to 2"):
+        readCsv(path, chunkSize=2)
+
+
+def testNpyRoundTrip(tmp_path):
+    writeNpy(JOBS, tmp_path / "jobs")
+    jobs = readNpy(tmp_path / "jobs")
+    # The columns are views of the memory maps, not copies
+    assert not jobs.processingTime.flags.owndata
+    assert jobs.ids.tolist() == JOBS.ids.tolist()
+    assert np.array_equal(jobs.dueDate, JOBS.dueDate)
+
+
+def testSequenceWriterCsvQuotesIds(tmp_path):
+    schedule = EDDsolver(JOBS)
+    with SequenceWriter(tmp_path / "sequences.csv", chunkSize=2) as writer:
+        writer.write(schedule)
+    with open(tmp_path / "sequences.csv", newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["instance", "position", "job", "start", "completion"]
+    assert [row[2] for row in rows[1:]] == schedule.orderedIds().tolist()
+
+
+def testSequenceWriterNpy(tmp_path):
+    path = tmp_path / "sequences.npy"
+    schedule = EDDsolver(JOBS)
+    batch = batchSolve([[5, 4, 6], [3, 2, 0]], "edd", lengths=[3, 2], dueDates=[[10, 8, 12], [4, 3, 0]])
+    with SequenceWriter(path) as writer:
+        writer.write(schedule)
+        writer.write(batch)
+    # The header length is stored little-endian
+    assert path.read_bytes()[8:10] == b"\xf6\x00"
+    records = np.load(path, mmap_mode="r")
+    assert records.dtype == SEQUENCE_DTYPE and len(records) == writer.records == 8
+    assert records["instance"].tolist() == [0, 0, 0, 1, 1, 1, 2, 2]
+    assert records["job"][:3].tolist() == schedule.sequence.tolist()
+    assert records["completion"][3:6].tolist() == batch.completionTimes[0].tolist()
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.minimizeSumCjWithDeadline import minimizeSumCjstDeadline
+
+
+def sumOfCompletionTimes(jobs):
+    # Sequences that miss a deadline cost infinity
+    def cost(sequences):
+        completionTimes = np.cumsum(jobs.processingTime[sequences], axis=1)
+        feasible = np.all(completionTimes <= jobs.deadline[sequences], axis=1)
+        return np.where(feasible, completionTimes.sum(axis=1), np.inf)
+
+    return cost
+
+
+@pytest.mark.parametrize("seed", range(6))
+def testMatchesBruteForce(seed, bruteForce):
+    rng = np.random.default_rng(seed)
+    infeasible = 0
+    for n in range(1, 8):
+        for _ in range(5):
+            p = rng.integers(1, 10, n)
+            jobs = JobSet(p, deadline=rng.integers(p.sum() // 2, p.sum() + 3, n))
+            optimum = bruteForce(n, sumOfCompletionTimes(jobs))
+            if np.isinf(optimum):
+                infeasible += 1
+                with pytest.raises(ValueError, match="infeasible"):
+                    minimizeSumCjstDeadline(jobs)
+                continue
+            schedule = minimizeSumCjstDeadline(jobs)
+            assert np.all(schedule.completionTimes <= jobs.deadline[schedule.sequence])
+            assert schedule.objective == optimum
+    assert infeasible
+
+
+def testInfeasibleInstanceRaises():
+    jobsData = {"a": {"processingtime": 4, "deadline": 3}, "b": {"processingtime": 2, "deadline": 5}}
+    with pytest.raises(ValueError, match="no remaining job has a deadline at or after 6"):
+        minimizeSumCjstDeadline(jobsData)
+
+
+def testWeightedMeetsDeadlines():
+    rng = np.random.default_rng(3)
+    p = rng.integers(1, 10, 50)
+    jobs = JobSet(p, deadline=np.full(50, p.sum()), weight=rng.integers(1, 6, 50))
+    schedule = minimizeSumCjstDeadline(jobs, weighted=True)
+    # Without binding deadlines Smith's ratio rule is WSPT, which is optimal
+    ratios = (jobs.weight / jobs.processingTime)[schedule.sequence]
+    assert np.all(ratios[:-1] >= ratios[1:])
+    assert schedule.objective == (schedule.completionTimes * jobs.weight[schedule.sequence]).sum()
@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from SequencingSolver.WSPT import wsptSolver
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.objectives import evaluate
+
+JOBS = JobSet([3, 1, 2], dueDate=[2, 5, 4], weight=[2, 1, 3])
+
+
+def testHandComputedValues():
+    # Sequence 1, 2, 0 completes at 1, 3, 6 with lateness -4, -1, 4
+    scores = evaluate(JOBS, [1, 2, 0], r=0.1)
+    discounted = 1 * (1 - math.exp(-0.1)) + 3 * (1 - math.exp(-0.3)) + 2 * (1 - math.exp(-0.6))
+    assert scores == pytest.approx({"Cmax": 6, "sum Cj": 10, "sum wjCj": 22, "Lmax": 4, "Tmax": 4, "sum Tj": 4,
+                                    "sum wjTj": 8, "sum Uj": 1, "sum wj(1 - e^(-rCj))": discounted})
+
+
+def testRowsAndSubsets():
+    scores = evaluate(JOBS, [[0, 1, 2], [2, 1, 0]], objectives=["sum wjCj", "Lmax"], chunkSize=1)
+    assert scores["sum wjCj"].tolist() == [2 * 3 + 1 * 4 + 3 * 6, 3 * 2 + 1 * 3 + 2 * 6]
+    assert scores["Lmax"].tolist() == [2, 4]
+    # Only the listed jobs are processed
+    assert evaluate(JOBS, [2], objectives=["Cmax", "Lmax"]) == {"Cmax": 2, "Lmax": -2}
+    assert evaluate(JOBS, np.empty((1, 0), dtype=int), objectives=["Cmax", "Lmax", "Tmax"]) == \
+        {"Cmax": [0], "Lmax": [-np.inf], "Tmax": [0]}
+
+
+def testMatchesSolverObjective():
+    rng = np.random.default_rng(0)
+    jobs = JobSet(rng.integers(1, 10, 100), weight=rng.integers(1, 6, 100))
+    schedule = wsptSolver(jobs)
+    assert evaluate(jobs, schedule.sequence, objectives=[schedule.objectiveName])[schedule.objectiveName] == \
+        schedule.objective
+
+
+def testInvalidRequestsRaise():
+    with pytest.raises(ValueError, match="Unknown objective"):
+        evaluate(JOBS, [0, 1, 2], objectives=["sum Vj"])
+    with pytest.raises(ValueError, match="needs r"):
+        evaluate(JOBS, [0, 1, 2], objectives=["sum wj(1 - e^(-rCj))"])
+    with pytest.raises(ValueError, match="weight"):
+        evaluate(JobSet([1, 2]), [0, 1], objectives=["sum wjCj"])
+    with pytest.raises(ValueError, match="between 0 and 2"):
+        evaluate(JOBS, [0, 3])
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.EDD import EDDsolver
+from SequencingSolver.WSPT import wsptSolver
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.online import OnlineScheduler
+
+
+def randomOperations(rng, scheduler, steps=300):
+    # Yield the jobs the scheduler should hold, in arrival order, after every random insert, remove or reweight
+    jobs = {}
+    for step in range(steps):
+        action = rng.random()
+        if action < 0.5 or not jobs:
+            jobs[step] = [int(rng.integers(1, 10)), int(rng.integers(1, 6)), int(rng.integers(0, 100))]
+            scheduler.insert(step, *jobs[step])
+        elif action < 0.75:
+            jobId = list(jobs)[rng.integers(len(jobs))]
+            del jobs[jobId]
+            scheduler.remove(jobId)
+        else:
+            jobId = list(jobs)[rng.integers(len(jobs))]
+            jobs[jobId][1] = int(rng.integers(1, 6))
+            scheduler.updateWeight(jobId, jobs[jobId][1])
+        yield jobs
+
+
+def asJobs(jobs):
+    p, w, d = np.array(list(jobs.values())).T
+    return JobSet(p, dueDate=d, weight=w, ids=list(jobs))
+
+
+@pytest.mark.parametrize("rule, solver", [("wspt", wsptSolver), ("edd", EDDsolver)])
+def testMatchesOfflineSolver(rule, solver):
+    rng = np.random.default_rng(0)
+    scheduler = OnlineScheduler(rule)
+    for jobs in randomOperations(rng, scheduler):
+        assert len(scheduler) == len(jobs)
+        if not jobs:
+            continue
+        expected = solver(asJobs(jobs))
+        assert scheduler.schedule().jobIds.tolist() == expected.orderedIds().tolist()
+        assert scheduler.makespan == expected.completionTimes[-1]
+        offline = asJobs(jobs)
+        completionTimes = expected.completionTimes
+        assert scheduler.totalWeightedCompletionTime == (offline.weight[expected.sequence] * completionTimes).sum()
+        assert scheduler.maxLateness == (completionTimes - offline.dueDate[expected.sequence]).max()
+        jobId = list(jobs)[-1]
+        position = expected.orderedIds().tolist().index(jobId)
+        assert scheduler.completionTime(jobId) == expected.completionTimes[position]
+
+
+def testUnknownJobsRaise():
+    scheduler = OnlineScheduler()
+    scheduler.insert("a", 3)
+    with pytest.raises(ValueError):
+        scheduler.insert("a", 2)
+    for method in (scheduler.remove, scheduler.completionTime):
+        with pytest.raises(ValueError):
+            method("b")
+    with pytest.raises(ValueError):
+        scheduler.updateWeight("b", 2)
+    with pytest.raises(ValueError):
+        OnlineScheduler("edd").insert("a", 3)
@@ -0,0 +1,56 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from SequencingSolver.jobset import JobSet
+from SequencingSolver.parallelMachines import lptSolver, parallelEDDsolver, parallelWsptSolver
+
+
+def optimalMakespan(processingTimes, machines):
+    # Try every assignment of jobs to machines
+    assignments = np.array(list(product(range(machines), repeat=len(processingTimes))))
+    loads = np.stack([(assignments == machine) @ processingTimes for machine in range(machines)])
+    return loads.max(axis=0).min()
+
+
+def checkMachines(jobs, schedule, machines):
+    # Every machine runs its jobs back to back from time 0 in the order of details["sequences"]
+    sequences = schedule.details["sequences"]
+    assert len(sequences) == machines
+    assert sorted(np.concatenate(sequences).tolist()) == list(range(len(jobs)))
+    position = np.argsort(schedule.sequence)
+    for machine, jobIndices in enumerate(sequences):
+        assert np.all(schedule.details["machine"][position[jobIndices]] == machine)
+        completionTimes = np.cumsum(jobs.processingTime[jobIndices])
+        assert np.array_equal(schedule.completionTimes[position[jobIndices]], completionTimes)
+        assert schedule.details["loads"][machine] == (completionTimes[-1] if len(jobIndices) else 0)
+
+
+@pytest.mark.parametrize("machines", [1, 2, 3])
+def testLptWithinBound(machines):
+    rng = np.random.default_rng(machines)
+    for n in range(1, 9):
+        for _ in range(5):
+            jobs = JobSet(rng.integers(1, 20, n))
+            schedule = lptSolver(jobs, machines)
+            checkMachines(jobs, schedule, machines)
+            optimum = optimalMakespan(jobs.processingTime, machines)
+            assert optimum <= schedule.objective <= (4 / 3 - 1 / (3 * machines)) * optimum
+
+
+def testWsptAndEddObjectives():
+    rng = np.random.default_rng(0)
+    jobs = JobSet(rng.integers(1, 10, 50), dueDate=rng.integers(0, 100, 50), weight=rng.integers(1, 6, 50))
+    schedule = parallelWsptSolver(jobs, 4)
+    checkMachines(jobs, schedule, 4)
+    assert schedule.objective == (schedule.completionTimes * jobs.weight[schedule.sequence]).sum()
+    schedule = parallelEDDsolver(jobs, 4)
+    checkMachines(jobs, schedule, 4)
+    assert schedule.objective == (schedule.completionTimes - jobs.dueDate[schedule.sequence]).max()
+
+
+@pytest.mark.parametrize("machines", [0, 1.5, True])
+def testInvalidMachinesRaise(machines):
+    with pytest.raises(ValueError, match="machines"):
+        lptSolver(JobSet([1, 2]), machines)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.releaseDates import carlierSolver, preemptiveEDDsolver, schrageSolver
+
+
+def maximumLateness(jobs):
+    # Every job starts at its release date at the earliest
+    def cost(sequences):
+        t = np.zeros(len(sequences), dtype=np.int64)
+        lmax = np.full(len(sequences), np.iinfo(np.int64).min)
+        for position in range(sequences.shape[1]):
+            jobsHere = sequences[:, position]
+            t = np.maximum(t, jobs.releaseDate[jobsHere]) + jobs.processingTime[jobsHere]
+            lmax = np.maximum(lmax, t - jobs.dueDate[jobsHere])
+        return lmax
+
+    return cost
+
+
+def checkFeasible(jobs, schedule):
+    sequence = schedule.sequence
+    assert sorted(sequence.tolist()) == list(range(len(jobs)))
+    assert np.all(schedule.startTimes >= jobs.releaseDate[sequence])
+    assert np.all(schedule.startTimes[1:] >= schedule.completionTimes[:-1])
+    assert schedule.objective == (schedule.completionTimes - jobs.dueDate[sequence]).max()
+
+
+@pytest.mark.parametrize("seed", range(6))
+def testCarlierMatchesBruteForce(seed, bruteForce, randomJobs):
+    rng = np.random.default_rng(seed)
+    for n in range(1, 9):
+        jobs = randomJobs(rng, n, tightness=1.5, weights=False, releaseDates=True)
+        optimum = bruteForce(n, maximumLateness(jobs))
+        schedule = carlierSolver(jobs)
+        checkFeasible(jobs, schedule)
+        assert schedule.details["optimal"]
+        assert schedule.objective == optimum
+        # Schrage is feasible but not always optimal; preemption can only help
+        schrage = schrageSolver(jobs)
+        checkFeasible(jobs, schrage)
+        assert schrage.objective >= optimum
+        assert preemptiveEDDsolver(jobs).objective <= optimum
+
+
+def testPreemptiveSegments(randomJobs):
+    rng = np.random.default_rng(5)
+    for n in range(1, 9):
+        jobs = randomJobs(rng, n, weights=False, releaseDates=True)
+        segments = preemptiveEDDsolver(jobs).details["segments"]
+        # Pieces do not overlap, start after the release dates and add up to the processing times
+        assert np.all(segments[1:, 1] >= segments[:-1, 2])
+        assert np.all(segments[:, 1] >= jobs.releaseDate[segments[:, 0]])
+        done = np.bincount(segments[:, 0], weights=segments[:, 2] - segments[:, 1], minlength=n)
+        assert np.array_equal(done, jobs.processingTime)
+
+
+def testCarlierTimeLimitReturnsIncumbent(randomJobs):
+    jobs = randomJobs(np.random.default_rng(9), 40, weights=False, releaseDates=True)
+    schedule = carlierSolver(jobs, timeLimit=0)
+    checkFeasible(jobs, schedule)
+    assert not schedule.details["optimal"]
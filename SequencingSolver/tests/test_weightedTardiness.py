@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from SequencingSolver.weightedTardiness import weightedTardinessSolver
+
+
+def weightedTardiness(jobs):
+    def cost(sequences):
+        completionTimes = np.cumsum(jobs.processingTime[sequences], axis=1)
+        return (jobs.weight[sequences] * np.maximum(completionTimes - jobs.dueDate[sequences], 0)).sum(axis=1)
+
+    return cost
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("tightness", [0.3, 0.6, 1.0])
+def testMatchesBruteForce(seed, tightness, bruteForce, randomJobs):
+    rng = np.random.default_rng(seed)
+    for n in range(1, 9):
+        jobs = randomJobs(rng, n, tightness)
+        schedule = weightedTardinessSolver(jobs)
+        assert schedule.details["optimal"]
+        assert schedule.objective == bruteForce(n, weightedTardiness(jobs))
+        assert schedule.objective == (jobs.weight[schedule.sequence] * schedule.tardiness).sum()
+
+
+def testSmallMemoMatchesBruteForce(bruteForce, randomJobs):
+    # A store that is cleared all the time must only weaken pruning
+    rng = np.random.default_rng(7)
+    for _ in range(20):
+        jobs = randomJobs(rng, 8)
+        assert weightedTardinessSolver(jobs, maxNodes=4).objective == bruteForce(8, weightedTardiness(jobs))
+
+
+def testParallelMatchesSerial(bruteForce, randomJobs):
+    rng = np.random.default_rng(11)
+    for _ in range(3):
+        jobs = randomJobs(rng, 8)
+        serial = weightedTardinessSolver(jobs)
+        parallel = weightedTardinessSolver(jobs, processes=2, tasks=8)
+        assert parallel.objective == serial.objective == bruteForce(8, weightedTardiness(jobs))
+
+
+def testTimeLimitReturnsIncumbent(randomJobs):
+    jobs = randomJobs(np.random.default_rng(3), 150)
+    schedule = weightedTardinessSolver(jobs, timeLimit=0)
+    assert sorted(schedule.sequence.tolist()) == list(range(150))
+    assert schedule.objective == (jobs.weight[schedule.sequence] * schedule.tardiness).sum()